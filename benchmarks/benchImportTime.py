@@ -0,0 +1,55 @@
+"""
+Measures the time of `import veroviz` in fresh Python processes, and fails (exit code 1) if the median is above a budget.
+
+Usage:
+	python benchmarks/benchImportTime.py [budgetSeconds] [repeats]
+"""
+
+import os
+import subprocess
+import sys
+
+VRV_BENCH_IMPORT_BUDGET_SEC = 0.8
+VRV_BENCH_IMPORT_REPEATS = 5
+
+# Heavy or optional packages that should not be imported by `import veroviz`
+lazyModules = ['folium', 'scipy.spatial', 'geopy', 'psycopg2', 'tripy', 'urllib3']
+
+script = """
+import sys, time
+startTime = time.perf_counter()
+import veroviz
+print(time.perf_counter() - startTime)
+print(','.join([m for m in %s if m in sys.modules]))
+""" % (lazyModules)
+
+def benchImportTime(budgetSec=VRV_BENCH_IMPORT_BUDGET_SEC, repeats=VRV_BENCH_IMPORT_REPEATS):
+	repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+	env = dict(os.environ)
+	env['PYTHONPATH'] = repoDir + os.pathsep + env.get('PYTHONPATH', '')
+
+	importTimes = []
+	loadedModules = ''
+	for i in range(repeats):
+		output = subprocess.check_output([sys.executable, '-c', script], env=env).decode('utf-8').splitlines()
+		importTimes.append(float(output[-2]))
+		loadedModules = output[-1]
+
+	importTimes.sort()
+	medianSec = importTimes[len(importTimes) // 2]
+	print("import veroviz: median %.3f s over %d runs (budget %.3f s)" % (medianSec, repeats, budgetSec))
+
+	passed = True
+	if (medianSec > budgetSec):
+		print("FAIL: import time is over budget.")
+		passed = False
+	if (loadedModules != ''):
+		print("FAIL: these modules should be imported lazily: %s" % (loadedModules))
+		passed = False
+
+	return passed
+
+if (__name__ == '__main__'):
+	budgetSec = float(sys.argv[1]) if len(sys.argv) > 1 else VRV_BENCH_IMPORT_BUDGET_SEC
+	repeats = int(sys.argv[2]) if len(sys.argv) > 2 else VRV_BENCH_IMPORT_REPEATS
+	sys.exit(0 if benchImportTime(budgetSec, repeats) else 1)
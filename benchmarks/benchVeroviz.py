@@ -0,0 +1,319 @@
+"""
+Benchmarks for the hot paths of veroviz, on seeded synthetic datasets.  Runs offline (see `fakeProviders.py`), records the time and peak memory of each benchmark in `benchmarks/results/<commit>.json`, and flags regressions against an earlier result file.
+
+Usage:
+	python benchmarks/benchVeroviz.py [--quick] [--filter TEXT] [--repeats N] [--compare RESULTFILE] [--threshold 0.2] [--fail-on-regression]
+
+By default, the results are compared with the most recent earlier result file.  Each benchmark is named '<hot path>[<size>]', where the size is the number of synthetic nodes (100 to 100k).
+"""
+
+import argparse
+import contextlib
+import datetime
+import glob
+import io
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+import numpy as np
+import pandas as pd
+
+repoDir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repoDir)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import veroviz as vrv
+from fakeProviders import installFakeProviders
+
+VRV_BENCH_REPEATS = 3
+VRV_BENCH_REGRESSION_THRESHOLD = 0.2	# 20% slower, or 20% more memory
+VRV_BENCH_MIN_TIME_DIFF_SEC = 0.005		# Ignore differences that are too small to measure
+VRV_BENCH_MIN_MEMORY_DIFF_MB = 1.0
+VRV_BENCH_CENTER = [42.8871, -78.8784]
+VRV_BENCH_STDDEV_METERS = 5000
+VRV_BENCH_SPEED_MPS = 15
+
+resultsDir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+cesiumDir = None
+tempDir = None
+
+# Synthetic datasets ---------------------------------------------------------
+
+datasetCache = {}
+
+def benchNodes(numNodes):
+	if (('nodes', numNodes) not in datasetCache):
+		datasetCache['nodes', numNodes] = vrv.generateNodes(
+			nodeDistrib     = 'normal',
+			nodeDistribArgs = {'center': VRV_BENCH_CENTER, 'stdDev': VRV_BENCH_STDDEV_METERS},
+			numNodes        = numNodes,
+			seed            = numNodes)
+
+	return datasetCache['nodes', numNodes]
+
+def benchLocs(numNodes):
+	return benchNodes(numNodes)[['lat', 'lon']].values.tolist()
+
+def benchAssignments(numNodes):
+	if (('assignments', numNodes) not in datasetCache):
+		nodes = benchNodes(numNodes)
+		datasetCache['assignments', numNodes] = vrv.createAssignmentsFromNodeSeq2D(
+			nodeSeq   = nodes['id'].tolist(),
+			nodes     = nodes,
+			objectID  = 'truck',
+			modelFile = 'veroviz/models/car.gltf',
+			routeType = 'euclidean2D',
+			speedMPS  = VRV_BENCH_SPEED_MPS)
+
+	return datasetCache['assignments', numNodes].copy()
+
+def benchArcs(numNodes):
+	nodes = benchNodes(numNodes)
+
+	return vrv.createArcsFromNodeSeq(nodeSeq=nodes['id'].tolist(), nodes=nodes, objectID='truck')
+
+def benchMixedLabelNodes(numNodes):
+	# A depot labeled with text, added to nodes labeled with their ids, gives object columns with mixed types
+	return vrv.createNodesFromLocs(locs=[VRV_BENCH_CENTER], initNodes=benchNodes(numNodes), leafletIconText='depot', cesiumIconText='depot')
+
+def benchTempDir():
+	global tempDir
+	if (tempDir is None):
+		tempDir = tempfile.mkdtemp(prefix='vrvbench')
+
+	return tempDir
+
+def benchCesiumDir():
+	global cesiumDir
+	if (cesiumDir is None):
+		cesiumDir = tempfile.mkdtemp(prefix='vrvbench')
+		open(os.path.join(cesiumDir, 'server.js'), 'w').close()
+		os.makedirs(os.path.join(cesiumDir, 'veroviz', 'models'))
+		open(os.path.join(cesiumDir, 'veroviz', 'models', 'car.gltf'), 'w').close()
+
+	return cesiumDir
+
+# Benchmarks -----------------------------------------------------------------
+# Each benchmark is (name, sizes, setup, run); `setup(size)` is not timed, and its result is passed to `run()`.
+
+def _pairs(locs):
+	return list(zip(locs[:-1], locs[1:]))
+
+def _exportImportDataframe(nodes, extension):
+	# Fails the benchmark if the file does not give back the same dataframe
+	filename = os.path.join(benchTempDir(), 'nodes%s' % (extension))
+	vrv.exportDataframe(dataframe=nodes, filename=filename)
+	imported = vrv.importDataframe(filename)
+	pd.testing.assert_frame_equal(imported, nodes.reset_index(drop=True) if (extension == '.feather') else nodes)
+
+benchmarks = [
+	('generateNodes', [100, 1000, 10000, 100000],
+		lambda n: n,
+		lambda n: vrv.generateNodes(nodeDistrib='normal', nodeDistribArgs={'center': VRV_BENCH_CENTER, 'stdDev': VRV_BENCH_STDDEV_METERS}, numNodes=n, seed=n)),
+	('createNodesFromLocs', [1000, 100000],
+		lambda n: benchLocs(n),
+		lambda locs: vrv.createNodesFromLocs(locs=locs)),
+
+	('getTimeDist2D.euclidean2D.all2all', [100, 300],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.getTimeDist2D(nodes=nodes, routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS)),
+	('getTimeDist2D.euclidean2D.one2many', [1000, 10000],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.getTimeDist2D(nodes=nodes, matrixType='one2many', fromNodeID=1, routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS)),
+	('getTimeDist2D.osrm.all2all', [30],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.getTimeDist2D(nodes=nodes, routeType='fastest', dataProvider='OSRM-online')),
+	('getTimeDist3D.all2all', [30],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.getTimeDist3D(nodes=nodes, takeoffSpeedMPS=5, cruiseSpeedMPS=20, landSpeedMPS=3, cruiseAltMetersAGL=100, routeType='square', climbRateMPS=1, descentRateMPS=1)),
+
+	('getShapepoints2D.euclidean2D', [100, 1000],
+		lambda n: _pairs(benchLocs(n)),
+		lambda pairs: [vrv.getShapepoints2D(startLoc=startLoc, endLoc=endLoc, routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS) for (startLoc, endLoc) in pairs]),
+	('getShapepoints2D.osrm', [100, 1000],
+		lambda n: _pairs(benchLocs(n)),
+		lambda pairs: [vrv.getShapepoints2D(startLoc=startLoc, endLoc=endLoc, routeType='fastest', dataProvider='OSRM-online') for (startLoc, endLoc) in pairs]),
+	('getShapepoints3D', [100, 1000],
+		lambda n: _pairs(benchLocs(n)),
+		lambda pairs: [vrv.getShapepoints3D(startLoc=startLoc, endLoc=endLoc, takeoffSpeedMPS=5, cruiseSpeedMPS=20, landSpeedMPS=3, cruiseAltMetersAGL=100, routeType='square', climbRateMPS=1, descentRateMPS=1) for (startLoc, endLoc) in pairs]),
+
+	('createAssignmentsFromNodeSeq2D', [100, 1000, 10000],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.createAssignmentsFromNodeSeq2D(nodeSeq=nodes['id'].tolist(), nodes=nodes, objectID='truck', routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS)),
+	('createAssignmentsFromNodeSeq2D.osrm', [100, 1000],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.createAssignmentsFromNodeSeq2D(nodeSeq=nodes['id'].tolist(), nodes=nodes, objectID='truck', routeType='fastest', dataProvider='OSRM-online')),
+	('createAssignmentsFromLocSeq2D', [100, 1000, 10000],
+		lambda n: benchLocs(n),
+		lambda locs: vrv.createAssignmentsFromLocSeq2D(locSeq=locs, objectID='truck', routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS)),
+	('createAssignmentsFromArcs2D', [100, 1000],
+		lambda n: benchArcs(n),
+		lambda arcs: vrv.createAssignmentsFromArcs2D(arcs=arcs, routeType='euclidean2D', speedMPS=VRV_BENCH_SPEED_MPS)),
+	('createAssignmentsFromSorties3D', [100, 1000],
+		lambda n: _pairs(benchLocs(n)),
+		lambda pairs: vrv.createAssignmentsFromSorties3D(startLocs=[pair[0] for pair in pairs], endLocs=[pair[1] for pair in pairs], objectID='drone', takeoffSpeedMPS=5, cruiseSpeedMPS=20, landSpeedMPS=3, cruiseAltMetersAGL=100, routeType='square', climbRateMPS=1, descentRateMPS=1)),
+
+	('deconstructAssignments', [1000, 10000],
+		lambda n: benchAssignments(n),
+		lambda assignments: vrv.deconstructAssignments(assignments=assignments)),
+	('findLocsAtTime', [1000, 10000],
+		lambda n: benchAssignments(n),
+		lambda assignments: vrv.findLocsAtTime(assignments=assignments, timeSec=assignments['endTimeSec'].max() / 2.0)),
+
+	('createLeaflet.nodes', [100, 1000, 10000],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.createLeaflet(nodes=nodes)),
+	('createLeaflet.arcs', [100, 1000],
+		lambda n: benchArcs(n),
+		lambda arcs: vrv.createLeaflet(arcs=arcs)),
+	('createCesium', [100, 1000],
+		lambda n: [benchAssignments(n), benchNodes(n)],
+		lambda data: vrv.createCesium(assignments=data[0], nodes=data[1], startTime='08:00:00', cesiumDir=benchCesiumDir(), problemDir='bench')),
+
+	('snapNodesToRoad.osrm', [100, 1000],
+		lambda n: benchNodes(n),
+		lambda nodes: vrv.snapNodesToRoad(nodes=nodes, dataProvider='OSRM-online')),
+
+	('geoDistance2DArray', [100000],
+		lambda n: benchNodes(n)[['lat', 'lon']].values,
+		lambda locs: vrv.geoDistance2DArray(locs[:-1, 0], locs[:-1, 1], locs[1:, 0], locs[1:, 1])),
+	('distancePath2D', [10000],
+		lambda n: benchLocs(n),
+		lambda path: vrv.distancePath2D(path)),
+	('geoSimplifyPath', [100000],
+		lambda n: benchLocs(n),
+		lambda path: vrv.geoSimplifyPath(path, 50)),
+	('getConvexHull', [1000, 100000],
+		lambda n: benchLocs(n),
+		lambda locs: vrv.getConvexHull(locs)),
+	('isPointInPoly', [1000],
+		lambda n: [benchLocs(n), vrv.getConvexHull(benchLocs(100))],
+		lambda data: [vrv.isPointInPoly(loc, data[1]) for loc in data[0]]),
+	('convertMatricesDictionaryToDataframe', [300, 1000],
+		lambda n: {(i, j): float(i * j) for i in range(n) for j in range(n)},
+		lambda dictionary: vrv.convertMatricesDictionaryToDataframe(dictionary)),
+	('exportImportDataframe.parquet', [1000, 100000],
+		lambda n: benchMixedLabelNodes(n),
+		lambda nodes: _exportImportDataframe(nodes, '.parquet')),
+	('exportImportDataframe.feather', [1000, 100000],
+		lambda n: benchMixedLabelNodes(n),
+		lambda nodes: _exportImportDataframe(nodes, '.feather')),
+]
+
+# Measurement ----------------------------------------------------------------
+
+@contextlib.contextmanager
+def _quiet():
+	with warnings.catch_warnings():
+		warnings.simplefilter('ignore')
+		with contextlib.redirect_stdout(io.StringIO()):
+			yield
+
+def runBenchmark(setup, run, size, repeats):
+	with _quiet():
+		data = setup(size)
+
+		# Time: best of `repeats`
+		timesSec = []
+		for i in range(repeats):
+			startTime = time.perf_counter()
+			run(data)
+			timesSec.append(time.perf_counter() - startTime)
+
+		# Peak memory: one separate run, since tracing slows everything down
+		tracemalloc.start()
+		run(data)
+		peakBytes = tracemalloc.get_traced_memory()[1]
+		tracemalloc.stop()
+
+	return {'timeSec': min(timesSec), 'peakMB': peakBytes / 1e6}
+
+def gitCommit():
+	try:
+		return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=repoDir).decode('utf-8').strip()
+	except Exception:
+		return 'unknown'
+
+def latestResultFile(excludeFile):
+	resultFiles = [f for f in glob.glob(os.path.join(resultsDir, '*.json')) if os.path.abspath(f) != os.path.abspath(excludeFile)]
+	if (len(resultFiles) == 0):
+		return None
+
+	return max(resultFiles, key=os.path.getmtime)
+
+def findRegressions(results, baseline, threshold):
+	regressions = []
+	for name in results:
+		if (name not in baseline):
+			continue
+		[new, old] = [results[name], baseline[name]]
+		if (new['timeSec'] > old['timeSec'] * (1 + threshold) and new['timeSec'] - old['timeSec'] > VRV_BENCH_MIN_TIME_DIFF_SEC):
+			regressions.append("%s: time %.4f s -> %.4f s" % (name, old['timeSec'], new['timeSec']))
+		if (new['peakMB'] > old['peakMB'] * (1 + threshold) and new['peakMB'] - old['peakMB'] > VRV_BENCH_MIN_MEMORY_DIFF_MB):
+			regressions.append("%s: peak memory %.1f MB -> %.1f MB" % (name, old['peakMB'], new['peakMB']))
+
+	return regressions
+
+def main():
+	parser = argparse.ArgumentParser(description="Offline benchmarks for veroviz.")
+	parser.add_argument('--quick', action='store_true', help="Only run the smallest size of each benchmark.")
+	parser.add_argument('--filter', default=None, help="Only run benchmarks whose name contains this text.")
+	parser.add_argument('--repeats', type=int, default=VRV_BENCH_REPEATS)
+	parser.add_argument('--compare', default=None, help="Result file to compare with (default: the most recent one).")
+	parser.add_argument('--threshold', type=float, default=VRV_BENCH_REGRESSION_THRESHOLD)
+	parser.add_argument('--fail-on-regression', action='store_true')
+	args = parser.parse_args()
+
+	installFakeProviders()
+
+	results = {}
+	for (name, sizes, setup, run) in benchmarks:
+		if (args.filter is not None and args.filter not in name):
+			continue
+		for size in (sizes[:1] if args.quick else sizes):
+			benchName = '%s[%s]' % (name, size)
+			results[benchName] = runBenchmark(setup, run, size, args.repeats)
+			print("%-50s %10.4f s %10.1f MB" % (benchName, results[benchName]['timeSec'], results[benchName]['peakMB']))
+			sys.stdout.flush()
+
+	for directory in [cesiumDir, tempDir]:
+		if (directory is not None):
+			shutil.rmtree(directory, ignore_errors=True)
+
+	commit = gitCommit()
+	if (not os.path.exists(resultsDir)):
+		os.makedirs(resultsDir)
+	resultFile = os.path.join(resultsDir, '%s.json' % (commit))
+	with open(resultFile, 'w') as f:
+		json.dump({
+			'commit': commit,
+			'date': datetime.datetime.now().isoformat(),
+			'python': sys.version.split()[0],
+			'numpy': np.__version__,
+			'pandas': pd.__version__,
+			'results': results
+		}, f, indent=1, sort_keys=True)
+	print("Results written to %s" % (resultFile))
+
+	baselineFile = args.compare if (args.compare is not None) else latestResultFile(resultFile)
+	if (baselineFile is None):
+		return 0
+
+	with open(baselineFile) as f:
+		baseline = json.load(f)['results']
+	regressions = findRegressions(results, baseline, args.threshold)
+	print("Compared with %s: %d regression(s)" % (baselineFile, len(regressions)))
+	for regression in regressions:
+		print("REGRESSION %s" % (regression))
+
+	return 1 if (args.fail_on_regression and len(regressions) > 0) else 0
+
+if (__name__ == '__main__'):
+	sys.exit(main())
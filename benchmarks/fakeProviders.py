@@ -0,0 +1,32 @@
+"""
+Fixed, offline responses for the data providers, so that benchmarks never touch the network.
+
+`installFakeProviders()` replaces `urllib3.PoolManager` with a stand-in that answers provider requests in-process, using the same responses as the offline stand-in server (`veroviz/_providerStandIn.py`).  Roads are straight lines between the requested points, driven at `VRV_STANDIN_SPEED_MPS`.  Requests that the stand-in does not handle raise an error.
+"""
+
+import json
+
+import urllib3
+
+from veroviz._providerStandIn import standInResponse
+
+class _FakeResponse(object):
+	def __init__(self, data, status=200):
+		self.data = json.dumps(data).encode('utf-8')
+		self.status = status
+
+class FakePoolManager(object):
+	def __init__(self, *args, **kwargs):
+		pass
+
+	def request(self, method, url, *args, **kwargs):
+		[status, data] = standInResponse(method, url, kwargs.get('body'))
+		if (status == 404):
+			raise RuntimeError("Benchmarks run offline; there is no fixed response for %s" % (url))
+
+		return _FakeResponse(data, status)
+
+def installFakeProviders():
+	urllib3.PoolManager = FakePoolManager
+
+	return
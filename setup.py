@@ -36,12 +36,16 @@ setuptools.setup(
 		'numpy', 
 		'pandas', 
 		'geopy', 
-		'psycopg2-binary', 
 		'urllib3', 
-		'folium',
 		'tripy',
 		'scipy'
 	],
+	extras_require={
+		'pgrouting': ['psycopg2-binary'],
+		'leaflet': ['folium'],
+		'parquet': ['pyarrow'],
+		'all': ['psycopg2-binary', 'folium', 'pyarrow'],
+	},
 	classifiers=[
 		"Development Status :: 2 - Pre-Alpha",
 		"Programming Language :: Python :: 2.7",
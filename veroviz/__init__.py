@@ -9,6 +9,7 @@ from veroviz.snapNodesToRoad import snapNodesToRoad
 from veroviz.snapNodesToRoad import getSnapLoc
 from veroviz.snapNodesToRoad import getSnapLocBatch
 from veroviz.getTimeDist2D import getTimeDist2D
+from veroviz.getTimeDist2D import getTimeDist2DToMatrixStore
 from veroviz.getTimeDistScalar2D import getTimeDistScalar2D
 from veroviz.getTimeDist3D import getTimeDist3D
 from veroviz.getTimeDistScalar3D import getTimeDistScalar3D
@@ -16,6 +17,7 @@ from veroviz.getShapepoints2D import getShapepoints2D
 from veroviz.getShapepoints3D import getShapepoints3D
 from veroviz.createAssignments import addAssignment2D
 from veroviz.createAssignments import addAssignment3D
+from veroviz.createAssignments import createAssignmentsFromSorties3D
 from veroviz.createAssignments import addStaticAssignment
 from veroviz.createAssignments import createAssignmentsFromArcs2D
 from veroviz.createAssignments import createAssignmentsFromNodeSeq2D
@@ -45,6 +47,7 @@ from veroviz._queryPgRouting import pgrGetSnapToRoadLatLon
 from veroviz._queryPgRouting import pgrGetNearestStreet
 from veroviz._queryPgRouting import pgrGetShapepointsTimeDist
 from veroviz._queryPgRouting import pgrGetTimeDist
+from veroviz._queryPgRouting import pgrGetDatabaseBounds
 
 # ORS related
 from veroviz._queryORS import orsGetSnapToRoadLatLon
@@ -52,6 +55,7 @@ from veroviz._queryORS import orsGetShapepointsTimeDist
 from veroviz._queryORS import orsGetTimeDistAll2All
 from veroviz._queryORS import orsGetTimeDistOne2Many
 from veroviz._queryORS import orsGetTimeDistMany2One
+from veroviz._queryORS import orsGetTimeDistMany2Many
 from veroviz._queryORS import orsGeocode
 from veroviz._queryORS import orsReverseGeocode
 
@@ -68,8 +72,11 @@ from veroviz._queryMapQuest import mqGetShapepointsTimeDist
 from veroviz._queryMapQuest import mqGetTimeDistAll2All
 from veroviz._queryMapQuest import mqGetTimeDistOne2Many
 from veroviz._queryMapQuest import mqGetTimeDistMany2One
+from veroviz._queryMapQuest import mqGetTimeDistMany2Many
 from veroviz._queryMapQuest import mqGeocode
 from veroviz._queryMapQuest import mqReverseGeocode
+from veroviz._queryMapQuest import mqGeocodeBatch
+from veroviz._queryMapQuest import mqReverseGeocodeBatch
 
 # 3D function related
 from veroviz._buildFlightProfile import buildNoLoiteringFlight
@@ -5,6 +5,7 @@ from veroviz.utilities import convertSpeed
 from veroviz._geometry import geoMileageInPath2D
 from veroviz._geometry import geoDistancePath2D
 from veroviz._geometry import geoDistance2D
+from veroviz._geometry import geoDistance2DArray
 
 from veroviz._internal import loc2Dict
 from veroviz._internal import locs2Dict
@@ -182,7 +183,7 @@ def _buildFlightProfile(startLoc, cruiseAltMetersAGL, endLoc, takeoffSpeedMPS, r
 		deltaAGLTakeoffLanding = dicStartLoc['alt'] - dicEndLoc['alt']
 		deltaAGLCruiseTakeoff = (
 			(totalGroundDistance - deltaAGLTakeoffLanding / math.tan(math.radians(descentGradientInDegree))) 
-			* (math.tan(math.radians(climbGradientInDegree)) + math.tan(math.radians(descentGradientInDegree)))
+			/ (1 / math.tan(math.radians(climbGradientInDegree)) + 1 / math.tan(math.radians(descentGradientInDegree)))
 		)
 		deltaAGLCruiseLanding = deltaAGLCruiseTakeoff + deltaAGLTakeoffLanding
 		takeoffGroundDistance = deltaAGLCruiseTakeoff / math.tan(math.radians(climbGradientInDegree))
@@ -299,7 +300,7 @@ def _buildFlightPath(path, speedMPS):
 			flightDistance = 0
 		accuGroundDistance += groundDistance
 		accuFlightDistance += flightDistance
-		timeFromPreviousPosition = accuFlightDistance / speedMPS
+		timeFromPreviousPosition = flightDistance / speedMPS
 		accuPathTime += timeFromPreviousPosition
 
 		# And one way point to the flight path
@@ -313,7 +314,7 @@ def _buildFlightPath(path, speedMPS):
 			'groundDistance': groundDistance, 
 			'flightDistance': flightDistance, 
 			'accuFlightDistance': accuFlightDistance, 
-			'timeFromPreviousPosition': accuFlightDistance / speedMPS,
+			'timeFromPreviousPosition': timeFromPreviousPosition,
 			'pathStartTimeSec': accuPathTime, 
 			'pathEndTimeSec': accuPathTime
 			}, ignore_index=True)
@@ -365,11 +366,11 @@ def addLoiterTimeToFlight(flight, loiterPosition, loiterTime):
 
 	flightWithLoiter = flight.copy()
 
-	if (loiterPosition == "beforeDeparture"):
+	if (loiterPosition in ["beforeDeparture", "beforeTakeoff"]):
 		flightWithLoiter.loc[flightWithLoiter['description'] == "beforeDeparture", 'loiterTime'] += loiterTime
 		flightWithLoiter.loc[flightWithLoiter['description'] == "beforeTakeoff", 'loiterTime'] += loiterTime
 
-	elif (loiterPosition == "departAtAlt"):
+	elif (loiterPosition in ["departAtAlt", "takeoffAtAlt"]):
 		flightWithLoiter.loc[flightWithLoiter['description'] == "takeoffAtAlt", 'loiterTime'] += loiterTime
 		flightWithLoiter.loc[flightWithLoiter['description'] == "takeoffAtAlt and arrivalAtAlt", 'loiterTime'] += loiterTime
 
@@ -377,17 +378,198 @@ def addLoiterTimeToFlight(flight, loiterPosition, loiterTime):
 		flightWithLoiter.loc[flightWithLoiter['description'] == "arrivalAtAlt", 'loiterTime'] += loiterTime
 		flightWithLoiter.loc[flightWithLoiter['description'] == "takeoffAtAlt and arrivalAtAlt", 'loiterTime'] += loiterTime
 
-	elif (loiterPosition == "afterArrival"):
+	elif (loiterPosition in ["afterArrival", "afterLand"]):
 		flightWithLoiter.loc[flightWithLoiter['description'] == "afterArrival", 'loiterTime'] += loiterTime
 		flightWithLoiter.loc[flightWithLoiter['description'] == "afterLand", 'loiterTime'] += loiterTime
 
 	# Recalculate 'pathStartTimeSec' and 'pathEndTimeSec' columns
 	lstStartTimeSec = flightWithLoiter['pathStartTimeSec'].tolist()
 	lstEndTimeSec = flightWithLoiter['pathEndTimeSec'].tolist()
+	lstEndTimeSec[0] = lstStartTimeSec[0] + flightWithLoiter.iloc[0]['loiterTime']
 	for i in range(1, len(flightWithLoiter)):
 		lstStartTimeSec[i] = lstEndTimeSec[i - 1] + flightWithLoiter.iloc[i]['timeFromPreviousPosition']
 		lstEndTimeSec[i] = lstEndTimeSec[i - 1] + flightWithLoiter.iloc[i]['timeFromPreviousPosition'] + flightWithLoiter.iloc[i]['loiterTime']
 	flightWithLoiter['pathStartTimeSec'] = lstStartTimeSec
 	flightWithLoiter['pathEndTimeSec'] = lstEndTimeSec
 
-	return flightWithLoiter
\ No newline at end of file
+	return flightWithLoiter
+
+def buildNoLoiteringFlightArrays(routeType='square', startLocs=None, cruiseAltMetersAGL=None, endLocs=None, takeoffSpeedMPS=None, rateOfClimbMPS=None, cruiseSpeedMPS=None, landSpeedMPS=None, rateOfDescentMPS=None):
+
+	"""
+	Vectorized version of `buildNoLoiteringFlight()`, which builds the flight profiles of many flights at once.  Every flight is described by four waypoints (beforeTakeoff, takeoffAtAlt, arrivalAtAlt, afterArrival).  Route types with fewer waypoints repeat the previous waypoint and flag the repeat in `isWaypoint`, so that all flights share the same array shapes.
+
+	Parameters
+	----------
+	routeType: string, Optional, default as 'square'
+		Type of flight profile/path, options are 'square', 'triangular', 'trapezoidal', 'straight'.
+	startLocs: numpy array
+		Start locations, as an n x 3 array of [lat, lon, alt].
+	cruiseAltMetersAGL: numpy array
+		Cruise altitude of each flight, meters above sea level.
+	endLocs: numpy array
+		End locations, as an n x 3 array of [lat, lon, alt].
+	takeoffSpeedMPS: numpy array
+		Takeoff speed of each flight, in meters/second.
+	rateOfClimbMPS: numpy array
+		Rate of climb of each flight, it is a vertical speed.
+	cruiseSpeedMPS: numpy array
+		Cruise speed of each flight, in meters/second.
+	landSpeedMPS: numpy array
+		Landing speed of each flight, in meters/second.
+	rateOfDescentMPS: numpy array
+		Rate of descent of each flight, vertical speed.
+
+	Return
+	------
+	dictionary
+		A dictionary of n x 4 arrays, with keys 'lat', 'lon', 'altAGL', 'groundDistance', 'flightDistance', 'timeFromPreviousPosition' and 'isWaypoint'.
+	"""
+
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	startLocs = np.asarray(startLocs, dtype=float)
+	endLocs = np.asarray(endLocs, dtype=float)
+	numFlights = len(startLocs)
+
+	lat = np.empty((numFlights, 4))
+	lon = np.empty((numFlights, 4))
+	altAGL = np.empty((numFlights, 4))
+	isWaypoint = np.ones((numFlights, 4), dtype=bool)
+
+	lat[:, 0] = startLocs[:, 0]
+	lon[:, 0] = startLocs[:, 1]
+	altAGL[:, 0] = startLocs[:, 2]
+	lat[:, 3] = endLocs[:, 0]
+	lon[:, 3] = endLocs[:, 1]
+	altAGL[:, 3] = endLocs[:, 2]
+
+	totalGroundDistance = geoDistance2DArray(startLocs[:, 0], startLocs[:, 1], endLocs[:, 0], endLocs[:, 1])
+
+	def _pointAtMileage(mileageInMeters):
+		# Same convention as `geoMileageInPath2D()` on a two-point path
+		with np.errstate(divide='ignore', invalid='ignore'):
+			ratio = np.where(totalGroundDistance > mileageInMeters, mileageInMeters / totalGroundDistance, 1.0)
+		return [startLocs[:, 0] + ratio * (endLocs[:, 0] - startLocs[:, 0]), startLocs[:, 1] + ratio * (endLocs[:, 1] - startLocs[:, 1])]
+
+	if (routeType in ['square', 'trapezoidal']):
+		if (routeType == 'square'):
+			rateOfClimbMPS = takeoffSpeedMPS
+			rateOfDescentMPS = landSpeedMPS
+
+		# Calculate gradients of climbing and landing
+		tanClimb = np.tan(np.arcsin(rateOfClimbMPS / takeoffSpeedMPS))
+		tanDescent = np.tan(np.arcsin(rateOfDescentMPS / landSpeedMPS))
+
+		idealTakeoffGroundDistance = (cruiseAltMetersAGL - startLocs[:, 2]) / tanClimb
+		idealLandingGroundDistance = (cruiseAltMetersAGL - endLocs[:, 2]) / tanDescent
+		canCruise = totalGroundDistance > idealTakeoffGroundDistance + idealLandingGroundDistance
+
+		# If the cruise altitude can not be reached, the takeoffAt and arrivalAt positions are the same
+		deltaAGLTakeoffLanding = startLocs[:, 2] - endLocs[:, 2]
+		deltaAGLCruiseTakeoff = (totalGroundDistance - deltaAGLTakeoffLanding / tanDescent) / (1 / tanClimb + 1 / tanDescent)
+		takeoffGroundDistance = np.where(canCruise, idealTakeoffGroundDistance, deltaAGLCruiseTakeoff / tanClimb)
+
+		[lat[:, 1], lon[:, 1]] = _pointAtMileage(takeoffGroundDistance)
+		altAGL[:, 1] = np.where(canCruise, cruiseAltMetersAGL, deltaAGLCruiseTakeoff + startLocs[:, 2])
+
+		[landingLat, landingLon] = _pointAtMileage(totalGroundDistance - idealLandingGroundDistance)
+		lat[:, 2] = np.where(canCruise, landingLat, lat[:, 1])
+		lon[:, 2] = np.where(canCruise, landingLon, lon[:, 1])
+		altAGL[:, 2] = np.where(canCruise, cruiseAltMetersAGL, altAGL[:, 1])
+		isWaypoint[:, 2] = canCruise
+
+		segmentSpeedMPS = np.column_stack([takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS])
+
+	elif (routeType == 'triangular'):
+		lat[:, 1] = (startLocs[:, 0] + endLocs[:, 0]) / 2
+		lon[:, 1] = (startLocs[:, 1] + endLocs[:, 1]) / 2
+		altAGL[:, 1] = cruiseAltMetersAGL
+		lat[:, 2] = lat[:, 1]
+		lon[:, 2] = lon[:, 1]
+		altAGL[:, 2] = altAGL[:, 1]
+		isWaypoint[:, 2] = False
+
+		segmentSpeedMPS = np.column_stack([cruiseSpeedMPS, cruiseSpeedMPS, cruiseSpeedMPS])
+
+	elif (routeType == 'straight'):
+		for j in [1, 2]:
+			lat[:, j] = lat[:, 0]
+			lon[:, j] = lon[:, 0]
+			altAGL[:, j] = altAGL[:, 0]
+			isWaypoint[:, j] = False
+
+		segmentSpeedMPS = np.column_stack([cruiseSpeedMPS, cruiseSpeedMPS, cruiseSpeedMPS])
+
+	groundDistance = np.zeros((numFlights, 4))
+	groundDistance[:, 1:] = geoDistance2DArray(lat[:, :-1], lon[:, :-1], lat[:, 1:], lon[:, 1:])
+	deltaAGL = np.zeros((numFlights, 4))
+	deltaAGL[:, 1:] = np.diff(altAGL, axis=1)
+	flightDistance = np.sqrt(groundDistance * groundDistance + deltaAGL * deltaAGL)
+
+	timeFromPreviousPosition = np.zeros((numFlights, 4))
+	timeFromPreviousPosition[:, 1:] = flightDistance[:, 1:] / segmentSpeedMPS
+
+	flight = {
+		'lat': lat,
+		'lon': lon,
+		'altAGL': altAGL,
+		'groundDistance': groundDistance,
+		'flightDistance': flightDistance,
+		'timeFromPreviousPosition': timeFromPreviousPosition,
+		'isWaypoint': isWaypoint
+	}
+
+	return flight
+
+def addLoiterTimeToFlightArrays(flight, routeType, loiterPosition, loiterTime):
+	"""
+	Vectorized version of `addLoiterTimeToFlight()`, for flight profiles generated by `buildNoLoiteringFlightArrays()`.  The 'loiterTime', 'pathStartTimeSec' and 'pathEndTimeSec' keys are added to (a copy of) the flight dictionary.
+
+	Parameters
+	----------
+	flight: dictionary
+		The flight profiles to add loiter action.
+	routeType: string
+		Type of flight profile/path that generated `flight`.
+	loiterPosition: string
+		A string to specify where are we going to loiter.
+	loiterTime: numpy array
+		The amount of loiter time that we are going to ADD to each flight.
+
+	Return
+	------
+	dictionary
+		A new flight dictionary that includes the newly added loiter time.
+	"""
+
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	flightWithLoiter = dict(flight)
+	numFlights = len(flight['lat'])
+	loiter = np.zeros((numFlights, 4))
+
+	# Waypoint (column) that carries the loiter time; takeoffAt/arrivalAt do not exist for 'straight' flights
+	if (loiterPosition in ['beforeDeparture', 'beforeTakeoff']):
+		loiter[:, 0] = loiterTime
+	elif (loiterPosition in ['departAtAlt', 'takeoffAtAlt'] and routeType != 'straight'):
+		loiter[:, 1] = loiterTime
+	elif (loiterPosition == 'arrivalAtAlt' and routeType != 'straight'):
+		loiter[:, 2] = np.where(flight['isWaypoint'][:, 2], loiterTime, 0.0)
+		loiter[:, 1] = np.where(flight['isWaypoint'][:, 2], 0.0, loiterTime)
+	elif (loiterPosition in ['afterArrival', 'afterLand']):
+		loiter[:, 3] = loiterTime
+
+	pathEndTimeSec = np.cumsum(flight['timeFromPreviousPosition'] + loiter, axis=1)
+
+	flightWithLoiter['loiterTime'] = loiter
+	flightWithLoiter['pathStartTimeSec'] = pathEndTimeSec - loiter
+	flightWithLoiter['pathEndTimeSec'] = pathEndTimeSec
+
+	return flightWithLoiter
@@ -7,19 +7,54 @@ import time
 import datetime
 import dateutil.parser
 import sys
+import itertools
+import hashlib
 
 import numpy as np
 import pandas as pd
-import geopy
-import geopy.distance
-import geopy.geocoders
-from geopy.geocoders import Nominatim
-import psycopg2
-import folium
-from folium.features import DivIcon
 from http.client import responses
-import urllib3
-import tripy
-import scipy.spatial
+import importlib
+
+class _LazyModule(object):
+	"""
+	Stands in for a heavy or optional module, which is only imported the first time one of its attributes is used.  This keeps `import veroviz` fast, and lets veroviz run without optional packages (e.g., psycopg2 if pgRouting is never used).
+	"""
+
+	def __init__(self, name, submodules=[], extra=None):
+		self.__dict__['_name'] = name
+		self.__dict__['_submodules'] = submodules
+		self.__dict__['_extra'] = extra
+		self.__dict__['_module'] = None
+
+	def _load(self):
+		if (self._module is None):
+			try:
+				module = importlib.import_module(self._name)
+				for submodule in self._submodules:
+					importlib.import_module(submodule)
+			except ImportError:
+				if (self._extra is not None):
+					raise ImportError("This function requires the `%s` package.  Install it with `pip install veroviz[%s]`." % (self._name, self._extra))
+				raise
+			self.__dict__['_module'] = module
+
+		return self._module
+
+	def __getattr__(self, attr):
+		return getattr(self._load(), attr)
+
+	def __setattr__(self, attr, value):
+		setattr(self._load(), attr, value)
+
+	def __repr__(self):
+		return "<lazy module '%s'>" % (self._name)
+
+geopy = _LazyModule('geopy', submodules=['geopy.distance', 'geopy.geocoders'])
+psycopg2 = _LazyModule('psycopg2', extra='pgrouting')
+folium = _LazyModule('folium', submodules=['folium.features'], extra='leaflet')
+urllib3 = _LazyModule('urllib3')
+tripy = _LazyModule('tripy')
+scipy = _LazyModule('scipy', submodules=['scipy.spatial'])
+pyarrow = _LazyModule('pyarrow', submodules=['pyarrow.parquet', 'pyarrow.feather'], extra='parquet')
 
 from veroviz._params import *
@@ -2,7 +2,7 @@ from veroviz._common import *
 
 from veroviz._getSnapLoc import privGetSnapLocBatch
 
-from veroviz._internal import locs2Dict
+from veroviz._internal import locs2Array
 from veroviz._internal import loc2Dict
 
 from veroviz.utilities import initDataframe
@@ -58,38 +58,34 @@ def privCreateNodesFromLocs(locs=None, initNodes=None, nodeType=None, nodeName=N
 			maxID = max(initNodes['id'])
 			startNode = max([maxID + 1, startNode])
 
-	ids = [n for n in range(startNode, startNode + numNodes)]
+	ids = np.arange(startNode, startNode + numNodes)
 	if (incrementName):
 		nodeNames = [(nodeName + "%s" % (n)) for n in range(incrementStart, incrementStart + numNodes)]
 	else:
-		nodeNames = [nodeName] * numNodes
+		nodeNames = nodeName
 
 	# Snap to road
 	# FIXME! - Issue #28 - Multiple nodes might be snapped to the same location 
 	if (snapToRoad):
 		locs = privGetSnapLocBatch(locs=locs, dataProvider=dataProvider, dataProviderArgs=dataProviderArgs)
 
-	# node dataframe
-	nodes = initDataframe('Nodes')
-
-	# generate nodes
-	dicLocs = locs2Dict(locs)
-	for i in range(len(locs)):
-		nodes = nodes.append({
-			'id': ids[i],
-			'lat': dicLocs[i]['lat'],
-			'lon': dicLocs[i]['lon'],
-			'altMeters': dicLocs[i]['alt'],
-			'nodeName': nodeNames[i],
-			'nodeType': nodeType,
-			'leafletIconPrefix': leafletIconPrefix,
-			'leafletIconType': leafletIconType,
-			'leafletColor': leafletColor,
-			'leafletIconText': leafletIconText if (leafletIconText != None) else ids[i],
-			'cesiumIconType': cesiumIconType,
-			'cesiumColor': cesiumColor,
-			'cesiumIconText': cesiumIconText if (cesiumIconText != None) else ids[i]
-			}, ignore_index=True)
+	# generate nodes, one column at a time; scalar values are broadcast to every node
+	locsArray = locs2Array(locs)
+	nodes = pd.DataFrame({
+		'id': ids,
+		'lat': locsArray[:, 0],
+		'lon': locsArray[:, 1],
+		'altMeters': locsArray[:, 2],
+		'nodeName': nodeNames,
+		'nodeType': nodeType,
+		'leafletIconPrefix': leafletIconPrefix,
+		'leafletIconType': leafletIconType,
+		'leafletColor': leafletColor,
+		'leafletIconText': leafletIconText if (leafletIconText != None) else ids,
+		'cesiumIconType': cesiumIconType,
+		'cesiumColor': cesiumColor,
+		'cesiumIconText': cesiumIconText if (cesiumIconText != None) else ids
+		}, index=np.arange(numNodes)).reindex(columns=nodesColumnList)
 
 	# if the user provided an initNode dataframe, add the new points after it
 	if (type(initNodes) is pd.core.frame.DataFrame):
@@ -112,30 +108,26 @@ def privCreateArcsFromLocSeq(locSeq=None, initArcs=None, startArc=1, objectID=No
 		if (len(initArcs) > 0):
 			maxOdID = max(initArcs['odID'])
 			startArc = max(maxOdID + 1, startArc)
-	odIDs = [n for n in range(startArc, startArc + numArcs)]
-
-	# arc dataframe
-	arcs = initDataframe('Arcs')
-
-	# generate arcs
-	for i in range(len(locSeq) - 1):
-		arcs = arcs.append({
-			'odID': odIDs[i],
-			'objectID': objectID,
-			'startLat': locSeq[i][0],
-			'startLon': locSeq[i][1],
-			'endLat': locSeq[i + 1][0],
-			'endLon': locSeq[i + 1][1],
-			'leafletColor' : leafletColor,
-			'leafletWeight' : leafletWeight,
-			'leafletStyle' : leafletStyle,
-			'leafletOpacity' : leafletOpacity,
-			'cesiumColor' : cesiumColor,
-			'cesiumWeight' : cesiumWeight,
-			'cesiumStyle' : cesiumStyle,
-			'cesiumOpacity' : cesiumOpacity,
-			'useArrows': useArrows
-			}, ignore_index=True)
+
+	# generate arcs, one column at a time; scalar values are broadcast to every arc
+	locSeqArray = locs2Array(locSeq)
+	arcs = pd.DataFrame({
+		'odID': np.arange(startArc, startArc + numArcs - 1),
+		'objectID': objectID,
+		'startLat': locSeqArray[:-1, 0],
+		'startLon': locSeqArray[:-1, 1],
+		'endLat': locSeqArray[1:, 0],
+		'endLon': locSeqArray[1:, 1],
+		'leafletColor' : leafletColor,
+		'leafletWeight' : leafletWeight,
+		'leafletStyle' : leafletStyle,
+		'leafletOpacity' : leafletOpacity,
+		'cesiumColor' : cesiumColor,
+		'cesiumWeight' : cesiumWeight,
+		'cesiumStyle' : cesiumStyle,
+		'cesiumOpacity' : cesiumOpacity,
+		'useArrows': useArrows
+		}, index=np.arange(max(numArcs - 1, 0))).reindex(columns=arcsColumnList)
 
 	# if the user provided an initNode dataframe, add the new points after it
 	if (type(initArcs) is pd.core.frame.DataFrame):
@@ -4,6 +4,11 @@ from veroviz._queryORS import orsGeocode
 from veroviz._queryORS import orsReverseGeocode
 from veroviz._queryMapQuest import mqGeocode
 from veroviz._queryMapQuest import mqReverseGeocode
+from veroviz._queryMapQuest import mqGeocodeBatch
+from veroviz._queryMapQuest import mqReverseGeocodeBatch
+
+import threading
+import concurrent.futures
 
 def privGeocode(location=None, dataProvider=None, dataProviderArgs=None):
 	"""
@@ -36,7 +41,7 @@ def privGeocode(location=None, dataProvider=None, dataProviderArgs=None):
 	if (dataProvider == None):
 		# Initialize our geocoder:
 		geopy.geocoders.options.default_user_agent = 'unknown'
-		geolocator = Nominatim()
+		geolocator = geopy.geocoders.Nominatim()
 	
 		loc = geolocator.geocode(location, timeout=20)
 		if (loc is not None):
@@ -89,7 +94,7 @@ def privReverseGeocode(location=None, dataProvider=None, dataProviderArgs=None):
 		# Initialize our geocoder:
 		# geolocator = Nominatim(user_agent="specify_your_app_name_here")
 		geopy.geocoders.options.default_user_agent = 'unknown'
-		geolocator = Nominatim()
+		geolocator = geopy.geocoders.Nominatim()
 		
 		loc = geolocator.reverse(location, timeout=20)
 		if (loc is not None):
@@ -105,4 +110,151 @@ def privReverseGeocode(location=None, dataProvider=None, dataProviderArgs=None):
 	elif (geoDataProviderDictionary[dataProvider] == 'mapquest'):
 		[loc, address] = mqReverseGeocode(location, dataProviderArgs['APIkey'])
 		return (loc, address)
-		
\ No newline at end of file
+
+
+def privGeocodeBatch(locations, dataProvider=None, dataProviderArgs=None, cacheFile=None, maxWorkers=VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS, requestsPerSec=None):
+	"""
+	Convert many text strings to GPS coordinates.  Repeated text strings (ignoring case and extra spaces) are geocoded once, and text strings found in the cache file are not geocoded again.
+
+	Return
+	------
+	list
+		One GPS coordinate, of the form [lat, lon], for each text string (None if the text string could not be geocoded).
+	"""
+
+	provider = _geoProviderName(dataProvider)
+	keys = ['%s|%s' % (provider, ' '.join(str(text).split()).lower()) for text in locations]
+
+	if (provider == 'mapquest'):
+		requestFunction = lambda texts, http: mqGeocodeBatch(texts, dataProviderArgs['APIkey'], http)
+	elif (provider == 'ors-online'):
+		requestFunction = lambda text, http: orsGeocode(text, dataProviderArgs['APIkey'], http)
+	else:
+		geolocator = _nominatimGeolocator()
+		requestFunction = lambda text, http: _nominatimGeocode(geolocator, text)
+
+	cache = _geocodeWithCache(keys, locations, requestFunction, provider, cacheFile, maxWorkers, requestsPerSec)
+
+	return [cache.get(key) for key in keys]
+
+def privReverseGeocodeBatch(locations, dataProvider=None, dataProviderArgs=None, cacheFile=None, maxWorkers=VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS, requestsPerSec=None):
+	"""
+	Convert many GPS coordinates to addresses.  Locations that are the same to 6 decimal places (about 0.1 meters) are reverse geocoded once, and locations found in the cache file are not reverse geocoded again.
+
+	Return
+	------
+	list
+		One (loc, address) for each location (None if the location could not be reverse geocoded), where loc is of the form [lat, lon] and address is a dataProvider-specific dictionary.
+	"""
+
+	provider = _geoProviderName(dataProvider)
+	keys = ['%s|%.6f,%.6f' % (provider, loc[0], loc[1]) for loc in locations]
+
+	if (provider == 'mapquest'):
+		requestFunction = lambda locs, http: mqReverseGeocodeBatch(locs, dataProviderArgs['APIkey'], http)
+	elif (provider == 'ors-online'):
+		requestFunction = lambda loc, http: orsReverseGeocode(loc, dataProviderArgs['APIkey'], http)
+	else:
+		geolocator = _nominatimGeolocator()
+		requestFunction = lambda loc, http: _nominatimReverseGeocode(geolocator, loc)
+
+	cache = _geocodeWithCache(keys, locations, requestFunction, provider, cacheFile, maxWorkers, requestsPerSec)
+
+	return [cache.get(key) for key in keys]
+
+def _geoProviderName(dataProvider):
+	try:
+		return geoDataProviderDictionary[dataProvider.lower()]
+	except:
+		return 'nominatim'
+
+def _nominatimGeolocator():
+	geopy.geocoders.options.default_user_agent = 'unknown'
+
+	return geopy.geocoders.Nominatim()
+
+def _nominatimGeocode(geolocator, text):
+	loc = geolocator.geocode(text, timeout=20)
+	if (loc is None):
+		return None
+
+	return [loc.latitude, loc.longitude]
+
+def _nominatimReverseGeocode(geolocator, location):
+	loc = geolocator.reverse(location[0:2], timeout=20)
+	if (loc is None):
+		return None
+
+	return ([loc.latitude, loc.longitude], loc.raw)
+
+def _geocodeWithCache(keys, inputs, requestFunction, provider, cacheFile, maxWorkers, requestsPerSec):
+	# The cache file has one JSON [key, result] per line.  New results are appended after every block of requests, so an interrupted run keeps what it has already geocoded.
+	cache = {}
+	if (cacheFile is not None and os.path.exists(cacheFile)):
+		with open(cacheFile, 'r') as cacheLines:
+			for line in cacheLines:
+				try:
+					[key, result] = json.loads(line)
+					cache[key] = result
+				except ValueError:
+					# e.g., a partly written last line
+					pass
+
+	# Each new key is requested once, with the first input that has that key
+	newInputs = {}
+	for (key, value) in zip(keys, inputs):
+		if (key not in cache and key not in newInputs):
+			newInputs[key] = value
+	newKeys = list(newInputs.keys())
+
+	if (provider == 'mapquest'):
+		batchSize = VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE
+		if (requestsPerSec is None):
+			requestsPerSec = VRV_DEFAULT_MAPQUEST_GEOCODE_REQUESTSPERSEC
+	else:
+		batchSize = 1
+		if (requestsPerSec is None):
+			requestsPerSec = VRV_DEFAULT_ORS_GEOCODE_REQUESTSPERSEC if (provider == 'ors-online') else VRV_DEFAULT_NOMINATIM_REQUESTSPERSEC
+
+	http = urllib3.PoolManager(maxsize=maxWorkers)
+	lock = threading.Lock()
+	nextStartTime = [time.monotonic()]
+
+	def _request(requestKeys):
+		# Wait for this request's turn, so that at most `requestsPerSec` requests start per second
+		with lock:
+			now = time.monotonic()
+			startTime = max(now, nextStartTime[0])
+			nextStartTime[0] = startTime + 1.0 / requestsPerSec
+		time.sleep(startTime - now)
+
+		try:
+			if (provider == 'mapquest'):
+				results = requestFunction([newInputs[key] for key in requestKeys], http)
+			else:
+				results = [requestFunction(newInputs[requestKeys[0]], http)]
+		except:
+			results = None
+
+		if (results is None or len(results) != len(requestKeys)):
+			results = [None] * len(requestKeys)
+
+		return results
+
+	requestKeys = [newKeys[i:i + batchSize] for i in range(0, len(newKeys), batchSize)]
+	blockSize = 10 * maxWorkers
+	with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+		for first in range(0, len(requestKeys), blockSize):
+			blockResults = {}
+			for (blockKeys, results) in zip(requestKeys[first:first + blockSize], executor.map(_request, requestKeys[first:first + blockSize])):
+				for (key, result) in zip(blockKeys, results):
+					if (result is not None):
+						blockResults[key] = list(result) if (type(result) is tuple) else result
+			cache.update(blockResults)
+
+			if (cacheFile is not None and len(blockResults) > 0):
+				with open(cacheFile, 'a') as cacheLines:
+					for key in blockResults:
+						cacheLines.write(json.dumps([key, blockResults[key]]) + '\n')
+
+	return cache
@@ -590,4 +590,295 @@ def geoGetHeading(currentLoc, goalLoc):
 	if bearingInDegree < 0:
 		bearingInDegree += 360
 
-	return bearingInDegree
\ No newline at end of file
+	return bearingInDegree
+
+def geoDistance2DArray(lats1, lons1, lats2, lons2):
+	"""
+	Element-wise distances between two equal-length arrays of locations, using Vincenty's inverse formula on the WGS-84 ellipsoid.  This is the vectorized counterpart of `geoDistance2D()`; the results agree with geopy's geodesic distance to well under a millimeter.
+
+	Parameters
+	----------
+	lats1: array-like
+		Latitudes of the first locations, in degrees
+	lons1: array-like
+		Longitudes of the first locations, in degrees
+	lats2: array-like
+		Latitudes of the second locations, in degrees
+	lons2: array-like
+		Longitudes of the second locations, in degrees
+
+	Return
+	------
+	numpy array
+		Distances in meters, one for each pair of locations.
+	"""
+
+	a = VRV_CONST_WGS84_SEMI_MAJOR_AXIS
+	f = VRV_CONST_WGS84_FLATTENING
+	b = (1 - f) * a
+
+	[lats1, lons1, lats2, lons2] = np.broadcast_arrays(
+		np.atleast_1d(np.asarray(lats1, dtype=float)), 
+		np.atleast_1d(np.asarray(lons1, dtype=float)), 
+		np.atleast_1d(np.asarray(lats2, dtype=float)), 
+		np.atleast_1d(np.asarray(lons2, dtype=float)))
+
+	L = np.radians(lons2 - lons1)
+	U1 = np.arctan((1 - f) * np.tan(np.radians(lats1)))
+	U2 = np.arctan((1 - f) * np.tan(np.radians(lats2)))
+	sinU1 = np.sin(U1)
+	cosU1 = np.cos(U1)
+	sinU2 = np.sin(U2)
+	cosU2 = np.cos(U2)
+
+	lam = L.copy()
+	converged = np.zeros(L.shape, dtype=bool)
+	with np.errstate(divide='ignore', invalid='ignore'):
+		for i in range(200):
+			sinLam = np.sin(lam)
+			cosLam = np.cos(lam)
+			sinSigma = np.sqrt((cosU2 * sinLam) ** 2 + (cosU1 * sinU2 - sinU1 * cosU2 * cosLam) ** 2)
+			cosSigma = sinU1 * sinU2 + cosU1 * cosU2 * cosLam
+			sigma = np.arctan2(sinSigma, cosSigma)
+			sinAlpha = np.where(sinSigma == 0, 0.0, cosU1 * cosU2 * sinLam / sinSigma)
+			cosSqAlpha = 1 - sinAlpha ** 2
+			cos2SigmaM = np.where(cosSqAlpha == 0, 0.0, cosSigma - 2 * sinU1 * sinU2 / cosSqAlpha)
+			C = f / 16 * cosSqAlpha * (4 + f * (4 - 3 * cosSqAlpha))
+			lamPrev = lam
+			lam = L + (1 - C) * f * sinAlpha * (sigma + C * sinSigma * (cos2SigmaM + C * cosSigma * (-1 + 2 * cos2SigmaM ** 2)))
+			converged = np.abs(lam - lamPrev) < 1e-12
+			if (converged.all()):
+				break
+
+		uSq = cosSqAlpha * (a * a - b * b) / (b * b)
+		A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+		B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+		deltaSigma = B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma * (-1 + 2 * cos2SigmaM ** 2) - B / 6 * cos2SigmaM * (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2)))
+		distMeters = b * A * (sigma - deltaSigma)
+
+	# Vincenty does not converge for nearly antipodal points; fall back to geopy for those
+	if (not converged.all()):
+		distMeters = np.array(distMeters, dtype=float)
+		for i in np.argwhere(~converged):
+			i = tuple(i)
+			distMeters[i] = geoDistance2D([lats1[i], lons1[i]], [lats2[i], lons2[i]])
+
+	return distMeters
+
+def geoSimplifyPath(path, toleranceMeters):
+	"""
+	Simplify a path with the Douglas-Peucker algorithm.  Points are projected onto a local (equirectangular) plane, which is accurate for the short, road-scale distances between shapepoints.  The first and last points are always kept.
+
+	Parameters
+	----------
+	path: list of lists
+		A list of coordinates that form a path. In format of [[lat, lon], [lat, lon], ...] or [[lat, lon, alt], [lat, lon, alt], ...]
+	toleranceMeters: float
+		The maximum distance, in meters, between a dropped point and the simplified path.
+
+	Return
+	------
+	list
+		The (increasing) indices of the points in `path` that are kept.
+	"""
+
+	latlon = np.array([[loc[0], loc[1]] for loc in path], dtype=float)
+	if (len(latlon) <= 2):
+		return list(range(len(latlon)))
+
+	lat0 = np.radians(latlon[:, 0].mean())
+	x = np.radians(latlon[:, 1] - latlon[0, 1]) * math.cos(lat0) * VRV_CONST_RADIUS_OF_EARTH
+	y = np.radians(latlon[:, 0] - latlon[0, 0]) * VRV_CONST_RADIUS_OF_EARTH
+
+	keep = np.zeros(len(latlon), dtype=bool)
+	keep[0] = True
+	keep[-1] = True
+
+	stack = [(0, len(latlon) - 1)]
+	while (len(stack) > 0):
+		[first, last] = stack.pop()
+		if (last - first < 2):
+			continue
+
+		# Distance from each intermediate point to the segment [first, last]
+		dx = x[last] - x[first]
+		dy = y[last] - y[first]
+		px = x[first + 1:last] - x[first]
+		py = y[first + 1:last] - y[first]
+		segLenSq = dx * dx + dy * dy
+		if (segLenSq > 0):
+			t = np.clip((px * dx + py * dy) / segLenSq, 0.0, 1.0)
+		else:
+			t = np.zeros(len(px))
+		dist = np.hypot(px - t * dx, py - t * dy)
+
+		i = int(np.argmax(dist))
+		if (dist[i] > toleranceMeters):
+			index = first + 1 + i
+			keep[index] = True
+			stack.append((first, index))
+			stack.append((index, last))
+
+	return np.flatnonzero(keep).tolist()
+
+def geoSimplifyTrajectory(times, lats, lons, alts, toleranceMeters):
+	"""
+	Simplify a time-stamped trajectory with the Douglas-Peucker algorithm, using the synchronized (time-aware) distance.  A sample is dropped only if the position obtained by interpolating linearly in time between the kept samples around it is within `toleranceMeters` of the sample, so both the shape and the timing of the trajectory are preserved.  The first and last samples are always kept.
+
+	Parameters
+	----------
+	times: array-like
+		The (non-decreasing) times of the samples, in seconds.
+	lats: array-like
+		The latitudes of the samples.
+	lons: array-like
+		The longitudes of the samples.
+	alts: array-like
+		The altitudes of the samples, in meters.
+	toleranceMeters: float
+		The maximum distance, in meters, between a dropped sample and the interpolated position at the same time.
+
+	Return
+	------
+	list
+		The (increasing) indices of the samples that are kept.
+	"""
+
+	t = np.asarray(times, dtype=float)
+	if (len(t) <= 2):
+		return list(range(len(t)))
+
+	lats = np.asarray(lats, dtype=float)
+	lons = np.asarray(lons, dtype=float)
+	lat0 = np.radians(lats.mean())
+	xyz = np.column_stack([
+		np.radians(lons - lons[0]) * math.cos(lat0) * VRV_CONST_RADIUS_OF_EARTH,
+		np.radians(lats - lats[0]) * VRV_CONST_RADIUS_OF_EARTH,
+		np.asarray(alts, dtype=float)])
+
+	keep = np.zeros(len(t), dtype=bool)
+	keep[0] = True
+	keep[-1] = True
+
+	stack = [(0, len(t) - 1)]
+	while (len(stack) > 0):
+		[first, last] = stack.pop()
+		if (last - first < 2):
+			continue
+
+		# Distance from each intermediate sample to the interpolated position at its time
+		duration = t[last] - t[first]
+		if (duration > 0):
+			fraction = (t[first + 1:last] - t[first]) / duration
+		else:
+			fraction = np.zeros(last - first - 1)
+		interpolated = xyz[first] + fraction[:, None] * (xyz[last] - xyz[first])
+		dist = np.linalg.norm(xyz[first + 1:last] - interpolated, axis=1)
+
+		i = int(np.argmax(dist))
+		if (dist[i] > toleranceMeters):
+			index = first + 1 + i
+			keep[index] = True
+			stack.append((first, index))
+			stack.append((index, last))
+
+	return np.flatnonzero(keep).tolist()
+
+def geoPointInDistance2DArray(loc, directions, distMeters):
+	"""
+	Vectorized version of `geoPointInDistance2D()`.  Uses Vincenty's direct formula on the WGS-84 ellipsoid to find the locations at the given directions and distances from a single starting location.
+
+	Parameters
+	----------
+	loc: list
+		The coordinate of the current coordinate, in [lat, lon] format
+	directions: array-like
+		The directions, range [0, 360] in degree, 0 means North, 90 means East
+	distMeters: array-like
+		The distances between current point and the points we need.  Negative distances point in the opposite direction.
+
+	Returns
+	-------
+	numpy array
+		An n x 2 array of locations, in [lat, lon] form.
+	"""
+
+	a = VRV_CONST_WGS84_SEMI_MAJOR_AXIS
+	f = VRV_CONST_WGS84_FLATTENING
+	b = (1 - f) * a
+
+	[alpha1, s] = np.broadcast_arrays(
+		np.atleast_1d(np.radians(np.asarray(directions, dtype=float))), 
+		np.atleast_1d(np.asarray(distMeters, dtype=float)))
+
+	sinAlpha1 = np.sin(alpha1)
+	cosAlpha1 = np.cos(alpha1)
+	tanU1 = (1 - f) * math.tan(math.radians(loc[0]))
+	cosU1 = 1 / math.sqrt(1 + tanU1 ** 2)
+	sinU1 = tanU1 * cosU1
+	sigma1 = np.arctan2(tanU1, cosAlpha1)
+	sinAlpha = cosU1 * sinAlpha1
+	cosSqAlpha = 1 - sinAlpha ** 2
+	uSq = cosSqAlpha * (a * a - b * b) / (b * b)
+	A = 1 + uSq / 16384 * (4096 + uSq * (-768 + uSq * (320 - 175 * uSq)))
+	B = uSq / 1024 * (256 + uSq * (-128 + uSq * (74 - 47 * uSq)))
+
+	sigma = s / (b * A)
+	for i in range(200):
+		cos2SigmaM = np.cos(2 * sigma1 + sigma)
+		sinSigma = np.sin(sigma)
+		cosSigma = np.cos(sigma)
+		deltaSigma = B * sinSigma * (cos2SigmaM + B / 4 * (cosSigma * (-1 + 2 * cos2SigmaM ** 2) - B / 6 * cos2SigmaM * (-3 + 4 * sinSigma ** 2) * (-3 + 4 * cos2SigmaM ** 2)))
+		sigmaPrev = sigma
+		sigma = s / (b * A) + deltaSigma
+		if (np.all(np.abs(sigma - sigmaPrev) < 1e-12)):
+			break
+
+	cos2SigmaM = np.cos(2 * sigma1 + sigma)
+	sinSigma = np.sin(sigma)
+	cosSigma = np.cos(sigma)
+	tmp = sinU1 * sinSigma - cosU1 * cosSigma * cosAlpha1
+	lat2 = np.arctan2(sinU1 * cosSigma + cosU1 * sinSigma * cosAlpha1, (1 - f) * np.sqrt(sinAlpha ** 2 + tmp ** 2))
+	lam = np.arctan2(sinSigma * sinAlpha1, cosU1 * cosSigma - sinU1 * sinSigma * cosAlpha1)
+	C = f / 16 * cosSqAlpha * (4 + f * (4 - 3 * cosSqAlpha))
+	L = lam - (1 - C) * f * sinAlpha * (sigma + C * sinSigma * (cos2SigmaM + C * cosSigma * (-1 + 2 * cos2SigmaM ** 2)))
+	lon2 = (loc[1] + np.degrees(L) + 180) % 360 - 180
+
+	return np.column_stack([np.degrees(lat2), lon2])
+
+def geoIsPointInPolyArray(lats, lons, poly):
+	"""
+	Vectorized version of `geoIsPointInPoly()`.  Points that are along the perimeter of the polygon (including vertices) are considered to be "inside".
+
+	Parameters
+	----------
+	lats: array-like
+		Latitudes of the points
+	lons: array-like
+		Longitudes of the points
+	poly: list of lists
+		The polygon to check if the points are inside, in [[lat, lon], [lat, lon], ..., [lat, lon]] format
+
+	Returns
+	-------
+	numpy array
+		A boolean array, True for each point inside the polygon.
+	"""
+
+	y = np.asarray(lats, dtype=float)
+	x = np.asarray(lons, dtype=float)
+	polyArray = np.asarray([[p[0], p[1]] for p in poly], dtype=float)
+
+	inside = np.zeros(y.shape, dtype=bool)
+	isVertex = np.zeros(y.shape, dtype=bool)
+	j = len(polyArray) - 1
+	with np.errstate(divide='ignore', invalid='ignore'):
+		for i in range(len(polyArray)):
+			[yi, xi] = polyArray[i]
+			[yj, xj] = polyArray[j]
+			intersect = ((yi > y) != (yj > y)) & (x < (xj - xi) * (y - yi) / (yj - yi) + xi)
+			inside ^= intersect
+			isVertex |= (y == yi) & (x == xi)
+			j = i
+
+	return inside | isVertex
@@ -2,24 +2,32 @@ from veroviz._common import *
 
 from veroviz._queryPgRouting import pgrGetShapepointsTimeDist
 from veroviz._queryMapQuest import mqGetShapepointsTimeDist
+from veroviz._queryMapQuest import mqGetShapepointsTimeDistSeq
 from veroviz._queryOSRM import osrmGetShapepointsTimeDist
+from veroviz._queryOSRM import osrmGetShapepointsTimeDistSeq
 from veroviz._queryORS import orsGetShapepointsTimeDist
+from veroviz._queryORS import orsGetShapepointsTimeDistSeq
 
 from veroviz._internal import distributeTimeDist
-from veroviz._internal import locs2Dict
+from veroviz._internal import locs2Array
 from veroviz._internal import loc2Dict
 from veroviz._internal import replaceBackslashToSlash
 
 from veroviz._buildFlightProfile import buildNoLoiteringFlight
 from veroviz._buildFlightProfile import getTimeDistFromFlight
 from veroviz._buildFlightProfile import addLoiterTimeToFlight
+from veroviz._buildFlightProfile import buildNoLoiteringFlightArrays
+from veroviz._buildFlightProfile import addLoiterTimeToFlightArrays
 
 from veroviz._geometry import geoDistance2D
+from veroviz._geometry import geoSimplifyPath
 
 from veroviz.utilities import convertDistance
 from veroviz.utilities import initDataframe
 
-def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, endLoc=None, startTimeSec=0.0, expDurationSec=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None):
+def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, endLoc=None, startTimeSec=0.0, expDurationSec=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None, simplifyToleranceMeters=None, shapepointsTimeDist=None):
+
+	# `shapepointsTimeDist` is an optional [path, time, dist] for this leg, already fetched from the data provider (see `privGetShapepointsTimeDistSeq()`)
 
 	# Replace backslash
 	modelFile = replaceBackslashToSlash(modelFile)
@@ -35,7 +43,9 @@ def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, e
 		pass
 			
 	if (startLoc != endLoc):
-		if (routeType == 'euclidean2d'):
+		if (shapepointsTimeDist is not None):
+			[path, time, dist] = shapepointsTimeDist
+		elif (routeType == 'euclidean2d'):
 			[path, time, dist] = _eucGetShapepointsTimeDist(startLoc, endLoc, speedMPS, expDurationSec)
 		elif (routeType == 'manhattan'):
 			[path, time, dist] = _manGetShapepointsTimeDist(startLoc, endLoc, speedMPS, expDurationSec)
@@ -63,11 +73,8 @@ def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, e
 		if (distDes >= VRV_DEFAULT_DISTANCE_ERROR_TOLERANCE): # Go back to 10m after testing
 			print("Message: The destination point (lat: %s, lon: %s) is %.1f meters away from the road. You might find a gap between destination point and the route." % (endLoc[0], endLoc[1], distDes))
 
-		# convert distance to accumulated distance
-		accDist = []
-		accDist.append(0)
-		for i in range(1, len(dist)):
-			accDist.append(accDist[i - 1] + dist[i])
+		# total distance along the path (0 for a one-point path)
+		totalDist = float(np.sum(np.asarray(dist, dtype=float)[1:]))
 
 		# If `expDurationSec` is provided, override `speedMPS` and datasource, otherwise, if `speedMPS` is provided, override datasource
 		if (expDurationSec != None):
@@ -75,49 +82,49 @@ def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, e
 			time = newTime
 			dist = newDist
 		elif (speedMPS != None and expDurationSec == None):
-			newExpDurationSec = accDist[len(accDist) - 1] / speedMPS
+			newExpDurationSec = totalDist / speedMPS
 			[newTime, newDist] = distributeTimeDist(path, newExpDurationSec)
 			time = newTime
 			dist = newDist
 
 		# convert time to accumulated time
-		accTime = []
-		accTime.append(startTimeSec)
-		for i in range(1, len(dist)):
-			accTime.append(accTime[i - 1] + time[i])
+		accTime = np.empty(len(path))
+		accTime[0] = startTimeSec
+		accTime[1:] = startTimeSec + np.cumsum(np.asarray(time, dtype=float)[1:len(path)])
 
-		# For maintainability, convert locs into dictionary
-		dicPath = locs2Dict(path)
+		locsArray = locs2Array(path)
 
-		# shapepoint dataframe
-		assignments = initDataframe('Assignments')
+		# Drop near-collinear shapepoints.  The kept shapepoints keep their original (accumulated) timestamps, so the arrival time at every kept shapepoint, and the total travel time, are unchanged
+		if (simplifyToleranceMeters is not None):
+			keepIndex = geoSimplifyPath(path, simplifyToleranceMeters)
+			locsArray = locsArray[keepIndex]
+			accTime = accTime[keepIndex]
 
-		# generate assignments
-		for i in range(1, len(path)):
-			assignments = assignments.append({
-				'odID' : odID,
-				'objectID' : objectID, 
-				'modelFile' : modelFile,
-				'startTimeSec' : accTime[i - 1],
-				'startLat' : dicPath[i - 1]['lat'],
-				'startLon' : dicPath[i - 1]['lon'],
-				'startAltMeters' : dicPath[i - 1]['alt'],
-				'endTimeSec' : accTime[i],
-				'endLat' : dicPath[i]['lat'],
-				'endLon' : dicPath[i]['lon'],
-				'endAltMeters' : dicPath[i]['alt'],
-				'leafletColor' : leafletColor,
-				'leafletWeight' : leafletWeight,
-				'leafletStyle' : leafletStyle,
-				'useArrows' : useArrows,
-				'leafletOpacity' : leafletOpacity,
-				'modelScale' : modelScale,
-				'modelMinPxSize' : modelMinPxSize,
-				'cesiumColor' : cesiumColor,
-				'cesiumWeight' : cesiumWeight,
-				'cesiumStyle' : cesiumStyle,
-				'cesiumOpacity' : cesiumOpacity
-				}, ignore_index=True)
+		# generate assignments, one row for each pair of consecutive shapepoints
+		assignments = pd.DataFrame({
+			'odID' : odID,
+			'objectID' : objectID, 
+			'modelFile' : modelFile,
+			'startTimeSec' : accTime[:-1],
+			'startLat' : locsArray[:-1, 0],
+			'startLon' : locsArray[:-1, 1],
+			'startAltMeters' : locsArray[:-1, 2],
+			'endTimeSec' : accTime[1:],
+			'endLat' : locsArray[1:, 0],
+			'endLon' : locsArray[1:, 1],
+			'endAltMeters' : locsArray[1:, 2],
+			'leafletColor' : leafletColor,
+			'leafletWeight' : leafletWeight,
+			'leafletStyle' : leafletStyle,
+			'useArrows' : useArrows,
+			'leafletOpacity' : leafletOpacity,
+			'modelScale' : modelScale,
+			'modelMinPxSize' : modelMinPxSize,
+			'cesiumColor' : cesiumColor,
+			'cesiumWeight' : cesiumWeight,
+			'cesiumStyle' : cesiumStyle,
+			'cesiumOpacity' : cesiumOpacity
+			}, index=np.arange(len(locsArray) - 1)).reindex(columns=assignmentsColumnList)
 	else:
 		# For maintainability, convert locs into dictionary
 		dicStartLoc = loc2Dict(startLoc)
@@ -151,6 +158,53 @@ def privGetShapepoints2D(odID=1, objectID=None, modelFile=None, startLoc=None, e
 	return assignments
 
 
+def privGetShapepointsTimeDistSeq(locs, routeType='euclidean2D', dataProvider=None, dataProviderArgs=None):
+	"""
+	Gets the shapepoints of every leg of a route through a sequence of locations.  OSRM, ORS and MapQuest route through many locations in one request, so the sequence is sent in chunks of at most `VRV_SETTING_<provider>_MAXWAYPOINTS` locations, instead of one request per leg.
+
+	Returns a list with one [path, time, dist] for each consecutive pair of locations, to be passed to `privGetShapepoints2D()` as `shapepointsTimeDist`.  An entry is None if that leg should be handled by `privGetShapepoints2D()` on its own (e.g., the two locations are the same, the route type is not served by an online data provider, or the request failed).
+	"""
+
+	numLegs = len(locs) - 1
+	seqShapepoints = [None] * numLegs
+
+	try:
+		dataProvider = dataProviderDictionary[dataProvider.lower()]
+	except:
+		return seqShapepoints
+
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	if (routeType == 'fastest' and dataProvider == 'osrm-online'):
+		getSeq = lambda chunkLocs: osrmGetShapepointsTimeDistSeq(chunkLocs)
+		maxWaypoints = VRV_SETTING_OSRM_MAXWAYPOINTS
+	elif (routeType in ['fastest', 'shortest', 'pedestrian'] and dataProvider == 'mapquest'):
+		getSeq = lambda chunkLocs: mqGetShapepointsTimeDistSeq(chunkLocs, routeType, dataProviderArgs['APIkey'])
+		maxWaypoints = VRV_SETTING_MAPQUEST_MAXWAYPOINTS
+	elif (routeType in ['fastest', 'pedestrian', 'cycling', 'truck'] and dataProvider == 'ors-online'):
+		getSeq = lambda chunkLocs: orsGetShapepointsTimeDistSeq(chunkLocs, routeType, dataProviderArgs['APIkey'])
+		maxWaypoints = VRV_SETTING_ORS_MAXWAYPOINTS
+	else:
+		return seqShapepoints
+
+	# Route through the distinct stops only; stop j arrives by leg `stops[j] - 1` of the sequence
+	stops = [0] + [i + 1 for i in range(0, numLegs) if (locs[i + 1] != locs[i])]
+
+	# Consecutive chunks share one stop, so that no leg is left out
+	for first in range(0, len(stops) - 1, maxWaypoints - 1):
+		chunk = stops[first:first + maxWaypoints]
+		chunkShapepoints = getSeq([locs[k] for k in chunk])
+		if (chunkShapepoints is None):
+			continue
+		for j in range(0, len(chunk) - 1):
+			seqShapepoints[chunk[j + 1] - 1] = chunkShapepoints[j]
+
+	return seqShapepoints
+
+
 def privGetShapepoints3D(odID=1, objectID=None, modelFile=None, startTimeSec=0.0, startLoc=None, endLoc=None, takeoffSpeedMPS=None, cruiseSpeedMPS=None, landSpeedMPS=None, cruiseAltMetersAGL=None, routeType='square', climbRateMPS=None, descentRateMPS=None, earliestLandTime=-1, loiterPosition='arrivalAtAlt', leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY):
 
 	# Replace backslash
@@ -232,6 +286,84 @@ def privGetShapepoints3D(odID=1, objectID=None, modelFile=None, startTimeSec=0.0
 	return assignments
 
 
+def privGetShapepoints3DBatch(odID=1, objectID=None, modelFile=None, startTimeSec=0.0, startLocs=None, endLocs=None, takeoffSpeedMPS=None, cruiseSpeedMPS=None, landSpeedMPS=None, cruiseAltMetersAGL=None, routeType='square', climbRateMPS=None, descentRateMPS=None, earliestLandTime=-1, loiterPosition='arrivalAtAlt', leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY):
+
+	# Sortie i gets odID + i; the rows it generates are the same as `privGetShapepoints3D()` would return for it
+	numSorties = len(startLocs)
+
+	startLocs = locs2Array(startLocs)
+	endLocs = locs2Array(endLocs)
+
+	def _perSortie(value):
+		if (value is None):
+			return np.full(numSorties, np.nan)
+		return np.broadcast_to(np.asarray(value, dtype=float), (numSorties,))
+
+	startTimeSec = _perSortie(startTimeSec)
+	earliestLandTime = _perSortie(earliestLandTime)
+
+	# Generate flight profiles without loitering
+	flight = buildNoLoiteringFlightArrays(routeType, startLocs, _perSortie(cruiseAltMetersAGL), endLocs, _perSortie(takeoffSpeedMPS), _perSortie(climbRateMPS), _perSortie(cruiseSpeedMPS), _perSortie(landSpeedMPS), _perSortie(descentRateMPS))
+
+	# Calculate loiter time
+	totalTime = flight['timeFromPreviousPosition'].sum(axis=1)
+	remainLoiterTime = np.where(earliestLandTime - startTimeSec > totalTime, earliestLandTime - startTimeSec - totalTime, 0.0)
+
+	# Add loiter given loiter position
+	flight = addLoiterTimeToFlightArrays(flight, routeType, loiterPosition, remainLoiterTime)
+
+	# Each sortie has 6 candidate rows: travel into waypoint j followed by loitering at waypoint j, for j = 1, 2, 3
+	prv = [0, 1, 2]
+	cur = [1, 2, 3]
+	def _interleave(travel, loiter):
+		return np.stack([travel, loiter], axis=2).reshape(numSorties, 6)
+
+	keep = _interleave(flight['isWaypoint'][:, cur], flight['isWaypoint'][:, cur] & (flight['loiterTime'][:, cur] != 0)).ravel()
+
+	columns = {
+		'startTimeSec': _interleave(flight['pathEndTimeSec'][:, prv], flight['pathStartTimeSec'][:, cur]) + startTimeSec[:, None],
+		'startLat': _interleave(flight['lat'][:, prv], flight['lat'][:, cur]),
+		'startLon': _interleave(flight['lon'][:, prv], flight['lon'][:, cur]),
+		'startAltMeters': _interleave(flight['altAGL'][:, prv], flight['altAGL'][:, cur]),
+		'endTimeSec': _interleave(flight['pathStartTimeSec'][:, cur], flight['pathEndTimeSec'][:, cur]) + startTimeSec[:, None],
+		'endLat': _interleave(flight['lat'][:, cur], flight['lat'][:, cur]),
+		'endLon': _interleave(flight['lon'][:, cur], flight['lon'][:, cur]),
+		'endAltMeters': _interleave(flight['altAGL'][:, cur], flight['altAGL'][:, cur])
+	}
+	for col in columns:
+		columns[col] = columns[col].ravel()[keep]
+
+	# Sortie index of each remaining row, used to spread the per-sortie columns
+	sortieIndex = np.repeat(np.arange(numSorties), 6)[keep]
+
+	columns['odID'] = odID + sortieIndex
+	if (type(objectID) is list):
+		columns['objectID'] = np.asarray(objectID, dtype=object)[sortieIndex]
+	else:
+		columns['objectID'] = objectID
+	if (type(modelFile) is list):
+		columns['modelFile'] = np.asarray([replaceBackslashToSlash(m) for m in modelFile], dtype=object)[sortieIndex]
+	else:
+		columns['modelFile'] = replaceBackslashToSlash(modelFile)
+
+	columns['modelScale'] = modelScale
+	columns['modelMinPxSize'] = modelMinPxSize
+	columns['leafletColor'] = leafletColor
+	columns['leafletWeight'] = leafletWeight
+	columns['leafletStyle'] = leafletStyle
+	columns['leafletOpacity'] = leafletOpacity
+	columns['useArrows'] = useArrows
+	columns['cesiumColor'] = cesiumColor
+	columns['cesiumWeight'] = cesiumWeight
+	columns['cesiumStyle'] = cesiumStyle
+	columns['cesiumOpacity'] = cesiumOpacity
+
+	# Build assignments dataframe
+	assignments = pd.DataFrame(columns, index=np.arange(len(sortieIndex))).reindex(columns=assignmentsColumnList)
+
+	return assignments
+
+
 def _eucGetShapepointsTimeDist(startLoc, endLoc, speedMPS, expDurationSec):
 	path = [startLoc, endLoc]
 	dist = [0, geoDistance2D(startLoc, endLoc)]
@@ -7,6 +7,8 @@ from veroviz._queryOSRM import osrmGetSnapToRoadLatLon
 from veroviz._queryMapQuest import mqGetSnapToRoadLatLon
 from veroviz._queryMapQuest import mqGetSnapToRoadLatLonBatch
 
+from veroviz._internal import uniqueLocs
+
 def privGetSnapLocBatch(locs=None, dataProvider=None, dataProviderArgs=None):
 
 	"""
@@ -31,6 +33,10 @@ def privGetSnapLocBatch(locs=None, dataProvider=None, dataProviderArgs=None):
 		dataProvider = dataProvider.lower()
 	except:
 		pass
+
+	# Snap each unique location once, then copy the snapped locations back to all of the repeated locations
+	allLocs = locs
+	[locs, inverse] = uniqueLocs(allLocs)
 		
 	# snap nodes based on different data providers
 	snapLocs = []
@@ -60,9 +66,11 @@ def privGetSnapLocBatch(locs=None, dataProvider=None, dataProviderArgs=None):
 			snapLoc = orsGetSnapToRoadLatLon(locs[i], APIkey)
 			snapLocs.append(snapLoc)
 
-	for i in range(len(locs)):
-		if (len(locs[i]) == 3):
-			snapLocs[i] = [snapLocs[i][0], snapLocs[i][1], locs[i][2]]
+	snapLocs = [list(snapLocs[k]) if (snapLocs[k] is not None) else None for k in inverse]
+
+	for i in range(len(allLocs)):
+		if (len(allLocs[i]) == 3):
+			snapLocs[i] = [snapLocs[i][0], snapLocs[i][1], allLocs[i][2]]
 	
 	return snapLocs
 
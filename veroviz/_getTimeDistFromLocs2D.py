@@ -6,15 +6,18 @@ from veroviz.utilities import convertTime
 from veroviz._geometry import geoDistance2D
 from veroviz._internal import locs2Dict
 from veroviz._internal import loc2Dict
+from veroviz._internal import uniqueLocs
 
 from veroviz._queryPgRouting import pgrGetTimeDist
 from veroviz._queryORS import orsGetTimeDistAll2All
 from veroviz._queryORS import orsGetTimeDistMany2One
 from veroviz._queryORS import orsGetTimeDistOne2Many
+from veroviz._queryORS import orsGetTimeDistMany2Many
 from veroviz._queryOSRM import osrmGetTimeDist
 from veroviz._queryMapQuest import mqGetTimeDistAll2All
 from veroviz._queryMapQuest import mqGetTimeDistMany2One
 from veroviz._queryMapQuest import mqGetTimeDistOne2Many
+from veroviz._queryMapQuest import mqGetTimeDistMany2Many
 
 def getTimeDistFromLocs2D(fromLocs=None, fromRows=None, toLocs=None, toCols=None, outputDistUnits='meters', outputTimeUnits='seconds', routeType='euclidean2d', speedMPS=None, dataProvider=None, dataProviderArgs=None):
 
@@ -28,6 +31,10 @@ def getTimeDistFromLocs2D(fromLocs=None, fromRows=None, toLocs=None, toCols=None
 	except:
 		pass
 
+	# Query each unique location once (e.g., a depot shared by many routes, or many orders at one address); the results are copied back to all of the repeated locations below
+	[fromLocs, fromIndex] = uniqueLocs(fromLocs)
+	[toLocs, toIndex] = uniqueLocs(toLocs)
+
 	# Do queries to find DICTIONARIES of distance and time matrices
 	distMeters = {}
 	timeSecs = {}
@@ -52,10 +59,12 @@ def getTimeDistFromLocs2D(fromLocs=None, fromRows=None, toLocs=None, toCols=None
 	# Rename the keyvalues by fromRows and toCols and reset output units
 	dist = {}
 	time = {}
+	distFactor = convertDistance(1.0, 'm', outputDistUnits)
+	timeFactor = convertTime(1.0, 's', outputTimeUnits)
 	for i in range(len(fromRows)):
 		for j in range(len(toCols)):
-			dist[fromRows[i], toCols[j]] = distMeters[i, j] * convertDistance(1.0, 'm', outputDistUnits)
-			time[fromRows[i], toCols[j]] = timeSecs[i, j] * convertTime(1.0, 's', outputTimeUnits)
+			dist[fromRows[i], toCols[j]] = distMeters[fromIndex[i], toIndex[j]] * distFactor
+			time[fromRows[i], toCols[j]] = timeSecs[fromIndex[i], toIndex[j]] * timeFactor
 
 	return [time, dist]
 
@@ -223,11 +232,7 @@ def _getTimeDistMapQuest(fromLocs, toLocs, travelMode, APIkey, speedMPS):
 		toLoc = toLocs[0]
 		[timeSecs, distMeters] = mqGetTimeDistMany2One(fromLocs, toLoc, travelMode, APIkey)
 	else:
-		for i in range(len(fromLocs)):
-			[timeRow, distRow] = mqGetTimeDistOne2Many(fromLocs[i], toLocs, routeType, APIkey)
-			for j in range(len(toLocs)):
-				distMeters[i, j] = distRow[0, j]
-				timeSecs[i, j] = timeRow[0, j]
+		[timeSecs, distMeters] = mqGetTimeDistMany2Many(fromLocs, toLocs, travelMode, APIkey)
 
 	if (speedMPS != None):
 		for i in range(len(fromLocs)):
@@ -272,11 +277,7 @@ def _getTimeDistORS(fromLocs, toLocs, travelMode, APIkey, speedMPS):
 		toLoc = toLocs[0]
 		[timeSecs, distMeters] = orsGetTimeDistMany2One(fromLocs, toLoc, travelMode, APIkey)
 	else:
-		for i in range(len(fromLocs)):
-			[timeRow, distRow] = orsGetTimeDistOne2Many(fromLocs[i], toLocs, routeType, APIkey)
-			for j in range(len(toLocs)):
-				distMeters[i, j] = distRow[0, j]
-				timeSecs[i, j] = timeRow[0, j]
+		[timeSecs, distMeters] = orsGetTimeDistMany2Many(fromLocs, toLocs, travelMode, APIkey)
 
 	if (speedMPS != None):
 		for i in range(len(fromLocs)):
@@ -1,5 +1,6 @@
 from veroviz._common import *
 from veroviz._geometry import geoDistance2D
+from veroviz._geometry import geoDistance2DArray
 
 def distributeTimeDist(path, totalTime):
 	"""
@@ -20,21 +21,99 @@ def distributeTimeDist(path, totalTime):
 		Distance between neighboring coordinates in meters.
 	"""
 
-	timeSecs = []
-	distMeters = []
-	totalDistMeters = 0
-	distMeters.append(0)
-	timeSecs.append(0)
-	for i in range(1, len(path)):
-		d = geoDistance2D(path[i - 1], path[i])
-		distMeters.append(d)
-		totalDistMeters += d
+	locsArray = locs2Array(path)
+	distMeters = np.zeros(len(locsArray))
+	distMeters[1:] = geoDistance2DArray(locsArray[:-1, 0], locsArray[:-1, 1], locsArray[1:, 0], locsArray[1:, 1])
+	timeSecs = np.zeros(len(locsArray))
+	totalDist = distMeters.sum()
+	if (totalDist > 0):
+		timeSecs[1:] = totalTime * distMeters[1:] / totalDist
+	elif (len(locsArray) > 1):
+		# All of the locations are the same (e.g., two locations snapped to the same road point); share the time evenly
+		timeSecs[1:] = totalTime / (len(locsArray) - 1)
 
-	for i in range(1, len(path)):
-		timeSecs.append(totalTime * float(distMeters[i]) / float(totalDistMeters))
+	timeSecs = timeSecs.tolist()
+	distMeters = distMeters.tolist()
 
 	return [timeSecs, distMeters]
 
+def distributeTimeDistBySteps(path, stepWayPoints, stepDurations):
+	"""
+	Gives time stamps for a series of coordinates, when the data provider reports the duration of groups of consecutive shapepoints (e.g., the steps of an ORS route).  Within each step, the duration is distributed based on the distance between neighboring coordinates, as in `distributeTimeDist()`.
+
+	Parameters
+	----------
+	path: list of lists
+		A path that consist a list of locations as shapepoints/waypoints, in the form of [[lat, lon], [lat, lon], ..., [lat, lon]].
+	stepWayPoints: list of lists
+		The [first, last] indices (in `path`) of the shapepoints of each step.  Consecutive steps share a shapepoint.
+	stepDurations: list
+		The duration of each step, in seconds.
+
+	Returns
+	-------
+	timeSecs: list
+		A list of time stamps, those time stamps are not accumulative in seconds.
+	distMeters: list
+		Distance between neighboring coordinates in meters.
+	"""
+
+	locsArray = locs2Array(path)
+	distMeters = np.zeros(len(locsArray))
+	distMeters[1:] = geoDistance2DArray(locsArray[:-1, 0], locsArray[:-1, 1], locsArray[1:, 0], locsArray[1:, 1])
+
+	# The segments of each step, identified by the index of the shapepoint at their end
+	stepWayPoints = np.asarray(stepWayPoints, dtype=int).reshape(-1, 2)
+	stepDurations = np.asarray(stepDurations, dtype=float)
+	numSegments = np.maximum(stepWayPoints[:, 1] - stepWayPoints[:, 0], 0)
+	segmentStep = np.repeat(np.arange(len(stepWayPoints)), numSegments)
+	segmentEnd = np.arange(len(segmentStep)) - np.repeat(np.cumsum(numSegments) - numSegments, numSegments) + np.repeat(stepWayPoints[:, 0], numSegments) + 1
+
+	# Share of each segment in the duration of its step; zero-length steps are shared evenly
+	stepDist = np.bincount(segmentStep, weights=distMeters[segmentEnd], minlength=len(stepWayPoints))
+	with np.errstate(divide='ignore', invalid='ignore'):
+		share = np.where(stepDist[segmentStep] > 0, distMeters[segmentEnd] / stepDist[segmentStep], 1.0 / numSegments[segmentStep])
+
+	timeSecs = np.zeros(len(locsArray))
+	timeSecs[segmentEnd] = stepDurations[segmentStep] * share
+
+	return [timeSecs.tolist(), distMeters.tolist()]
+
+def decodePolyline(encoded, precision=5):
+	"""
+	Decodes an encoded polyline (the format used by ORS, by OSRM with `geometries=polyline`/`polyline6`, and by MapQuest with `shapeFormat=cmp`/`cmp6`), without a loop over the characters.
+
+	Parameters
+	----------
+	encoded: string
+		The encoded polyline.
+	precision: int, Optional, default as 5
+		The number of decimal places of the encoded coordinates (5 for ORS and OSRM's `polyline`; 6 for OSRM's `polyline6` and MapQuest's `cmp6`).
+
+	Return
+	------
+	numpy array
+		An n x 2 array of locations, in [lat, lon] form.
+	"""
+
+	chars = np.frombuffer(encoded.encode('ascii'), dtype=np.uint8).astype(np.int64) - 63
+	if (len(chars) == 0):
+		return np.zeros((0, 2))
+
+	# Each value is a run of 5-bit chunks, least significant first; the last chunk of a value is < 0x20
+	isLastChunk = (chars < 0x20)
+	valueIndex = np.concatenate([[0], np.cumsum(isLastChunk)[:-1]])
+	valueStart = np.flatnonzero(np.concatenate([[True], isLastChunk[:-1]]))
+	chunkShift = 5 * (np.arange(len(chars)) - valueStart[valueIndex])
+	values = np.zeros(len(valueStart), dtype=np.int64)
+	np.add.at(values, valueIndex, (chars & 0x1f) << chunkShift)
+
+	# Undo the zig-zag encoding of signed deltas, then accumulate
+	deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+	locs = np.cumsum(deltas[0:(len(deltas) // 2) * 2].reshape(-1, 2), axis=0) / (10.0 ** precision)
+
+	return locs
+
 def randomPick(coefficients):
 	"""
 	Given a list of coefficients, randomly return an index according to that coefficient. e.g., [10, 20, 30, 20, 20] will have 30% chances returns '2' (the third index)
@@ -114,6 +193,100 @@ def locs2Dict(locs):
 
 	return locsDict
 
+def locs2Array(locs):
+	"""
+	Convert a list of locs into an n x 3 numpy array of [lat, lon, alt], for vectorized calculations.
+
+	Parameters
+	----------
+	locs: list of lists
+		A list of location, in format of [[lat, lon], [lat, lon], ...] or [[lat, lon, alt], [lat, lon, alt], ...]
+
+	Return
+	------
+	numpy array
+		An n x 3 array of locations.  Missing altitudes are 0.
+	"""
+
+	try:
+		locsArray = np.asarray(locs, dtype=float)
+	except ValueError:
+		locsArray = None
+
+	if (locsArray is None or locsArray.ndim != 2):
+		# A mix of [lat, lon] and [lat, lon, alt]
+		locsArray = np.zeros((len(locs), 3))
+		for i in range(len(locs)):
+			locsArray[i, 0:len(locs[i])] = locs[i]
+	elif (locsArray.shape[1] == 2):
+		locsArray = np.column_stack([locsArray, np.zeros(len(locsArray))])
+
+	return locsArray
+
+def uniqueLocs(locs, decimals=6):
+	"""
+	Collapse a list of locs to the unique [lat, lon] locations, so that data providers are queried once per location.  Locations are grouped with a hash map keyed by [lat, lon] rounded to `decimals` decimal places (6 decimal places is about 0.1 meters); altitudes are ignored.
+
+	Parameters
+	----------
+	locs: list of lists
+		A list of location, in format of [[lat, lon], [lat, lon], ...] or [[lat, lon, alt], [lat, lon, alt], ...]
+	decimals: int
+		Locations that are the same when rounded to this many decimal places are grouped together
+
+	Return
+	------
+	list of lists
+		The first location of each group, in the order of first appearance
+	numpy array
+		The index, in the list of unique locations, of each location in `locs`.  That is, `locs[i]` is grouped with `unique[inverse[i]]`.
+	"""
+
+	unique = []
+	uniqueIndex = {}
+	inverse = np.empty(len(locs), dtype=int)
+	for i in range(len(locs)):
+		key = (round(locs[i][0], decimals), round(locs[i][1], decimals))
+		index = uniqueIndex.get(key)
+		if (index is None):
+			index = len(unique)
+			uniqueIndex[key] = index
+			unique.append(locs[i])
+		inverse[i] = index
+
+	return [unique, inverse]
+
+def nodeIDs2Locs(nodes, nodeIDs, includeAlt=False):
+	"""
+	Look up the locations of a sequence of node IDs in a :ref:`Nodes` dataframe.  The 'id' column is indexed once, so that every ID is resolved by a hash lookup rather than a scan of the whole dataframe.
+
+	Parameters
+	----------
+	nodes: :ref:`Nodes`
+		A :ref:`Nodes` dataframe that contains every ID in `nodeIDs`; a ValueError naming the missing IDs is raised otherwise.
+	nodeIDs: list
+		A list of node IDs, which may contain repeats.
+	includeAlt: boolean, Optional, default as False
+		If True, the locations are in [lat, lon, alt] format, using the 'altMeters' column; otherwise [lat, lon].
+
+	Return
+	------
+	list of lists
+		The location of each node ID, in the same order as `nodeIDs`.  If an ID appears more than once in `nodes`, its first row is used.
+	"""
+
+	columns = ['lat', 'lon', 'altMeters'] if (includeAlt) else ['lat', 'lon']
+
+	firstRows = np.flatnonzero(~nodes['id'].duplicated().values)
+	idIndex = pd.Index(nodes['id'].values[firstRows])
+	indexer = idIndex.get_indexer(list(nodeIDs))
+	if ((indexer < 0).any()):
+		missingIDs = list(dict.fromkeys(np.asarray(list(nodeIDs), dtype=object)[indexer < 0].tolist()))
+		raise ValueError("'nodes' dataframe does not contain a node with `id` in %s." % (missingIDs))
+	rows = firstRows[indexer]
+
+	return nodes[columns].values[rows].astype(float).tolist()
+
 def areaOfTriangle(loc1, loc2, loc3):
 	"""
 	Calculates the area of triangle defined by three locations
@@ -175,6 +348,18 @@ def addHeadSlash(originStr):
 		
 	return originStr
 
+def addHeadSlashToModelFiles(assignments):
+	"""
+	Add a head slash to every 'modelFile' of an assignments dataframe (in place) that does not have one.
+	"""
+
+	modelFiles = assignments['modelFile']
+	needSlash = modelFiles.notnull() & ~modelFiles.astype(str).str.startswith('/')
+	if (needSlash.any()):
+		assignments.loc[needSlash, 'modelFile'] = '/' + modelFiles[needSlash].astype(str)
+
+	return
+
 def addTailSlash(originStr):
 	if (originStr is not None):
 		tailChar = originStr[-1]
@@ -191,3 +376,121 @@ def replaceBackslashToSlash(path):
 	if (path is not None):
 		path = path.replace("\\", "/")
 	return path
+
+def isBinaryDataFile(filename):
+	"""
+	Check if a file name has a Parquet ('.parquet', '.pq') or Feather ('.feather') extension.  Other files are treated as .csv files.
+	"""
+
+	return os.path.splitext(filename)[1].lower() in ['.parquet', '.pq', '.feather']
+
+# Schema metadata key that lists the columns stored as JSON text in Parquet/Feather files
+_BINARY_JSONCOLUMNS_KEY = b'veroviz.jsonColumns'
+
+def _jsonValue(value):
+	if (isinstance(value, np.generic)):
+		value = value.item()
+
+	return json.dumps(value, default=str)
+
+def writeBinaryDataframe(dataframe, filename):
+	"""
+	Write a dataframe to a Parquet or Feather file (chosen by the file extension).  Requires the `pyarrow` package.
+
+	Arrow columns hold one type, so object columns that mix types (e.g., 'leafletIconText' with both node ids and text labels) are stored as JSON text.  These columns are listed in the file's metadata, and `readBinaryDataframe()` converts them back.
+	"""
+
+	isFeather = (os.path.splitext(filename)[1].lower() == '.feather')
+	if (isFeather):
+		# Feather files do not store the index
+		dataframe = dataframe.reset_index(drop=True)
+
+	jsonColumns = []
+	for col in dataframe.columns:
+		if (dataframe[col].dtype == object and len(set([type(value) for value in dataframe[col].values if value is not None])) > 1):
+			jsonColumns.append(col)
+	if (len(jsonColumns) > 0):
+		dataframe = dataframe.copy()
+		for col in jsonColumns:
+			dataframe[col] = [None if (value is None) else _jsonValue(value) for value in dataframe[col].values]
+
+	table = pyarrow.Table.from_pandas(dataframe, preserve_index=(False if (isFeather) else None))
+	metadata = dict(table.schema.metadata or {})
+	metadata[_BINARY_JSONCOLUMNS_KEY] = json.dumps(jsonColumns)
+	table = table.replace_schema_metadata(metadata)
+
+	if (isFeather):
+		pyarrow.feather.write_feather(table, filename)
+	else:
+		pyarrow.parquet.write_table(table, filename)
+
+	return
+
+def readBinaryDataframe(filename, columns=None):
+	"""
+	Read a dataframe from a Parquet or Feather file (chosen by the file extension).  Only the given `columns` are read, if provided.  Requires the `pyarrow` package.
+	"""
+
+	if (os.path.splitext(filename)[1].lower() == '.feather'):
+		table = pyarrow.feather.read_table(filename, columns=columns)
+	else:
+		table = pyarrow.parquet.read_table(filename, columns=columns, use_pandas_metadata=True)
+
+	dataframe = table.to_pandas()
+
+	# Restore the mixed-type columns that `writeBinaryDataframe()` stored as JSON text
+	metadata = table.schema.metadata if (table.schema.metadata is not None) else {}
+	if (_BINARY_JSONCOLUMNS_KEY in metadata):
+		for col in json.loads(metadata[_BINARY_JSONCOLUMNS_KEY]):
+			if (col in dataframe.columns):
+				dataframe[col] = pd.Series([None if (value is None) else json.loads(value) for value in dataframe[col].values], index=dataframe.index, dtype=object)
+
+	return dataframe
+
+def matrixDict2LongDataframe(dictionary):
+	"""
+	Convert a time/distance matrix dictionary into a dataframe with one row per (from, to) pair, in columns 'fromID', 'toID' and 'value'.  Unlike the square dataframe from `convertMatricesDictionaryToDataframe()`, this works for any number of locations and can be stored as Parquet/Feather.
+	"""
+
+	keys = list(dictionary.keys())
+	dataframe = pd.DataFrame({
+		'fromID': [key[0] for key in keys],
+		'toID': [key[1] for key in keys],
+		'value': list(dictionary.values())
+		})
+
+	return dataframe
+
+def longDataframe2MatrixDict(dataframe):
+	"""
+	Convert a dataframe from `matrixDict2LongDataframe()` back into a time/distance matrix dictionary.
+	"""
+
+	dictionary = dict(zip(zip(dataframe['fromID'].tolist(), dataframe['toID'].tolist()), dataframe['value'].tolist()))
+
+	return dictionary
+
+def matrixStoreFile(path, matrixName):
+	"""
+	The .npy file that holds one matrix (e.g., 'time' or 'dist') of a matrix store directory.
+	"""
+
+	return os.path.join(path, '%s.npy' % (matrixName))
+
+def matrixStoreIndex(path):
+	"""
+	Load the ids of a matrix store as a pandas Index, for looking up row/column positions from ids.
+	"""
+
+	return pd.Index(np.load(os.path.join(path, 'ids.npy'), allow_pickle=False))
+
+def matrixStorePositions(index, ids):
+	"""
+	Row/column positions of `ids` in a matrix store.  Returns None if any id is not in the store.
+	"""
+
+	positions = index.get_indexer(np.asarray(ids))
+	if (np.any(positions < 0)):
+		return None
+
+	return positions
@@ -1,3 +1,5 @@
+import os as _os
+
 # Const for distance unit changing
 VRV_CONST_METERS_PER_KILOMETER = 1000.0
 VRV_CONST_METERS_PER_MILE = 1609.34
@@ -31,6 +33,10 @@ VRV_DEFAULT_DISTANCE_ERROR_TOLERANCE = 10 # [meters]
 # Standard const
 VRV_CONST_RADIUS_OF_EARTH = 6378100.0	# [meters]
 
+# WGS-84 ellipsoid (the same model used by geopy's geodesic distance)
+VRV_CONST_WGS84_SEMI_MAJOR_AXIS = 6378137.0	# [meters]
+VRV_CONST_WGS84_FLATTENING = 1 / 298.257223563
+
 # Default Setting for leaflet
 VRV_DEFAULT_LEAFLETICONPREFIX = 'glyphicon'
 VRV_DEFAULT_LEAFLETICONTYPE = 'info-sign'
@@ -59,6 +65,9 @@ VRV_DEFAULT_CESIUMPATHWEIGHT = 3
 VRV_DEFAULT_CESIUMPATHSTYLE = 'solid'
 VRV_DEFAULT_CESIUMPATHOPACITY = 0.8
 VRV_DEFAULT_LEAFLET_ARROWSIZE = 6
+
+# Matrix stores
+VRV_DEFAULT_MATRIXSTORE_CHUNKROWS = 1000	# rows of a matrix store held in memory at once
 # Global Setting
 VRV_SETTING_PGROUTING_USERNAME = 'user'
 VRV_SETTING_PGROUTING_HOST = 'localhost'
@@ -67,6 +76,39 @@ VRV_SETTING_PGROUTING_PASSWORD = ''
 VRV_SETTING_SHOWOUTPUTMESSAGE = True
 VRV_SETTING_SHOWWARNINGMESSAGE = True
 
+# Base URLs of the online data providers.  Each can be overridden with an 
+# environment variable (e.g., to point veroviz at a self-hosted OSRM server, 
+# or at the offline stand-in server in veroviz/_providerStandIn.py)
+VRV_SETTING_OSRM_BASEURL = _os.environ.get('VEROVIZ_OSRM_BASEURL', 'http://router.project-osrm.org').rstrip('/')
+VRV_SETTING_ORS_BASEURL = _os.environ.get('VEROVIZ_ORS_BASEURL', 'https://api.openrouteservice.org').rstrip('/')
+VRV_SETTING_MAPQUEST_BASEURL = _os.environ.get('VEROVIZ_MAPQUEST_BASEURL', 'http://www.mapquestapi.com').rstrip('/')
+
+# Most locations sent in one multi-waypoint route request; longer sequences 
+# of locations are split into chunks that share their end locations
+VRV_SETTING_OSRM_MAXWAYPOINTS = 100
+VRV_SETTING_ORS_MAXWAYPOINTS = 50
+VRV_SETTING_MAPQUEST_MAXWAYPOINTS = 25
+
+# Rectangular (many-to-many) travel matrices are split into blocks of up to 
+# VRV_SETTING_ORS_MATRIXBLOCKSIZE sources x destinations per ORS request; 
+# at most VRV_SETTING_MATRIX_MAXWORKERS blocks are requested at once
+VRV_SETTING_ORS_MATRIXBLOCKSIZE = 50
+VRV_SETTING_MATRIX_MAXWORKERS = 4
+
+# Batch geocoding (`geocodeBatch()` and `reverseGeocodeBatch()`)
+VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS = 4	# concurrent requests to the data provider
+VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE = 100	# most locations in one MapQuest batch geocoding request
+VRV_DEFAULT_NOMINATIM_REQUESTSPERSEC = 1.0	# Nominatim's usage policy allows at most 1 request per second
+VRV_DEFAULT_ORS_GEOCODE_REQUESTSPERSEC = 1.5	# ORS's standard plan allows 100 geocoding requests per minute
+VRV_DEFAULT_MAPQUEST_GEOCODE_REQUESTSPERSEC = 5.0
+
+# Input validation: 'full' checks everything; 'fast' skips the row-by-row 
+# checks of nodes/arcs/assignments dataframes (e.g., lat/lon ranges); 'off' 
+# skips validation entirely (for trusted inputs only).  Set it with the 
+# VEROVIZ_VALIDATION environment variable, or at runtime by assigning 
+# veroviz._params.VRV_SETTING_VALIDATION; any other value means 'full'
+VRV_SETTING_VALIDATION = _os.environ.get('VEROVIZ_VALIDATION', 'full').strip().lower()
+
 # For validation
 
 nodesColumnList = [
@@ -273,9 +315,9 @@ matrixTypeList = [
 nodeDistribList = [
 	"uniformBB", 
 	"normalBB", 
-	"normal"
-	# "unifRoadBasedBB" 
-] # Removed 'unifRoadBasedBB' for v.0.2.0
+	"normal", 
+	"unifRoadBasedBB"
+]
 
 cesiumIconTypeList = [
 	'pin'
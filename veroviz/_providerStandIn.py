@@ -0,0 +1,496 @@
+"""
+An offline stand-in for the OSRM, ORS, and MapQuest web APIs, for load testing and CI without network access or API quotas.
+
+The stand-in answers the same requests that veroviz sends to the real providers (nearest/route/table for OSRM; directions/matrix/geocode for ORS; route/routematrix/geocoding for MapQuest), with responses computed from straight-line geometry at a constant speed.  It can add latency and return errors at a given rate, so that retries, caching, and concurrency of the query layer can be exercised under controlled load.
+
+Start it from the command line:
+
+	python -m veroviz._providerStandIn --port 8989 --latency 0.05 --errorRate 0.01
+
+then point veroviz at it before importing veroviz:
+
+	export VEROVIZ_OSRM_BASEURL=http://localhost:8989
+	export VEROVIZ_ORS_BASEURL=http://localhost:8989
+	export VEROVIZ_MAPQUEST_BASEURL=http://localhost:8989
+
+or, in-process, use `startProviderStandIn()` and `useProviderStandIn(server.baseURL)`.  All three providers are served from the same port, since their request paths do not overlap.  API keys are accepted but ignored.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+from urllib.parse import parse_qs
+from urllib.parse import unquote
+from urllib.parse import urlsplit
+
+VRV_STANDIN_SPEED_MPS = 15.0
+VRV_STANDIN_SHAPEPOINTS_PER_LEG = 20
+VRV_STANDIN_SNAP_OFFSET_DEG = 1e-5
+VRV_STANDIN_GEOCODE_CENTER = [42.886, -78.878]	# [lat, lon], geocoded text lands within +/- 0.5 degrees of here
+VRV_STANDIN_METERS_PER_MILE = 1609.34
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+	daemon_threads = True
+
+def standInDistMeters(lon1, lat1, lon2, lat2):
+	# Equirectangular approximation, good enough for synthetic responses
+	x = math.radians(lon2 - lon1) * math.cos(math.radians((lat1 + lat2) / 2.0))
+	y = math.radians(lat2 - lat1)
+
+	return 6378100.0 * math.sqrt(x * x + y * y)
+
+def standInLeg(lonLat1, lonLat2, numPoints=VRV_STANDIN_SHAPEPOINTS_PER_LEG):
+	"""
+	Returns the straight-line shapepoints (as [lon, lat]), distance [meters], and duration [seconds] of one leg.
+	"""
+
+	[lon1, lat1] = lonLat1[0:2]
+	[lon2, lat2] = lonLat2[0:2]
+	dist = standInDistMeters(lon1, lat1, lon2, lat2)
+	points = [[lon1 + (lon2 - lon1) * k / (numPoints - 1), lat1 + (lat2 - lat1) * k / (numPoints - 1)] for k in range(numPoints)]
+
+	return [points, dist, dist / VRV_STANDIN_SPEED_MPS]
+
+def encodePolyline(lonLats, precision=5):
+	"""
+	Encodes [lon, lat] points as an encoded polyline (which stores [lat, lon] pairs), as ORS, OSRM (`geometries=polyline`/`polyline6`), and MapQuest (`shapeFormat=cmp`/`cmp6`) return them.
+	"""
+
+	chars = []
+	[prevLat, prevLon] = [0, 0]
+	for lonLat in lonLats:
+		[lat, lon] = [int(round(lonLat[1] * 10 ** precision)), int(round(lonLat[0] * 10 ** precision))]
+		for delta in [lat - prevLat, lon - prevLon]:
+			value = ~(delta << 1) if (delta < 0) else (delta << 1)
+			while (value >= 0x20):
+				chars.append(chr((0x20 | (value & 0x1f)) + 63))
+				value >>= 5
+			chars.append(chr(value + 63))
+		[prevLat, prevLon] = [lat, lon]
+
+	return ''.join(chars)
+
+def _textToLonLat(text):
+	digest = hashlib.md5(text.strip().lower().encode('utf-8')).digest()
+	lat = VRV_STANDIN_GEOCODE_CENTER[0] + (digest[0] * 256 + digest[1]) / 65535.0 - 0.5
+	lon = VRV_STANDIN_GEOCODE_CENTER[1] + (digest[2] * 256 + digest[3]) / 65535.0 - 0.5
+
+	return [lon, lat]
+
+def _standInAddress(lonLat):
+	houseNumber = int(abs(lonLat[0] * 1e4 + lonLat[1] * 1e4)) % 9999 + 1
+
+	return {
+		'label': '%d Stand-in Street, Buffalo, NY, USA' % (houseNumber),
+		'housenumber': str(houseNumber),
+		'street': 'Stand-in Street',
+		'locality': 'Buffalo',
+		'region': 'New York',
+		'country': 'United States'
+	}
+
+def _parseLonLats(text):
+	return [[float(value) for value in coord.split(',')] for coord in text.split(';') if coord != '']
+
+def _parseIndexes(query, name, default):
+	if (name not in query or query[name][0] == 'all'):
+		return default
+
+	return [int(i) for i in query[name][0].split(';')]
+
+def _mqParseLatLngs(text):
+	# MapQuest's `json` parameter is not strict JSON (keys are not quoted)
+	return [[float(lng), float(lat)] for (lat, lng) in re.findall(r'lat\s*:\s*(-?[\d.]+)\s*,\s*lng\s*:\s*(-?[\d.]+)', text)]
+
+def _osrmNearest(coords, query):
+	[lon, lat] = coords[0][0:2]
+
+	return {
+		'code': 'Ok',
+		'waypoints': [{'location': [lon + VRV_STANDIN_SNAP_OFFSET_DEG, lat + VRV_STANDIN_SNAP_OFFSET_DEG], 'distance': 1.0, 'name': 'Stand-in Street'}]
+	}
+
+def _osrmRoute(coords, query):
+	legs = []
+	geometry = []
+	totalDist = 0.0
+	totalTime = 0.0
+	for i in range(len(coords) - 1):
+		[points, dist, duration] = standInLeg(coords[i], coords[i + 1])
+		geometry += points if (len(geometry) == 0) else points[1:]
+		legs.append({
+			'distance': dist,
+			'duration': duration,
+			'steps': [{
+				'distance': dist,
+				'duration': duration,
+				'intersections': [{'location': point} for point in points]
+			}] if (query.get('steps', ['false'])[0] == 'true') else []
+		})
+		if ('annotations' in query):
+			segmentDists = [standInDistMeters(points[k][0], points[k][1], points[k + 1][0], points[k + 1][1]) for k in range(len(points) - 1)]
+			legs[-1]['annotation'] = {
+				'distance': segmentDists,
+				'duration': [segmentDist / VRV_STANDIN_SPEED_MPS for segmentDist in segmentDists]
+			}
+		totalDist += dist
+		totalTime += duration
+
+	route = {'distance': totalDist, 'duration': totalTime, 'legs': legs}
+	if (query.get('overview', ['simplified'])[0] != 'false'):
+		geometries = query.get('geometries', ['polyline'])[0]
+		if (geometries == 'geojson'):
+			route['geometry'] = {'type': 'LineString', 'coordinates': geometry}
+		else:
+			route['geometry'] = encodePolyline(geometry, 6 if (geometries == 'polyline6') else 5)
+
+	return {
+		'code': 'Ok',
+		'routes': [route],
+		'waypoints': [{'location': coord[0:2]} for coord in coords]
+	}
+
+def _osrmTable(coords, query):
+	sources = _parseIndexes(query, 'sources', list(range(len(coords))))
+	destinations = _parseIndexes(query, 'destinations', list(range(len(coords))))
+	distances = [[standInDistMeters(coords[i][0], coords[i][1], coords[j][0], coords[j][1]) for j in destinations] for i in sources]
+
+	return {
+		'code': 'Ok',
+		'durations': [[dist / VRV_STANDIN_SPEED_MPS for dist in row] for row in distances],
+		'distances': distances
+	}
+
+def _orsDirections(coords, responseFormat='geojson'):
+	path = []
+	steps = []
+	totalDist = 0.0
+	totalTime = 0.0
+	for i in range(len(coords) - 1):
+		[points, dist, duration] = standInLeg(coords[i], coords[i + 1])
+		firstWayPoint = max(0, len(path) - 1)
+		path += points if (len(path) == 0) else points[1:]
+		steps.append({'distance': dist, 'duration': duration, 'way_points': [firstWayPoint, len(path) - 1]})
+		totalDist += dist
+		totalTime += duration
+
+	properties = {
+		'segments': [{'distance': step['distance'], 'duration': step['duration'], 'steps': [step]} for step in steps],
+		'summary': {'distance': totalDist, 'duration': totalTime},
+		'way_points': [step['way_points'][0] for step in steps] + [len(path) - 1]
+	}
+
+	if (responseFormat == 'json'):
+		return {'routes': [dict(properties, geometry=encodePolyline(path, 5))]}
+
+	return {
+		'type': 'FeatureCollection',
+		'features': [{
+			'type': 'Feature',
+			'geometry': {'type': 'LineString', 'coordinates': path},
+			'properties': properties
+		}]
+	}
+
+def _orsMatrix(body):
+	locations = body['locations']
+	sources = body.get('sources', list(range(len(locations))))
+	destinations = body.get('destinations', list(range(len(locations))))
+	distances = [[standInDistMeters(locations[i][0], locations[i][1], locations[j][0], locations[j][1]) for j in destinations] for i in sources]
+
+	return {
+		'durations': [[dist / VRV_STANDIN_SPEED_MPS for dist in row] for row in distances],
+		'distances': distances
+	}
+
+def _orsGeocodeFeature(lonLat):
+	return {
+		'type': 'FeatureCollection',
+		'features': [{
+			'type': 'Feature',
+			'geometry': {'type': 'Point', 'coordinates': lonLat},
+			'properties': _standInAddress(lonLat)
+		}]
+	}
+
+def _mqLocation(lonLat):
+	address = _standInAddress(lonLat)
+
+	return {
+		'latLng': {'lat': lonLat[1], 'lng': lonLat[0]},
+		'street': '%s %s' % (address['housenumber'], address['street']),
+		'adminArea5': address['locality'],
+		'adminArea3': 'NY',
+		'adminArea1': 'US'
+	}
+
+def _mqRoute(coords, query):
+	shapePoints = []
+	maneuverIndexes = []
+	legs = []
+	totalDist = 0.0
+	totalTime = 0.0
+	for i in range(len(coords) - 1):
+		[points, dist, duration] = standInLeg(coords[i], coords[i + 1])
+		maneuverIndexes.append(len(shapePoints) // 2)
+		for point in (points if (len(shapePoints) == 0) else points[1:]):
+			shapePoints += [point[1], point[0]]
+		legs.append({'distance': dist / VRV_STANDIN_METERS_PER_MILE, 'time': int(round(duration))})
+		totalDist += dist
+		totalTime += duration
+
+	return {
+		'info': {'statuscode': 0, 'messages': []},
+		'route': {
+			'distance': totalDist / VRV_STANDIN_METERS_PER_MILE,
+			'time': int(round(totalTime)),
+			'realTime': int(round(totalTime)),
+			'legs': legs,
+			'shape': {
+				'shapePoints': encodePolyline([[shapePoints[k + 1], shapePoints[k]] for k in range(0, len(shapePoints), 2)], int(query['shapeFormat'][0][3:] or 5)) if (query.get('shapeFormat', ['raw'])[0].startswith('cmp')) else shapePoints,
+				'maneuverIndexes': maneuverIndexes,
+				'legIndexes': [max(0, index - 1) for index in maneuverIndexes] + [len(shapePoints) // 2 - 1]
+			}
+		}
+	}
+
+def _mqRouteMatrix(coords, text):
+	# Times in seconds, distances in miles, as MapQuest returns them
+	def row(i, targets):
+		return [standInDistMeters(coords[i][0], coords[i][1], coords[j][0], coords[j][1]) for j in targets]
+
+	if ('all2All:true' in text.replace(' ', '')):
+		distances = [row(i, range(len(coords))) for i in range(len(coords))]
+		return {
+			'info': {'statuscode': 0, 'messages': []},
+			'distance': [[dist / VRV_STANDIN_METERS_PER_MILE for dist in distRow] for distRow in distances],
+			'time': [[int(round(dist / VRV_STANDIN_SPEED_MPS)) for dist in distRow] for distRow in distances]
+		}
+
+	# oneToMany and manyToOne both measure from/to the first location
+	distances = row(0, range(len(coords)))
+
+	return {
+		'info': {'statuscode': 0, 'messages': []},
+		'distance': [dist / VRV_STANDIN_METERS_PER_MILE for dist in distances],
+		'time': [int(round(dist / VRV_STANDIN_SPEED_MPS)) for dist in distances]
+	}
+
+def standInResponse(method, url, body=None):
+	"""
+	Computes the stand-in response to one provider request.
+
+	Parameters
+	----------
+	method: string
+		The HTTP method, 'GET' or 'POST'.
+	url: string
+		The request URL; only the path and query are used.
+	body: bytes or string, Optional
+		The request body (for ORS matrix requests).
+
+	Returns
+	-------
+	int
+		The HTTP status code.
+	dictionary
+		The JSON-serializable response body.
+	"""
+
+	parsedUrl = urlsplit(url)
+	path = unquote(parsedUrl.path)
+	query = parse_qs(parsedUrl.query)
+	parts = path.strip('/').split('/')
+
+	if (isinstance(body, bytes)):
+		body = body.decode('utf-8')
+
+	try:
+		# OSRM: /{service}/v1/{profile}/{coordinates}
+		if (len(parts) == 4 and parts[0] in ['nearest', 'route', 'table'] and parts[1] == 'v1'):
+			coords = _parseLonLats(parts[3])
+			if (parts[0] == 'nearest'):
+				return [200, _osrmNearest(coords, query)]
+			elif (parts[0] == 'route'):
+				return [200, _osrmRoute(coords, query)]
+			else:
+				return [200, _osrmTable(coords, query)]
+
+		# ORS
+		if (parts[0:2] == ['v2', 'directions'] and len(parts) >= 3):
+			if (method == 'POST'):
+				coords = json.loads(body)['coordinates']
+			else:
+				coords = _parseLonLats(query['start'][0]) + _parseLonLats(query['end'][0])
+			return [200, _orsDirections(coords, parts[3] if (len(parts) == 4) else 'geojson')]
+		if (parts[0:2] == ['v2', 'matrix'] and len(parts) == 3):
+			return [200, _orsMatrix(json.loads(body))]
+		if (parts == ['geocode', 'search']):
+			return [200, _orsGeocodeFeature(_textToLonLat(query['text'][0]))]
+		if (parts == ['geocode', 'reverse']):
+			lonLat = [float(query['point.lon'][0]) + VRV_STANDIN_SNAP_OFFSET_DEG, float(query['point.lat'][0]) + VRV_STANDIN_SNAP_OFFSET_DEG]
+			return [200, _orsGeocodeFeature(lonLat)]
+
+		# MapQuest
+		if (parts == ['directions', 'v2', 'route']):
+			coords = []
+			for location in query['from'] + query['to']:
+				[lat, lon] = [float(value) for value in location.split(',')[0:2]]
+				coords.append([lon, lat])
+			return [200, _mqRoute(coords, query)]
+		if (parts == ['directions', 'v2', 'routematrix']):
+			text = query['json'][0] if ('json' in query) else body
+			return [200, _mqRouteMatrix(_mqParseLatLngs(text), text)]
+		if (parts[0:2] == ['geocoding', 'v1'] and len(parts) == 3):
+			if (parts[2] == 'address'):
+				lonLats = [_textToLonLat(query['location'][0])]
+			else:
+				# 'batch' and 'reverse' both snap [lat, lon] locations; 'batch' also geocodes text
+				lonLats = []
+				for location in query['location']:
+					try:
+						[lat, lon] = [float(value) for value in location.split(',')[0:2]]
+						lonLats.append([lon + VRV_STANDIN_SNAP_OFFSET_DEG, lat + VRV_STANDIN_SNAP_OFFSET_DEG])
+					except ValueError:
+						if (parts[2] != 'batch'):
+							raise
+						lonLats.append(_textToLonLat(location))
+			return [200, {
+				'info': {'statuscode': 0, 'messages': []},
+				'results': [{'locations': [_mqLocation(lonLat)]} for lonLat in lonLats]
+			}]
+	except (KeyError, IndexError, ValueError) as e:
+		return [400, {'error': 'Bad request: %s' % (e)}]
+
+	return [404, {'error': 'The stand-in server does not handle %s %s' % (method, path)}]
+
+class _StandInHandler(BaseHTTPRequestHandler):
+	protocol_version = 'HTTP/1.1'
+
+	def _respond(self, method):
+		body = None
+		if ('Content-Length' in self.headers):
+			body = self.rfile.read(int(self.headers['Content-Length']))
+
+		server = self.server
+		if (server.latencySec > 0 or server.latencyJitterSec > 0):
+			time.sleep(server.latencySec + server.random.uniform(0, server.latencyJitterSec))
+
+		with server.lock:
+			server.requestCount += 1
+			injectError = (server.random.random() < server.errorRate)
+
+		if (injectError):
+			[status, data] = [server.errorStatus, {'error': 'Injected error'}]
+		else:
+			[status, data] = standInResponse(method, self.path, body)
+
+		encoded = json.dumps(data).encode('utf-8')
+		self.send_response(status)
+		self.send_header('Content-Type', 'application/json')
+		self.send_header('Content-Length', str(len(encoded)))
+		self.end_headers()
+		self.wfile.write(encoded)
+
+	def do_GET(self):
+		self._respond('GET')
+
+	def do_POST(self):
+		self._respond('POST')
+
+	def log_message(self, format, *args):
+		if (self.server.verbose):
+			BaseHTTPRequestHandler.log_message(self, format, *args)
+
+def startProviderStandIn(host='localhost', port=0, latencySec=0.0, latencyJitterSec=0.0, errorRate=0.0, errorStatus=503, seed=None, verbose=False):
+	"""
+	Starts the stand-in server on a background thread.
+
+	Parameters
+	----------
+	host: string, Optional, default as 'localhost'
+		The interface to listen on.
+	port: int, Optional, default as 0
+		The port to listen on; 0 picks a free port.
+	latencySec: float, Optional, default as 0.0
+		Delay added to every response [seconds].
+	latencyJitterSec: float, Optional, default as 0.0
+		Extra random delay, uniform in [0, latencyJitterSec], added to every response [seconds].
+	errorRate: float in [0, 1], Optional, default as 0.0
+		The fraction of requests answered with `errorStatus` instead of a result.
+	errorStatus: int, Optional, default as 503
+		The HTTP status code of injected errors (e.g., 429 to mimic rate limiting).
+	seed: int, Optional, default as None
+		Seeds the latency jitter and error injection, for repeatable runs.
+	verbose: boolean, Optional, default as False
+		Log every request to stderr.
+
+	Returns
+	-------
+	ThreadingHTTPServer
+		The running server.  Its base URL is `server.baseURL`; stop it with `server.shutdown()`.
+	"""
+
+	server = ThreadingHTTPServer((host, port), _StandInHandler)
+	server.latencySec = latencySec
+	server.latencyJitterSec = latencyJitterSec
+	server.errorRate = errorRate
+	server.errorStatus = errorStatus
+	server.random = random.Random(seed)
+	server.verbose = verbose
+	server.lock = threading.Lock()
+	server.requestCount = 0
+	server.baseURL = 'http://%s:%s' % (host, server.server_address[1])
+
+	thread = threading.Thread(target=server.serve_forever)
+	thread.daemon = True
+	thread.start()
+
+	return server
+
+def useProviderStandIn(baseURL):
+	"""
+	Points the OSRM, ORS, and MapQuest queries of an already-imported veroviz at `baseURL` (e.g., `server.baseURL` of a running stand-in).  The `VEROVIZ_*_BASEURL` environment variables only take effect when veroviz is imported.
+	"""
+
+	import veroviz._queryOSRM
+	import veroviz._queryORS
+	import veroviz._queryMapQuest
+
+	veroviz._queryOSRM.VRV_SETTING_OSRM_BASEURL = baseURL.rstrip('/')
+	veroviz._queryORS.VRV_SETTING_ORS_BASEURL = baseURL.rstrip('/')
+	veroviz._queryMapQuest.VRV_SETTING_MAPQUEST_BASEURL = baseURL.rstrip('/')
+
+	return
+
+def main():
+	parser = argparse.ArgumentParser(description='Offline stand-in for the OSRM, ORS, and MapQuest web APIs.')
+	parser.add_argument('--host', default='localhost')
+	parser.add_argument('--port', type=int, default=8989)
+	parser.add_argument('--latency', type=float, default=0.0, help='delay added to every response [seconds]')
+	parser.add_argument('--jitter', type=float, default=0.0, help='extra random delay, up to this many seconds')
+	parser.add_argument('--errorRate', type=float, default=0.0, help='fraction of requests answered with an error')
+	parser.add_argument('--errorStatus', type=int, default=503, help='HTTP status of injected errors')
+	parser.add_argument('--seed', type=int, default=None)
+	parser.add_argument('--verbose', action='store_true')
+	args = parser.parse_args()
+
+	server = startProviderStandIn(host=args.host, port=args.port, latencySec=args.latency, latencyJitterSec=args.jitter, errorRate=args.errorRate, errorStatus=args.errorStatus, seed=args.seed, verbose=args.verbose)
+	print("Provider stand-in listening on %s" % (server.baseURL))
+	try:
+		while True:
+			time.sleep(3600)
+	except KeyboardInterrupt:
+		server.shutdown()
+
+if __name__ == '__main__':
+	main()
@@ -1,8 +1,13 @@
 from veroviz._common import *
 from veroviz._internal import distributeTimeDist
+from veroviz._internal import decodePolyline
 from veroviz._internal import locs2Dict
 from veroviz._internal import loc2Dict
 
+from urllib.parse import quote
+
+import concurrent.futures
+
 def mqGetSnapToRoadLatLon(loc, APIkey):
 	"""
 	A function to get snapped latlng for one coordinate using MapQuest
@@ -22,7 +27,7 @@ def mqGetSnapToRoadLatLon(loc, APIkey):
 
 	dicLoc = loc2Dict(loc)
 
-	snapToRoadUrl = ('http://www.mapquestapi.com/geocoding/v1/batch?key=%s&thumbMaps=false&outFormat=json&location=%s,%s') % (APIkey, dicLoc['lat'], dicLoc['lon'])
+	snapToRoadUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/batch?key=%s&thumbMaps=false&outFormat=json&location=%s,%s') % (APIkey, dicLoc['lat'], dicLoc['lon'])
 	data = []
 	try:
 		http = urllib3.PoolManager()
@@ -54,9 +59,10 @@ def mqGetSnapToRoadLatLonBatch(locs, APIkey):
 
 	maxBatchSize = 100
 	numBatches = int(math.ceil(len(locs) / float(maxBatchSize)))
-	snapToRoadUrlBase = ('http://www.mapquestapi.com/geocoding/v1/batch?key=%s&thumbMaps=false&outFormat=json') % (APIkey)
+	snapToRoadUrlBase = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/batch?key=%s&thumbMaps=false&outFormat=json') % (APIkey)
 
 	dicLocs = locs2Dict(locs)
+	snapLocs = []
 	
 	try:
 		for batch in range(0, numBatches):
@@ -69,7 +75,7 @@ def mqGetSnapToRoadLatLonBatch(locs, APIkey):
 			response = http.request('GET', snapToRoadUrl)
 			data = json.loads(response.data.decode('utf-8'))
 			
-			snapLocs = [[data['results'][j]['locations'][0]['latLng']['lat'], data['results'][j]['locations'][0]['latLng']['lng']] for j in range(0, len(data['results']))]
+			snapLocs += [[data['results'][j]['locations'][0]['latLng']['lat'], data['results'][j]['locations'][0]['latLng']['lng']] for j in range(0, len(data['results']))]
 	except:
 		print("Message: Unable to connect MapQuest, the most common causes are 1) that your computer isn't connected to the network; 2) an invalid key is provided.")
 
@@ -109,7 +115,7 @@ def mqGetShapepointsTimeDist(startLoc, endLoc, routeType='fastest', APIkey=None)
 	dicStartLoc = loc2Dict(startLoc)
 	dicEndLoc = loc2Dict(endLoc)
 
-	shapepointsUrl = ('http://www.mapquestapi.com/directions/v2/route?key=%s&from=%s,%s&to=%s,%s&fullShape=true&routeType=%s') % (
+	shapepointsUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/route?key=%s&from=%s,%s&to=%s,%s&fullShape=true&shapeFormat=cmp6&routeType=%s') % (
 		APIkey, 
 		dicStartLoc['lat'], 
 		dicStartLoc['lon'], 
@@ -123,19 +129,15 @@ def mqGetShapepointsTimeDist(startLoc, endLoc, routeType='fastest', APIkey=None)
 		response = http.request('GET', shapepointsUrl)
 		data = json.loads(response.data.decode('utf-8'))
 
-		path = []
-
 		totalTimeInSeconds = data['route']['time']
 
-		maneuverIndexes = data['route']['shape']['maneuverIndexes']
-		rawShapepoints = data['route']['shape']['shapePoints']
+		# With `shapeFormat=cmp6`, the shapepoints are an encoded polyline with 6 decimal places
+		rawShapepoints = decodePolyline(data['route']['shape']['shapePoints'], 6)
 
-		for i in range(int(len(rawShapepoints) / 2)):
-			if (len(path) > 0):
-				if (rawShapepoints[i * 2] != path[-1][0] and rawShapepoints[i * 2 + 1] != path[-1][1]):
-					path.append([rawShapepoints[i * 2], rawShapepoints[i * 2 + 1]])
-			else:
-				path.append([rawShapepoints[0], rawShapepoints[1]])
+		# Drop repeated shapepoints
+		isRepeated = np.zeros(len(rawShapepoints), dtype=bool)
+		isRepeated[1:] = (rawShapepoints[1:] == rawShapepoints[:-1]).all(axis=1)
+		path = rawShapepoints[~isRepeated].tolist()
 
 		[timeSecs, distMeters] = distributeTimeDist(path, totalTimeInSeconds)
 	except:
@@ -143,6 +145,71 @@ def mqGetShapepointsTimeDist(startLoc, endLoc, routeType='fastest', APIkey=None)
 
 	return [path, timeSecs, distMeters]
 
+def mqGetShapepointsTimeDistSeq(locs, routeType='fastest', APIkey=None):
+	"""
+	A function to get the shapepoints of every leg of a route through a sequence of locations, with one request
+
+	Parameters
+	----------
+
+	locs: list of lists, Required
+		A sequence of locations, the format of each is [lat, lon] (altitude, above sea level, set to be 0) or [lat, lon, alt].  Consecutive locations should be different.
+	routeType: string, Optional, default as 'fastest'
+		Route type of MapQuest query
+	APIkey: string, Required
+		Enables us to access to MapQuest server
+
+	Returns
+	-------
+	list
+		One [path, time, dist] for each consecutive pair of locations, in the same format as `mqGetShapepointsTimeDist()`.  None if the route could not be split into legs.
+	"""
+	
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	dicLocs = locs2Dict(locs)
+
+	shapepointsUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/route?key=%s&from=%s,%s%s&fullShape=true&shapeFormat=cmp6&routeType=%s') % (
+		APIkey, 
+		dicLocs[0]['lat'], 
+		dicLocs[0]['lon'], 
+		''.join(['&to=%s,%s' % (dicLoc['lat'], dicLoc['lon']) for dicLoc in dicLocs[1:]]), 
+		routeType)
+	legs = None
+	
+	try:
+		http = urllib3.PoolManager()
+		response = http.request('GET', shapepointsUrl)
+		data = json.loads(response.data.decode('utf-8'))
+
+		# With `shapeFormat=cmp6`, the shapepoints are an encoded polyline with 6 decimal places
+		rawShapepoints = decodePolyline(data['route']['shape']['shapePoints'], 6)
+
+		# `legIndexes` gives the first shapepoint of each leg; consecutive legs share the shapepoint at their common location
+		legIndexes = data['route']['shape']['legIndexes']
+		legs = []
+		for i in range(0, len(data['route']['legs'])):
+			lastIndex = legIndexes[i + 1] if (i + 1 < len(legIndexes)) else len(rawShapepoints) - 1
+			legShapepoints = rawShapepoints[legIndexes[i]:lastIndex + 1]
+
+			# Drop repeated shapepoints
+			isRepeated = np.zeros(len(legShapepoints), dtype=bool)
+			isRepeated[1:] = (legShapepoints[1:] == legShapepoints[:-1]).all(axis=1)
+			path = legShapepoints[~isRepeated].tolist()
+
+			[timeSecs, distMeters] = distributeTimeDist(path, data['route']['legs'][i]['time'])
+			legs.append([path, timeSecs, distMeters])
+
+		if (len(legs) != len(locs) - 1):
+			legs = None
+	except:
+		print("Message: Unable to connect MapQuest, the most common causes are 1) that your computer isn't connected to the network; 2) an invalid key is provided.")
+
+	return legs
+
 def mqGetTimeDistAll2All(locs, routeType='fastest', APIkey=None):
 	"""
 	A function to generate a distance and time matrice between given coordinates
@@ -177,7 +244,7 @@ def mqGetTimeDistAll2All(locs, routeType='fastest', APIkey=None):
 	try:
 		# If the number of coordinate is less than 25, query in one batch, if not, partition into n * one2many queries
 		if (len(locs) <= 0): # Should be 25, however, mapQuest stopped supporting all2all flag, don't know why and don't know when can be restored
-			all2AllUrl = ('http://www.mapquestapi.com/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
+			all2AllUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
 			for i in range(len(locs)):
 				all2AllUrl += ('{latLng:{lat:%s,lng:%s}},') % (locs[i][0], locs[i][1])
 			all2AllUrl = all2AllUrl[:-1]
@@ -231,7 +298,7 @@ def mqGetTimeDistOne2Many(fromLoc, toLocs, routeType='fastest', APIkey=None):
 
 	one2ManyBatchSize = 90 # < 100
 	numBatches = int(math.ceil(len(toLocs) / float(one2ManyBatchSize)))
-	one2ManyUrlBase = ('http://www.mapquestapi.com/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
+	one2ManyUrlBase = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
 
 	distMeters = {}
 	timeSecs = {}
@@ -293,7 +360,7 @@ def mqGetTimeDistMany2One(fromLocs, toLoc, routeType='fastest', APIkey=None):
 
 	many2OneBatchSize = 40 # < 50
 	numBatches = int(math.ceil(len(fromLocs) / float(many2OneBatchSize)))
-	many2OneUrlBase = ('http://www.mapquestapi.com/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
+	many2OneUrlBase = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
 
 	distMeters = {}
 	timeSecs = {}
@@ -328,6 +395,87 @@ def mqGetTimeDistMany2One(fromLocs, toLoc, routeType='fastest', APIkey=None):
 		print("Message: Unable to connect MapQuest, the most common causes are 1) that your computer isn't connected to the network; 2) an invalid key is provided.")
 
 	return [timeSecs, distMeters]
+
+
+def mqGetTimeDistMany2Many(fromLocs, toLocs, routeType='fastest', APIkey=None):
+	"""
+	A function to generate a distance and time matrice from a list of coordinates to another list of coordinates
+
+	Parameters
+	----------
+	fromLocs: list of lists
+		The format is [[lat1, lon1], [lat2, lon2], ...], a list of coordinates
+	toLocs: list of lists
+		The format is [[lat1, lon1], [lat2, lon2], ...], a list of coordinates
+	travelMode: string, {fastest, shortest, pedestrian}
+		MapQuest provides three different types of routing, including 'fastest', 'shortest' (for car) and 'pedestrian'
+	APIkey: string
+		Enables us to access to MapQuest server
+	
+	Returns
+	-------
+	time: dictionary
+		A len(fromLocs) x len(toLocs) matrix, which provides the traveling time from each origin to each destination, unit is in second
+	dist: dictionary
+		A len(fromLocs) x len(toLocs) matrix, which provides the distance from each origin to each destination, units is in meters
+
+	"""
+
+	one2ManyBatchSize = 90 # < 100
+	many2OneBatchSize = 40 # < 50
+
+	# MapQuest's route matrix has no sources/destinations option, so the matrix is tiled with one-to-many rows or many-to-one columns, whichever takes fewer requests
+	numRowRequests = len(fromLocs) * int(math.ceil(len(toLocs) / float(one2ManyBatchSize)))
+	numColRequests = len(toLocs) * int(math.ceil(len(fromLocs) / float(many2OneBatchSize)))
+	if (numRowRequests <= numColRequests):
+		tiles = [[i, j, 'oneToMany'] for i in range(0, len(fromLocs)) for j in range(0, len(toLocs), one2ManyBatchSize)]
+	else:
+		tiles = [[i, j, 'manyToOne'] for j in range(0, len(toLocs)) for i in range(0, len(fromLocs), many2OneBatchSize)]
+
+	distMeters = {}
+	timeSecs = {}
+
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	maxWorkers = max(1, min(VRV_SETTING_MATRIX_MAXWORKERS, len(tiles)))
+	http = urllib3.PoolManager(maxsize=maxWorkers)
+
+	def _requestTile(tile):
+		[i, j, option] = tile
+		if (option == 'oneToMany'):
+			# The first location is the origin
+			tileLocs = [fromLocs[i]] + toLocs[j:j + one2ManyBatchSize]
+		else:
+			# The first location is the destination
+			tileLocs = [toLocs[j]] + fromLocs[i:i + many2OneBatchSize]
+
+		tileUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/directions/v2/routematrix?key=%s&json={locations:[') % (APIkey)
+		tileUrl += ','.join([('{latLng:{lat:%s,lng:%s}}') % (loc[0], loc[1]) for loc in tileLocs])
+		tileUrl += ("],options:{%s:true,routeType:%s,doReverseGeocode:false}}") % (option, routeType)
+
+		response = http.request('GET', tileUrl)
+
+		return json.loads(response.data.decode('utf-8'))
+
+	try:
+		with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+			for ([i, j, option], data) in zip(tiles, executor.map(_requestTile, tiles)):
+				distBatch = data['distance']
+				timeBatch = data['time']
+				for k in range(1, len(distBatch)):
+					if (option == 'oneToMany'):
+						distMeters[i, j + k - 1] = distBatch[k] * VRV_CONST_METERS_PER_MILE
+						timeSecs[i, j + k - 1] = timeBatch[k]
+					else:
+						distMeters[i + k - 1, j] = distBatch[k] * VRV_CONST_METERS_PER_MILE
+						timeSecs[i + k - 1, j] = timeBatch[k]
+	except:
+		print("Message: Unable to connect MapQuest, the most common causes are 1) that your computer isn't connected to the network; 2) an invalid key is provided.")
+
+	return [timeSecs, distMeters]
 	
 def mqGeocode(text, APIkey):
 	"""
@@ -344,7 +492,7 @@ def mqGeocode(text, APIkey):
 		A geocoded location in the format of [lat, lon].
 	"""
 	
-	geocodeUrl = ('http://www.mapquestapi.com/geocoding/v1/address?key=%s&maxResults=1&thumbMaps=false&outFormat=json&location=%s') % (APIkey, text)
+	geocodeUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/address?key=%s&maxResults=1&thumbMaps=false&outFormat=json&location=%s') % (APIkey, text)
 	
 	try:
 		http = urllib3.PoolManager()
@@ -381,7 +529,7 @@ def mqReverseGeocode(loc, APIkey):
 		A dataProvider-specific dictionary containing address details.
 	"""
 	
-	geocodeUrl = ('http://www.mapquestapi.com/geocoding/v1/reverse?key=%s&thumbMaps=false&outFormat=json&includeNearestIntersection=true&includeRoadMetadata=true&location=%s,%s') % (APIkey, loc[0], loc[1])
+	geocodeUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/reverse?key=%s&thumbMaps=false&outFormat=json&includeNearestIntersection=true&includeRoadMetadata=true&location=%s,%s') % (APIkey, loc[0], loc[1])
 	try:
 		http = urllib3.PoolManager()
 		response = http.request('GET', geocodeUrl)
@@ -401,4 +549,100 @@ def mqReverseGeocode(loc, APIkey):
 		print("Message: Unable to connect to MapQuest, the most common causes are that 1) your computer isn't connected to the network; 2) an invalid key was provided.")
 		print("Error: ", sys.exc_info()[1])
 		raise
-		
+
+def mqGeocodeBatch(texts, APIkey, http=None):
+	"""
+	Geocode up to `VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE` text strings with one request to MapQuest's batch geocoding service
+	
+	Parameters
+	----------
+	texts: list of strings
+		Text strings describing addresses, cities, or landmarks.
+	APIkey: string
+		Enables us to access to MapQuest server
+	http: urllib3.PoolManager, Optional
+		A connection pool to reuse (e.g., for many requests in a row).  By default, a new one is created.
+	    
+	Returns
+	-------
+	list
+		One geocoded location, in the format of [lat, lon], for each text string (None if the text string could not be geocoded).
+	"""
+
+	geocodeUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/batch?key=%s&maxResults=1&thumbMaps=false&outFormat=json') % (APIkey)
+	for text in texts:
+		geocodeUrl += ('&location=%s') % (quote(text))
+
+	try:
+		if (http is None):
+			http = urllib3.PoolManager()
+		response = http.request('GET', geocodeUrl)
+		data = json.loads(response.data.decode('utf-8'))
+		http_status = response.status
+		if (data['info']['statuscode'] == 0):
+			# The results are in the same order as the requested locations
+			locs = []
+			for result in data['results']:
+				if (len(result['locations']) > 0):
+					locs.append([result['locations'][0]['latLng']['lat'], result['locations'][0]['latLng']['lng']])
+				else:
+					locs.append(None)
+			return locs
+		else:
+			# Error of some kind
+			http_status_description = responses[http_status]
+			print("Error Code %s: %s" % (http_status, http_status_description))
+			return
+	except:
+		print("Message: Unable to connect to MapQuest, the most common causes are 1) that your computer isn't connected to the network; 2) an invalid key is provided.")
+		print("Error: ", sys.exc_info()[1])
+		raise
+
+def mqReverseGeocodeBatch(locs, APIkey, http=None):
+	"""
+	Reverse Geocode up to `VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE` locations with one request to MapQuest's batch geocoding service.  The address details are those of the batch service, which does not include the nearest intersection or road metadata that `mqReverseGeocode()` returns.
+	
+	Parameters
+	----------
+	locs: list of lists
+		Of the form [[lat, lon], [lat, lon], ...] or [[lat, lon, alt], ...].  If provided, altitudes will be ignored.
+	APIkey: string
+		Enables us to access to MapQuest server
+	http: urllib3.PoolManager, Optional
+		A connection pool to reuse (e.g., for many requests in a row).  By default, a new one is created.
+	    
+	Returns
+	-------
+	list
+		One (snapLoc, address) for each location (None if the location could not be reverse geocoded), where snapLoc is of the form [lat, lon] and address is a dataProvider-specific dictionary containing address details.
+	"""
+
+	geocodeUrl = (VRV_SETTING_MAPQUEST_BASEURL + '/geocoding/v1/batch?key=%s&maxResults=1&thumbMaps=false&outFormat=json') % (APIkey)
+	for loc in locs:
+		geocodeUrl += ('&location=%s,%s') % (loc[0], loc[1])
+
+	try:
+		if (http is None):
+			http = urllib3.PoolManager()
+		response = http.request('GET', geocodeUrl)
+		data = json.loads(response.data.decode('utf-8'))
+		http_status = response.status
+		if (data['info']['statuscode'] == 0):
+			# The results are in the same order as the requested locations
+			snapLocsAddresses = []
+			for result in data['results']:
+				if (len(result['locations']) > 0):
+					address = result['locations'][0]
+					snapLocsAddresses.append(([address['latLng']['lat'], address['latLng']['lng']], address))
+				else:
+					snapLocsAddresses.append(None)
+			return snapLocsAddresses
+		else:
+			# Error of some kind
+			http_status_description = responses[http_status]
+			print("Error Code %s: %s" % (http_status, http_status_description))
+			return
+	except:
+		print("Message: Unable to connect to MapQuest, the most common causes are that 1) your computer isn't connected to the network; 2) an invalid key was provided.")
+		print("Error: ", sys.exc_info()[1])
+		raise
@@ -1,8 +1,11 @@
 from veroviz._common import *
-from veroviz._internal import distributeTimeDist
+from veroviz._internal import distributeTimeDistBySteps
+from veroviz._internal import decodePolyline
 from veroviz._internal import loc2Dict
 from veroviz._internal import locs2Dict
 
+import concurrent.futures
+
 
 def orsGetSnapToRoadLatLon(loc, APIkey):
 	"""
@@ -22,7 +25,7 @@ def orsGetSnapToRoadLatLon(loc, APIkey):
 	dicLoc = loc2Dict(loc)
     
 	# ORS uses [lon, lat] order:
-	snapToRoadUrl = ('https://api.openrouteservice.org/v2/directions/driving-car?api_key=%s&start=%s,%s&end=%s,%s' % 
+	snapToRoadUrl = (VRV_SETTING_ORS_BASEURL + '/v2/directions/driving-car?api_key=%s&start=%s,%s&end=%s,%s' % 
 					(APIkey, dicLoc['lon'], dicLoc['lat'], dicLoc['lon'], dicLoc['lat']))
  
 	try:
@@ -105,43 +108,33 @@ def orsGetShapepointsTimeDist(startLoc, endLoc, travelMode='fastest', APIkey=Non
 		print("Error: Invalid travelMode.")
 		return    
     
+	# The JSON (rather than GeoJSON) response has the geometry as an encoded polyline
+	shapepointsUrl = (VRV_SETTING_ORS_BASEURL + '/v2/directions/%s/json' % (profile))
+
+	headers = {
+				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
+				'Authorization': APIkey,
+				'Content-Type': 'application/json'}
+
 	# ORS uses [lon, lat] order:
-	shapepointsUrl = ('https://api.openrouteservice.org/v2/directions/%s?api_key=%s&start=%s,%s&end=%s,%s' % 
-					(profile, APIkey, dicStartLoc['lon'], dicStartLoc['lat'], dicEndLoc['lon'], dicEndLoc['lat']))
+	encoded_body = json.dumps({
+		"coordinates": [[dicStartLoc['lon'], dicStartLoc['lat']], [dicEndLoc['lon'], dicEndLoc['lat']]]})
 
 	try:
 		http = urllib3.PoolManager()
-		response = http.request('GET', shapepointsUrl)
+		response = http.request('POST', shapepointsUrl, headers=headers, body=encoded_body)
 		data = json.loads(response.data.decode('utf-8'))
 
 		http_status = response.status
 
 		if (http_status == 200):
 			# OK
-			# ORS uses [lon, lat] order:
-			path = []
-			timeInSeconds = []
-			distInMeters = []
-			for i in range(len(data['features'][0]['geometry']['coordinates'])):
-				path.append([data['features'][0]['geometry']['coordinates'][i][1], 
-							 data['features'][0]['geometry']['coordinates'][i][0]])
-
-			for i in range(len(data['features'][0]['properties']['segments'])):
-				for j in range(len(data['features'][0]['properties']['segments'][i]['steps'])):
-					# Find arrival times for each shapepoint location.
-					# ORS gives times for groups of waypoints...we need more granularity.
-
-					subpathTimeSec = data['features'][0]['properties']['segments'][i]['steps'][j]['duration']
-					wpStart = data['features'][0]['properties']['segments'][i]['steps'][j]['way_points'][0]
-					wpEnd = data['features'][0]['properties']['segments'][i]['steps'][j]['way_points'][1]
-
-					[tmpTimeSec, tmpDistMeters] = distributeTimeDist(path[wpStart:wpEnd+1], subpathTimeSec)
-					if (len(timeInSeconds) == 0):
-						timeInSeconds += tmpTimeSec
-						distInMeters += tmpDistMeters
-					else:
-						timeInSeconds += tmpTimeSec[1:]
-						distInMeters += tmpDistMeters[1:]
+			path = decodePolyline(data['routes'][0]['geometry'], 5).tolist()
+
+			# Find arrival times for each shapepoint location.
+			# ORS gives times for groups of waypoints (steps)...we need more granularity.
+			steps = [step for segment in data['routes'][0]['segments'] for step in segment['steps']]
+			[timeInSeconds, distInMeters] = distributeTimeDistBySteps(path, [step['way_points'] for step in steps], [step['duration'] for step in steps])
                     
 			return [path, timeInSeconds, distInMeters]
 		else:
@@ -155,6 +148,88 @@ def orsGetShapepointsTimeDist(startLoc, endLoc, travelMode='fastest', APIkey=Non
 		raise
 
 
+def orsGetShapepointsTimeDistSeq(locs, travelMode='fastest', APIkey=None):
+	"""
+	A function to get the shapepoints of every leg of a route through a sequence of locations, with one request.  ORS returns one segment for each leg; the steps of each segment give the range of shapepoints of that leg.
+	Parameters
+	----------
+	locs: list of lists
+		A sequence of locations.  The format of each is [lat, lon] (altitude, above sea level, set to be 0) or [lat, lon, alt].  Consecutive locations should be different.
+	travelMode: string, {fastest}
+		Optional, default as 'fastest'. Choose a travel mode as a parameter for ORS
+	Returns
+	-------
+	list
+		One [path, timeInSeconds, distInMeters] for each consecutive pair of locations, in the same format as `orsGetShapepointsTimeDist()`.  None if the route could not be split into legs.
+	"""
+
+	dicLocs = locs2Dict(locs)
+
+	try:
+		travelMode = travelMode.lower()
+	except:
+		pass
+	
+	if (travelMode == 'fastest'):
+		profile = 'driving-car'
+	elif (travelMode == 'pedestrian'):
+		profile = 'foot-walking'
+	elif (travelMode == 'cycling'):
+		profile = 'cycling-road'
+	elif (travelMode == 'truck'):
+		profile = 'driving-hgv'
+	else:
+		print("Error: Invalid travelMode.")
+		return    
+
+	shapepointsUrl = (VRV_SETTING_ORS_BASEURL + '/v2/directions/%s/json' % (profile))
+
+	headers = {
+				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
+				'Authorization': APIkey,
+				'Content-Type': 'application/json'}
+
+	# ORS uses [lon, lat] order:
+	encoded_body = json.dumps({
+		"coordinates": [[dicLoc['lon'], dicLoc['lat']] for dicLoc in dicLocs]})
+
+	try:
+		http = urllib3.PoolManager()
+		response = http.request('POST', shapepointsUrl, headers=headers, body=encoded_body)
+		data = json.loads(response.data.decode('utf-8'))
+
+		http_status = response.status
+
+		if (http_status == 200):
+			# OK
+			path = decodePolyline(data['routes'][0]['geometry'], 5).tolist()
+
+			segments = data['routes'][0]['segments']
+			steps = [step for segment in segments for step in segment['steps']]
+			[timeInSeconds, distInMeters] = distributeTimeDistBySteps(path, [step['way_points'] for step in steps], [step['duration'] for step in steps])
+
+			if (len(segments) != len(locs) - 1):
+				return
+
+			# Consecutive legs share the shapepoint at their common location
+			legs = []
+			for segment in segments:
+				firstIndex = segment['steps'][0]['way_points'][0]
+				lastIndex = segment['steps'][-1]['way_points'][1]
+				legs.append([path[firstIndex:lastIndex + 1], [0.0] + timeInSeconds[firstIndex + 1:lastIndex + 1], [0.0] + distInMeters[firstIndex + 1:lastIndex + 1]])
+
+			return legs
+		else:
+			# Error of some kind
+			http_status_description = responses[http_status]
+			print("Error Code %s: %s" % (http_status, http_status_description))
+			return
+
+	except:
+		print("Error: ", sys.exc_info()[1])
+		raise
+
+
 def orsGetTimeDistAll2All(locs, travelMode='fastest', APIkey=None):
 	"""
 	A function to generate distance and time matrices between given coordinates.
@@ -210,7 +285,7 @@ def orsGetTimeDistAll2All(locs, travelMode='fastest', APIkey=None):
 	maxBatchSize = 50   # 50 x 50
 	numBatches = int(math.ceil(len(locs) / float(maxBatchSize)))
 
-	all2AllUrl = ('https://api.openrouteservice.org/v2/matrix/%s' % (profile))
+	all2AllUrl = (VRV_SETTING_ORS_BASEURL + '/v2/matrix/%s' % (profile))
 
 	headers = {
 				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
@@ -345,7 +420,7 @@ def orsGetTimeDistOne2Many(fromLoc, toLocs, travelMode='fastest', APIkey=None):
     
 	one2ManyBatchSize = 2500 # < 2500 (50 x 50)
 	numBatches = int(math.ceil(len(toLocs) / float(one2ManyBatchSize)))
-	one2ManyUrlBase = ('https://api.openrouteservice.org/v2/matrix/%s' % (profile))
+	one2ManyUrlBase = (VRV_SETTING_ORS_BASEURL + '/v2/matrix/%s' % (profile))
 
 	headers = {
 				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
@@ -462,7 +537,7 @@ def orsGetTimeDistMany2One(fromLocs, toLoc, travelMode='fastest', APIkey=None):
     
 	many2OneBatchSize = 2500 # < 2500 (50 x 50)
 	numBatches = int(math.ceil(len(fromLocs) / float(many2OneBatchSize)))
-	many2OneUrlBase = ('https://api.openrouteservice.org/v2/matrix/%s' % (profile))
+	many2OneUrlBase = (VRV_SETTING_ORS_BASEURL + '/v2/matrix/%s' % (profile))
 
 	headers = {
 				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
@@ -521,7 +596,103 @@ def orsGetTimeDistMany2One(fromLocs, toLoc, travelMode='fastest', APIkey=None):
 		raise
 
 
-def orsGeocode(text, APIkey):
+def orsGetTimeDistMany2Many(fromLocs, toLocs, travelMode='fastest', APIkey=None):
+	"""
+	A function to generate distance and time matrices from one list of coordinates to another.
+	Parameters
+	----------
+	fromLocs: list of lists, Required
+		The format is [[lat1, lon1], [lat2, lon2], ...], a list of coordinates.
+	toLocs: list of lists, Required
+		The format is [[lat1, lon1], [lat2, lon2], ...], a list of coordinates.
+	travelMode: string, {fastest, pedestrian, cycling, truck}
+		ORS provides multiple types of routing.  VeRoViz implements the following: 'fastest' (for car), 'pedestrian', 'cycling', and 'truck'.
+	APIkey: string, Required
+		Enables access to ORS server.
+	
+	Returns
+	-------
+	time: dictionary
+		A len(fromLocs) x len(toLocs) matrix, which provides the travel time from each origin to each destination.  Units are in seconds.
+	dist: dictionary
+		A len(fromLocs) x len(toLocs) matrix, which provides the distance from each origin to each destination.  Units are in meters.
+	"""
+
+	try:
+		travelMode = travelMode.lower()
+	except:
+		pass
+
+	if (travelMode == 'fastest'):
+		profile = 'driving-car'
+	elif (travelMode == 'pedestrian'):
+		profile = 'foot-walking'
+	elif (travelMode == 'cycling'):
+		profile = 'cycling-road'
+	elif (travelMode == 'truck'):
+		profile = 'driving-hgv'
+	else:
+		print("Error: Invalid travelMode.")
+		return    
+
+	# Each request covers a block of up to `blockSize` sources x `blockSize` destinations
+	blockSize = VRV_SETTING_ORS_MATRIXBLOCKSIZE
+	blocks = [[rowStart, colStart] for rowStart in range(0, len(fromLocs), blockSize) for colStart in range(0, len(toLocs), blockSize)]
+
+	many2ManyUrl = (VRV_SETTING_ORS_BASEURL + '/v2/matrix/%s' % (profile))
+
+	headers = {
+				'Accept': 'application/json, application/geo+json, application/gpx+xml, img/png; charset=utf-8',
+				'Authorization': APIkey,
+				'Content-Type': 'application/json'}
+
+	maxWorkers = max(1, min(VRV_SETTING_MATRIX_MAXWORKERS, len(blocks)))
+	http = urllib3.PoolManager(maxsize=maxWorkers)
+
+	def _requestBlock(block):
+		[rowStart, colStart] = block
+		rowLocs = fromLocs[rowStart:rowStart + blockSize]
+		colLocs = toLocs[colStart:colStart + blockSize]
+
+		# ORS uses [lon, lat] order:
+		locations = [[loc[1], loc[0]] for loc in rowLocs + colLocs]
+		encoded_body = json.dumps({
+			"locations": locations,
+			"sources": list(range(0, len(rowLocs))),
+			"destinations": list(range(len(rowLocs), len(locations))),
+			"metrics": ["distance","duration"],
+			"units": "m"})
+
+		response = http.request('POST', many2ManyUrl, headers=headers, body=encoded_body)
+
+		return [response.status, json.loads(response.data.decode('utf-8'))]
+
+	distMeters = {}
+	timeSecs = {}
+
+	try:
+		with concurrent.futures.ThreadPoolExecutor(max_workers=maxWorkers) as executor:
+			for ([rowStart, colStart], [http_status, data]) in zip(blocks, executor.map(_requestBlock, blocks)):
+				if (http_status == 200):
+					# OK
+					for i in range(0, len(data['durations'])):
+						for j in range(0, len(data['durations'][i])):
+							distMeters[rowStart + i, colStart + j] = data['distances'][i][j]
+							timeSecs[rowStart + i, colStart + j] = data['durations'][i][j]
+				else:
+					# Error of some kind
+					http_status_description = responses[http_status]
+					print("Error Code %s: %s" % (http_status, http_status_description))
+					return
+
+		return [timeSecs, distMeters]
+
+	except:
+		print("Error: ", sys.exc_info()[1])
+		raise
+
+
+def orsGeocode(text, APIkey, http=None):
 	"""
 	Geocode from a text string using ORS
 	
@@ -529,6 +700,8 @@ def orsGeocode(text, APIkey):
 	----------
 	text: string
 		A text string describing an address, city, or landmark.
+	http: urllib3.PoolManager, Optional
+		A connection pool to reuse (e.g., for many requests in a row).  By default, a new one is created.
 	    
 	Returns
 	-------
@@ -537,10 +710,11 @@ def orsGeocode(text, APIkey):
 	"""
     
 	# ORS uses [lon, lat] order:
-	geocodeUrl = ('https://api.openrouteservice.org/geocode/search?api_key=%s&text=%s&size=1' % (APIkey, text))
+	geocodeUrl = (VRV_SETTING_ORS_BASEURL + '/geocode/search?api_key=%s&text=%s&size=1' % (APIkey, text))
     
 	try:
-		http = urllib3.PoolManager()
+		if (http is None):
+			http = urllib3.PoolManager()
 		response = http.request('GET', geocodeUrl)
 		data = json.loads(response.data.decode('utf-8'))
 
@@ -561,7 +735,7 @@ def orsGeocode(text, APIkey):
 		print("Error: ", sys.exc_info()[1])
 		raise 
 		
-def orsReverseGeocode(loc, APIkey):
+def orsReverseGeocode(loc, APIkey, http=None):
 	"""
 	Reverse Geocode from a [lat, lon] or [lat, lon, alt] location using ORS
 	
@@ -569,6 +743,8 @@ def orsReverseGeocode(loc, APIkey):
 	----------
 	loc: list
 		Of the form [lat, lon] or [lat, lon, alt].  If provided, altitude will be ignored.
+	http: urllib3.PoolManager, Optional
+		A connection pool to reuse (e.g., for many requests in a row).  By default, a new one is created.
 	    
 	Returns
 	-------
@@ -579,9 +755,10 @@ def orsReverseGeocode(loc, APIkey):
 	"""    
     
 	# ORS uses [lon, lat] order:
-	geocodeUrl = ('https://api.openrouteservice.org/geocode/reverse?api_key=%s&point.lon=%s&point.lat=%s&size=1' % (APIkey, loc[1], loc[0]))
+	geocodeUrl = (VRV_SETTING_ORS_BASEURL + '/geocode/reverse?api_key=%s&point.lon=%s&point.lat=%s&size=1' % (APIkey, loc[1], loc[0]))
 	try:
-		http = urllib3.PoolManager()
+		if (http is None):
+			http = urllib3.PoolManager()
 		response = http.request('GET', geocodeUrl)
 		data = json.loads(response.data.decode('utf-8'))
 
@@ -1,5 +1,6 @@
 from veroviz._common import *
 from veroviz._internal import distributeTimeDist
+from veroviz._internal import decodePolyline
 from veroviz._internal import loc2Dict
 from veroviz._internal import locs2Dict
 
@@ -19,7 +20,7 @@ def osrmGetSnapToRoadLatLon(loc):
 	"""
 
 	dicLoc = loc2Dict(loc)
-	snapToRoadUrl = ('http://router.project-osrm.org/nearest/v1/driving/%s,%s') % (dicLoc['lon'], dicLoc['lat']) # OSRM use lon/lat
+	snapToRoadUrl = (VRV_SETTING_OSRM_BASEURL + '/nearest/v1/driving/%s,%s') % (dicLoc['lon'], dicLoc['lat']) # OSRM use lon/lat
 	data = []
 
 	try:
@@ -35,7 +36,7 @@ def osrmGetSnapToRoadLatLon(loc):
 
 def osrmGetShapepointsTimeDist(startLoc, endLoc):
 	"""
-	A function to get a list of shapepoints from start coordinate to end coordinate, the result of this function is not as detailed as mpqGetShapepointTimeDist, however, it is faster.
+	A function to get a list of shapepoints from start coordinate to end coordinate.  The full route geometry is requested as an encoded polyline (`geometries=polyline6`), which is decoded in one shot, along with the time and distance of every segment of the route (`annotations=duration,distance`), so that OSRM's own per-segment speeds are kept.
 
 	Parameters
 	----------
@@ -56,7 +57,7 @@ def osrmGetShapepointsTimeDist(startLoc, endLoc):
 
 	dicStartLoc = loc2Dict(startLoc)
 	dicEndLoc = loc2Dict(endLoc)
-	shapepointsUrl = ('http://router.project-osrm.org/route/v1/driving/%s,%s;%s,%s?steps=true') % (dicStartLoc['lon'], dicStartLoc['lat'], dicEndLoc['lon'], dicEndLoc['lat']) # OSRM use lon/lat
+	shapepointsUrl = (VRV_SETTING_OSRM_BASEURL + '/route/v1/driving/%s,%s;%s,%s?overview=full&geometries=polyline6&annotations=duration,distance') % (dicStartLoc['lon'], dicStartLoc['lat'], dicEndLoc['lon'], dicEndLoc['lat']) # OSRM use lon/lat
 	data = []
 
 	try:
@@ -64,19 +65,66 @@ def osrmGetShapepointsTimeDist(startLoc, endLoc):
 		response = http.request('GET', shapepointsUrl)
 		data = json.loads(response.data.decode('utf-8'))
 
-		path = []
-		for i in range(len(data['routes'])):
-			for j in range(len(data['routes'][i]['legs'])):
-				for k in range(len(data['routes'][i]['legs'][j]['steps'])):
-					for m in range(len(data['routes'][i]['legs'][j]['steps'][k]['intersections'])):
-						path.append([data['routes'][i]['legs'][j]['steps'][k]['intersections'][m]['location'][1], data['routes'][i]['legs'][j]['steps'][k]['intersections'][m]['location'][0]])
-		totalTimeInSecond = data['routes'][0]['duration']
-		[timeInSeconds, distInMeters] = distributeTimeDist(path, totalTimeInSecond)
+		path = decodePolyline(data['routes'][0]['geometry'], 6).tolist()
+
+		# The annotations of each leg give the time and distance between consecutive shapepoints of the full geometry
+		timeInSeconds = [0.0]
+		distInMeters = [0.0]
+		for leg in data['routes'][0]['legs']:
+			timeInSeconds += leg['annotation']['duration']
+			distInMeters += leg['annotation']['distance']
+
+		if (len(timeInSeconds) != len(path)):
+			# Should not happen; spread the total time over the geometry instead
+			totalTimeInSecond = data['routes'][0]['duration']
+			[timeInSeconds, distInMeters] = distributeTimeDist(path, totalTimeInSecond)
 	except:
 		print ("Message: OSRM is currently not available, please try again later.")
 
 	return [path, timeInSeconds, distInMeters]
 
+def osrmGetShapepointsTimeDistSeq(locs):
+	"""
+	A function to get the shapepoints of every leg of a route through a sequence of locations, with one request.  The legs are split out of the full route geometry using the per-segment annotations of each leg.  U-turns are allowed at the intermediate locations (`continue_straight=false`), so that each leg is the same as if it had been requested on its own.
+
+	Parameters
+	----------
+	locs: list of lists
+		A sequence of locations, each in the format of [lat, lon] or [lat, lon, alt].  Consecutive locations should be different.
+
+	Returns
+	-------
+	list
+		One [path, timeInSeconds, distInMeters] for each consecutive pair of locations, in the same format as `osrmGetShapepointsTimeDist()`.  None if the route could not be split into legs.
+	"""
+
+	dicLocs = locs2Dict(locs)
+	coordinates = ';'.join(['%s,%s' % (dicLoc['lon'], dicLoc['lat']) for dicLoc in dicLocs]) # OSRM use lon/lat
+	shapepointsUrl = (VRV_SETTING_OSRM_BASEURL + '/route/v1/driving/%s?overview=full&geometries=polyline6&annotations=duration,distance&continue_straight=false') % (coordinates)
+	legs = None
+
+	try:
+		http = urllib3.PoolManager()
+		response = http.request('GET', shapepointsUrl)
+		data = json.loads(response.data.decode('utf-8'))
+
+		path = decodePolyline(data['routes'][0]['geometry'], 6).tolist()
+
+		# Consecutive legs share the shapepoint at their common location
+		legs = []
+		firstIndex = 0
+		for leg in data['routes'][0]['legs']:
+			numSegments = len(leg['annotation']['duration'])
+			legs.append([path[firstIndex:firstIndex + numSegments + 1], [0.0] + leg['annotation']['duration'], [0.0] + leg['annotation']['distance']])
+			firstIndex += numSegments
+
+		if (len(legs) != len(locs) - 1 or firstIndex != len(path) - 1):
+			legs = None
+	except:
+		print ("Message: OSRM is currently not available, please try again later.")
+
+	return legs
+
 def osrmGetTimeDistOnePair(startLoc, endLoc):
 	"""
 	A function to get a total time and total distance between two given coordinates
@@ -98,7 +146,7 @@ def osrmGetTimeDistOnePair(startLoc, endLoc):
 
 	dicStartLoc = loc2Dict(startLoc)
 	dicEndLoc = loc2Dict(endLoc)
-	timeDistUrl = ('http://router.project-osrm.org/route/v1/driving/%s,%s;%s,%s') % (dicStartLoc['lon'], dicStartLoc['lat'], dicEndLoc['lon'], dicEndLoc['lat']) # OSRM use lon/lat
+	timeDistUrl = (VRV_SETTING_OSRM_BASEURL + '/route/v1/driving/%s,%s;%s,%s') % (dicStartLoc['lon'], dicStartLoc['lat'], dicEndLoc['lon'], dicEndLoc['lat']) # OSRM use lon/lat
 	data = []
 
 	try:
@@ -1,6 +1,7 @@
 from veroviz._common import *
 from veroviz._internal import locs2Dict
 from veroviz._internal import loc2Dict
+from veroviz._internal import uniqueLocs
 from veroviz._geometry import geoDistance2D
 
 def pgrGetSnapToRoadLatLon(gid, loc, databaseName):
@@ -142,6 +143,91 @@ def pgrGetNearestStreet(loc, databaseName):
 
 	return street
 
+def pgrGetRoadSegments(boundingRegion, databaseName):
+	"""
+	A function to load, in one query, all of the street segments that overlap the bounding box of a region
+
+	Parameters
+	----------
+	boundingRegion: list of lists
+		A list of lat/lon defines the region, in the form of [[lat, lon], [lat, lon], ... , [lat, lon]]
+	databaseName: string, Require
+		If you are hosting a data provider on your local machine (e.g., pgRouting), you'll need to specify the name of the local database.
+
+	Returns
+	-------
+	list of lists
+		A list of street segments, in the form of [[[lat1, lon1], [lat2, lon2]], ...]
+	"""
+
+	conn = psycopg2.connect("dbname='%s' user='%s' host='%s' password='%s'" % (
+		databaseName, 
+		VRV_SETTING_PGROUTING_USERNAME, 
+		VRV_SETTING_PGROUTING_HOST, 
+		VRV_SETTING_PGROUTING_PASSWORD))
+	cur = conn.cursor()
+
+	minLat = min([loc[0] for loc in boundingRegion])
+	maxLat = max([loc[0] for loc in boundingRegion])
+	minLon = min([loc[1] for loc in boundingRegion])
+	maxLon = max([loc[1] for loc in boundingRegion])
+
+	sqlCommand  = " select y1, x1, y2, x2"
+	sqlCommand += " from "
+	sqlCommand += " 	ways"
+	sqlCommand += "	where"
+	sqlCommand += "		greatest(y1, y2) >= %s and least(y1, y2) <= %s" % (minLat, maxLat)
+	sqlCommand += "		and greatest(x1, x2) >= %s and least(x1, x2) <= %s;" % (minLon, maxLon)
+	cur.execute(sqlCommand)
+	rows = cur.fetchall()
+
+	conn.close()
+
+	segments = [[[row[0], row[1]], [row[2], row[3]]] for row in rows]
+
+	return segments
+
+# Bounds of each pgRouting database, keyed by (databaseName, username, host)
+pgrDatabaseBounds = {}
+
+def pgrGetDatabaseBounds(databaseName, refresh=False):
+	"""
+	A function to get the range of coordinates covered by a pgRouting database.  The bounds are queried once per database (the query scans the whole `ways_vertices_pgr` table) and then cached.
+
+	Parameters
+	----------
+	databaseName: string, Require
+		If you are hosting a data provider on your local machine (e.g., pgRouting), you'll need to specify the name of the local database.
+	refresh: boolean, Optional, default as False
+		If True, query the database again (e.g., after the database has been updated) instead of using the cached bounds.
+
+	Returns
+	-------
+	list
+		The bounds of the database, in the form of [minLat, maxLat, minLon, maxLon]
+	"""
+
+	key = (databaseName, VRV_SETTING_PGROUTING_USERNAME, VRV_SETTING_PGROUTING_HOST)
+	if (not refresh and key in pgrDatabaseBounds):
+		return pgrDatabaseBounds[key]
+
+	conn = psycopg2.connect("dbname='%s' user='%s' host='%s' password='%s'" % (
+		databaseName, 
+		VRV_SETTING_PGROUTING_USERNAME, 
+		VRV_SETTING_PGROUTING_HOST, 
+		VRV_SETTING_PGROUTING_PASSWORD))
+	cur = conn.cursor()
+
+	sqlCommand = "select min(lat), max(lat), min(lon), max(lon) from ways_vertices_pgr;"
+	cur.execute(sqlCommand)
+	row = cur.fetchone()
+
+	conn.close()
+
+	pgrDatabaseBounds[key] = [row[0], row[1], row[2], row[3]]
+
+	return pgrDatabaseBounds[key]
+
 def pgrGetShapepointsTimeDist(startLoc, endLoc, databaseName):
 	"""
 	A function to get a list of shapepoints from start coordinate to end coordinate.
@@ -341,19 +427,11 @@ def pgrGetTimeDist(fromLocs, toLocs, databaseName):
 	row = cur.fetchone()
 	newlyInsertVidNum = int(row[0]) + 1
 
-	locs = fromLocs.copy()
-	for i in range(len(toLocs)):
-		try:
-			locs.index(toLocs[i])
-		except ValueError:
-			locs.append(toLocs[i])
+	# One dummy vertex for each unique location
+	[locs, inverse] = uniqueLocs(fromLocs + toLocs)
 
-	startVidList = []
-	endVidList = []
-	for i in range(len(fromLocs)):
-		startVidList.append(newlyInsertVidNum + locs.index(fromLocs[i]))
-	for i in range(len(toLocs)):
-		endVidList.append(newlyInsertVidNum + locs.index(toLocs[i]))
+	startVidList = (newlyInsertVidNum + inverse[:len(fromLocs)]).tolist()
+	endVidList = (newlyInsertVidNum + inverse[len(fromLocs):]).tolist()
 
 	for i in range(len(locs)):
 		# Add dummy vertices
@@ -361,7 +439,7 @@ def pgrGetTimeDist(fromLocs, toLocs, databaseName):
 		snapLoc = pgrGetSnapToRoadLatLon(street['gid'], locs[i], databaseName)
 		dicSnapLoc = loc2Dict(snapLoc)
 		sqlCommand	= "	insert into ways_vertices_pgr (id, lon, lat) values (%s, %s, %s);" % (
-			newlyInsertVidNum + locs.index(locs[i]),
+			newlyInsertVidNum + i,
 			dicSnapLoc['lon'],
 			dicSnapLoc['lat'])
 		cur.execute(sqlCommand)
@@ -375,7 +453,7 @@ def pgrGetTimeDist(fromLocs, toLocs, databaseName):
 		sqlCommand  = "	insert into ways (class_id, source, target, length_m, x1, y1, x2, y2, cost_s, reverse_cost_s) values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);" % (
 			dummyClassID, 
 			street['source'],
-			newlyInsertVidNum + locs.index(locs[i]),
+			newlyInsertVidNum + i,
 			distSource2Snapped,
 			dicSourceLoc['lon'],
 			dicSourceLoc['lat'],
@@ -386,7 +464,7 @@ def pgrGetTimeDist(fromLocs, toLocs, databaseName):
 		cur.execute(sqlCommand)
 		sqlCommand  = "	insert into ways (class_id, source, target, length_m, x1, y1, x2, y2, cost_s, reverse_cost_s) values (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s);" % (
 			dummyClassID, 
-			newlyInsertVidNum + locs.index(locs[i]),
+			newlyInsertVidNum + i,
 			street['target'],
 			distSnapped2Target,
 			dicSnapLoc['lon'],
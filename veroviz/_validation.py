@@ -1,8 +1,21 @@
 from veroviz._common import *
 from veroviz._geometry import *
 from veroviz._internal import *
+from veroviz._queryPgRouting import pgrGetDatabaseBounds
+
+import veroviz._params as _params
+
+def _validationMode():
+	# Read at call time from veroviz._params, so that changing the setting at runtime takes effect.  Unknown values mean 'full'.
+	mode = str(_params.VRV_SETTING_VALIDATION).strip().lower()
+
+	return mode if (mode in ['fast', 'off']) else 'full'
+
+def valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, incrementName, incrementStart, nodeDistrib, nodeDistribArgs, snapToRoad, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText, dataProvider, dataProviderArgs, seed):
+	# With VRV_SETTING_VALIDATION = 'off', skip validation entirely
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
 
-def valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, incrementName, incrementStart, nodeDistrib, nodeDistribArgs, snapToRoad, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText, dataProvider, dataProviderArgs):
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -42,10 +55,10 @@ def valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, increme
 		[valFlag, errorMsg, newWarningMsg] = _valNodeDistribArgs(nodeDistrib, nodeDistribArgs)
 		warningMsg += newWarningMsg
 
-	if (valFlag and (snapToRoad or nodeDistrib == 'unifRoadBasedBB')):
+	if (valFlag and (snapToRoad or (nodeDistrib == 'unifRoadBasedBB' and 'roadSegments' not in nodeDistribArgs))):
 		if (dataProvider == None):
 			valFlag = False
-			errorMsg = "Error: A `dataProvider` is required if `snapToRoad = True`. Valid `dataProvider` options are 'pgRouting', 'MapQuest', 'ORS-online', and 'OSRM-online'."
+			errorMsg = "Error: A `dataProvider` is required if `snapToRoad = True`, or if `nodeDistrib = 'unifRoadBasedBB'` and no 'roadSegments' are provided. Valid `dataProvider` options are 'pgRouting', 'MapQuest', 'ORS-online', and 'OSRM-online'."
 		else:
 			if (valFlag):
 				locs = []
@@ -98,9 +111,17 @@ def valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, increme
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumNodeInputs(cesiumIconType, cesiumColor)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (seed is not None and not isinstance(seed, (int, np.integer, np.random.Generator))):
+			valFlag = False
+			errorMsg = "Error: `seed` must be None, an integer, or a numpy.random.Generator."
+
 	return [valFlag, errorMsg, warningMsg]
 
 def valSnapNodesToRoad(nodes, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -120,6 +141,9 @@ def valSnapNodesToRoad(nodes, dataProvider, dataProviderArgs):
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetTimeDist2D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, outputTimeUnits, routeType, speedMPS, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -140,6 +164,10 @@ def valGetTimeDist2D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, o
 		[valFlag, errorMsg, newWarningMsg] = _valMatrixType(matrixType, fromNodeID, toNodeID)
 		warningMsg += newWarningMsg
 
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valMatrixNodeIDs(nodes, matrixType, fromNodeID, toNodeID)
+		warningMsg += newWarningMsg
+
 	if (valFlag):
 		try:
 			outputDistUnits = outputDistUnits.lower()
@@ -170,6 +198,9 @@ def valGetTimeDist2D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, o
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetTimeDistScalar2D(startLoc, endLoc, outputDistUnits, outputTimeUnits, routeType, speedMPS, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -225,6 +256,9 @@ def valGetTimeDistScalar2D(startLoc, endLoc, outputDistUnits, outputTimeUnits, r
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetTimeDist3D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, outputTimeUnits, routeType, takeoffSpeedMPS, climbRateMPS, cruiseSpeedMPS, cruiseAltMetersAGL, landSpeedMPS, descentRateMPS):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -242,6 +276,10 @@ def valGetTimeDist3D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, o
 		[valFlag, errorMsg, newWarningMsg] = _valMatrixType(matrixType, fromNodeID, toNodeID)
 		warningMsg += newWarningMsg
 
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valMatrixNodeIDs(nodes, matrixType, fromNodeID, toNodeID)
+		warningMsg += newWarningMsg
+
 	if (valFlag):
 		try:
 			outputDistUnits = outputDistUnits.lower()
@@ -267,6 +305,9 @@ def valGetTimeDist3D(nodes, matrixType, fromNodeID, toNodeID, outputDistUnits, o
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetTimeDistScalar3D(startLoc, endLoc, outputDistUnits, outputTimeUnits, takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS, cruiseAltMetersAGL, routeType, climbRateMPS, descentRateMPS):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -328,7 +369,10 @@ def valGetTimeDistScalar3D(startLoc, endLoc, outputDistUnits, outputTimeUnits, t
 
 	return [valFlag, errorMsg, warningMsg]
 
-def valGetShapepoints2D(odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs):
+def valGetShapepoints2D(odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -410,9 +454,17 @@ def valGetShapepoints2D(odID, objectID, modelFile, startLoc, endLoc, startTimeSe
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (simplifyToleranceMeters is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(simplifyToleranceMeters, 'simplifyToleranceMeters')
+			warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetShapepoints3D(odID, objectID, modelFile, startTimeSec, startLoc, endLoc, takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS, cruiseAltMetersAGL, routeType, climbRateMPS, descentRateMPS, earliestLandTime, loiterPosition, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -501,6 +553,9 @@ def valGetShapepoints3D(odID, objectID, modelFile, startTimeSec, startLoc, endLo
 	return [valFlag, errorMsg, warningMsg]
 
 def valCreateLeaflet(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, nodes, leafletIconPrefix, leafletIconType, leafletIconColor, leafletIconText, arcs, leafletArcWeight, leafletArcStyle, leafletArcOpacity, leafletArcColor, useArrows, boundingRegion, leafletBoundingWeight, leafletBoundingOpacity, leafletBoundingStyle, leafletBoundingColor):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -554,6 +609,9 @@ def valCreateLeaflet(mapObject, mapFilename, mapBackground, mapBoundary, zoomSta
 	return [valFlag, errorMsg, warningMsg]
 
 def valAddLeafletCircle(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, center, radius, lineWeight, lineColor, lineOpacity, lineStyle, fillColor, fillOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -625,6 +683,9 @@ def valAddLeafletCircle(mapObject, mapFilename, mapBackground, mapBoundary, zoom
 	return [valFlag, errorMsg, warningMsg]
 
 def valAddLeafletMarker(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, center, radius, lineWeight, lineColor, lineOpacity, lineStyle, fillColor, fillOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -696,6 +757,9 @@ def valAddLeafletMarker(mapObject, mapFilename, mapBackground, mapBoundary, zoom
 	return [valFlag, errorMsg, warningMsg]
 
 def valAddLeafletPolygon(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, points, lineWeight, lineColor, lineOpacity, lineStyle, fillColor, fillOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -763,6 +827,9 @@ def valAddLeafletPolygon(mapObject, mapFilename, mapBackground, mapBoundary, zoo
 	return [valFlag, errorMsg, warningMsg]
 
 def valAddLeafletPolyline(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, points, lineWeight, lineColor, lineOpacity, lineStyle):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -817,6 +884,9 @@ def valAddLeafletPolyline(mapObject, mapFilename, mapBackground, mapBoundary, zo
 	return [valFlag, errorMsg, warningMsg]
 
 def valAddLeafletText(mapObject, mapFilename, mapBackground, mapBoundary, zoomStart, anchorPoint, text, fontSize, fontColor, horizAlign):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -865,7 +935,10 @@ def valAddLeafletText(mapObject, mapFilename, mapBackground, mapBoundary, zoomSt
 
 	return [valFlag, errorMsg, warningMsg]
 
-def valCreateCesium(assignments, nodes, startDate, startTime, postBuffer, cesiumDir, problemDir, cesiumIconColor, cesiumPathColor, cesiumPathWeight, cesiumPathStyle, cesiumPathOpacity):
+def valCreateCesium(assignments, nodes, startDate, startTime, postBuffer, cesiumDir, problemDir, cesiumIconColor, cesiumPathColor, cesiumPathWeight, cesiumPathStyle, cesiumPathOpacity, incremental=False, trajectoryToleranceMeters=None):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -926,9 +999,21 @@ def valCreateCesium(assignments, nodes, startDate, startTime, postBuffer, cesium
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumPathColor, cesiumPathWeight, cesiumPathStyle, cesiumPathOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (type(incremental) is not bool):
+			valFlag = False
+			errorMsg = "Error: `incremental` must be boolean (True or False)."
+
+	if (valFlag and trajectoryToleranceMeters is not None):
+		[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(trajectoryToleranceMeters, 'trajectoryToleranceMeters')
+		warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetSnapLoc(loc, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -944,6 +1029,9 @@ def valGetSnapLoc(loc, dataProvider, dataProviderArgs):
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetSnapLocBatch(locs, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -959,6 +1047,9 @@ def valGetSnapLocBatch(locs, dataProvider, dataProviderArgs):
 	return [valFlag, errorMsg, warningMsg]
 
 def valConvertSpeed(speed, fromUnitsDist, fromUnitsTime, toUnitsDist, toUnitsTime):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1006,6 +1097,9 @@ def valConvertSpeed(speed, fromUnitsDist, fromUnitsTime, toUnitsDist, toUnitsTim
 	return [valFlag, errorMsg, warningMsg]
 
 def valConvertDistance(distance, fromUnitsDist, toUnitsDist):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1035,6 +1129,9 @@ def valConvertDistance(distance, fromUnitsDist, toUnitsDist):
 	return [valFlag, errorMsg, warningMsg]
 
 def valConvertArea(area, fromUnits, toUnits):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1064,6 +1161,9 @@ def valConvertArea(area, fromUnits, toUnits):
 	return [valFlag, errorMsg, warningMsg]
 
 def valConvertTime(time, fromUnitsTime, toUnitsTime):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1093,6 +1193,9 @@ def valConvertTime(time, fromUnitsTime, toUnitsTime):
 	return [valFlag, errorMsg, warningMsg]
 
 def valExportDataframe(filename, dataframe):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1108,6 +1211,9 @@ def valExportDataframe(filename, dataframe):
 	return [valFlag, errorMsg, warningMsg]
 
 def valImportDataframe(filename, intCols, useIndex):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1119,6 +1225,9 @@ def valImportDataframe(filename, intCols, useIndex):
 	return [valFlag, errorMsg, warningMsg]
 
 def valInitDataframe(dataframe):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1135,6 +1244,9 @@ def valInitDataframe(dataframe):
 	return [valFlag, errorMsg, warningMsg]
 
 def valCreateArcsFromLocSeq(locSeq, initArcs, startArc, objectID, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1192,6 +1304,9 @@ def valCreateArcsFromLocSeq(locSeq, initArcs, startArc, objectID, leafletColor,
 	return [valFlag, errorMsg, warningMsg]
 
 def valCreateArcsFromNodeSeq(nodeSeq, nodes, initArcs, startArc, objectID, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1205,13 +1320,14 @@ def valCreateArcsFromNodeSeq(nodeSeq, nodes, initArcs, startArc, objectID, leafl
 		warningMsg += newWarningMsg
 
 	if (valFlag):
+		nodeIDs = set(nodes['id'].tolist())
 		for i in range(len(nodeSeq)):
 			if (not valFlag):
 				break
 			if (valFlag):
 				[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroInteger(nodeSeq[i], 'nodeSeq')
 			if (valFlag):
-				if (nodeSeq[i] not in nodes['id'].tolist()):
+				if (nodeSeq[i] not in nodeIDs):
 					valFlag = False
 					errorMsg = "Error: 'nodes' dataframe does not contain a node with `id = %s`." % (nodeSeq[i])
 
@@ -1260,6 +1376,9 @@ def valCreateArcsFromNodeSeq(nodeSeq, nodes, initArcs, startArc, objectID, leafl
 	return [valFlag, errorMsg, warningMsg]
 
 def valCreateNodesFromLocs(locs, initNodes, nodeType, nodeName, startNode, incrementName, incrementStart, snapToRoad, dataProvider, dataProviderArgs, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1330,7 +1449,9 @@ def valCreateNodesFromLocs(locs, initNodes, nodeType, nodeName, startNode, incre
 	return [valFlag, errorMsg, warningMsg]
 
 
-def valCreateAssignmentsFromArcs2D(initAssignments, arcs, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs):
+def valCreateAssignmentsFromArcs2D(initAssignments, arcs, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
 
 	valFlag = True
 	errorMsg = ""
@@ -1435,10 +1556,17 @@ def valCreateAssignmentsFromArcs2D(initAssignments, arcs, serviceTimeSec, modelS
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (simplifyToleranceMeters is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(simplifyToleranceMeters, 'simplifyToleranceMeters')
+			warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
 
-def valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs):
+def valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
 
 	valFlag = True
 	errorMsg = ""
@@ -1462,13 +1590,14 @@ def valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTi
 		warningMsg += newWarningMsg
 
 	if (valFlag):
+		nodeIDs = set(nodes['id'].tolist())
 		for i in range(len(nodeSeq)):
 			if (not valFlag):
 				break
 			if (valFlag):
 				[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroInteger(nodeSeq[i], 'nodeSeq')
 			if (valFlag):
-				if (nodeSeq[i] not in nodes['id'].tolist()):
+				if (nodeSeq[i] not in nodeIDs):
 					valFlag = False
 					errorMsg = "Error: 'nodes' dataframe does not contain a node with `id = %s`." % (nodeSeq[i])
 
@@ -1540,14 +1669,13 @@ def valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTi
 		warningMsg += newWarningMsg
 
 	if (valFlag):
+		seqLocs = nodeIDs2Locs(nodes, nodeSeq)
 		for i in range(0, len(nodeSeq)-1):
 			if (not valFlag):
 				break
 
-			startLoc = [nodes.loc[nodes['id'] == nodeSeq[i]]['lat'].values[0],
-						nodes.loc[nodes['id'] == nodeSeq[i]]['lon'].values[0]]
-			endLoc   = [nodes.loc[nodes['id'] == nodeSeq[i+1]]['lat'].values[0],
-						nodes.loc[nodes['id'] == nodeSeq[i+1]]['lon'].values[0]]
+			startLoc = seqLocs[i]
+			endLoc   = seqLocs[i+1]
 
 			if (startLoc != endLoc):
 				[valFlag, errorMsg, newWarningMsg] = _valRouteType2DForShapepoints(routeType, speedMPS, dummyExpDurationSec, dataProvider)
@@ -1584,9 +1712,16 @@ def valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTi
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (simplifyToleranceMeters is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(simplifyToleranceMeters, 'simplifyToleranceMeters')
+			warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
-def valCreateAssignmentsFromLocSeq2D(initAssignments, locSeq, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs):
+def valCreateAssignmentsFromLocSeq2D(initAssignments, locSeq, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
 
 	valFlag = True
 	errorMsg = ""
@@ -1701,10 +1836,18 @@ def valCreateAssignmentsFromLocSeq2D(initAssignments, locSeq, serviceTimeSec, mo
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (simplifyToleranceMeters is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(simplifyToleranceMeters, 'simplifyToleranceMeters')
+			warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
 
-def valAddAssignment2D(initAssignments, odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs):
+def valAddAssignment2D(initAssignments, odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1790,10 +1933,18 @@ def valAddAssignment2D(initAssignments, odID, objectID, modelFile, startLoc, end
 			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 			warningMsg += newWarningMsg
 
+	if (valFlag):
+		if (simplifyToleranceMeters is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroFloat(simplifyToleranceMeters, 'simplifyToleranceMeters')
+			warningMsg += newWarningMsg
+
 	return [valFlag, errorMsg, warningMsg]
 
 
 def valAddAssignment3D(initAssignments, odID, objectID, modelFile, startTimeSec, startLoc, endLoc, takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS, cruiseAltMetersAGL, routeType, climbRateMPS, descentRateMPS, earliestLandTime, loiterPosition, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1885,7 +2036,145 @@ def valAddAssignment3D(initAssignments, odID, objectID, modelFile, startTimeSec,
 
 	return [valFlag, errorMsg, warningMsg]
 
+def valCreateAssignmentsFromSorties3D(initAssignments, startLocs, endLocs, startTimeSec, earliestLandTime, odID, objectID, modelFile, takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS, cruiseAltMetersAGL, routeType, climbRateMPS, descentRateMPS, loiterPosition, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	if (initAssignments is not None):
+		[valFlag, errorMsg, newWarningMsg] = valAssignments(initAssignments)
+		warningMsg += newWarningMsg
+
+	try:
+		routeType = routeType.lower()
+	except:
+		pass
+
+	if (valFlag):
+		if (odID is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valGreaterOrEqualToZeroInteger(odID, 'odID')
+			warningMsg += newWarningMsg
+		else:
+			valFlag = False
+			errorMsg = "Error: `odID` is required for `createAssignmentsFromSorties3D()`."
+
+	if (valFlag):
+		if (startLocs is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valLatLonList(startLocs)
+			warningMsg += newWarningMsg
+		else:
+			valFlag = False
+			errorMsg = "Error: `startLocs` is required for `createAssignmentsFromSorties3D()`."
+
+	if (valFlag):
+		if (endLocs is not None):
+			[valFlag, errorMsg, newWarningMsg] = _valLatLonList(endLocs)
+			warningMsg += newWarningMsg
+		else:
+			valFlag = False
+			errorMsg = "Error: `endLocs` is required for `createAssignmentsFromSorties3D()`."
+
+	if (valFlag):
+		if (len(startLocs) != len(endLocs)):
+			valFlag = False
+			errorMsg = "Error: `startLocs` and `endLocs` should have the same length."
+		elif (len(startLocs) == 0):
+			valFlag = False
+			errorMsg = "Error: `startLocs` and `endLocs` should contain at least one sortie."
+
+	if (valFlag):
+		numSorties = len(startLocs)
+		for [value, parameterName] in [[objectID, 'objectID'], [modelFile, 'modelFile']]:
+			if (type(value) is list):
+				if (len(value) != numSorties):
+					valFlag = False
+					errorMsg = "Error: If `%s` is a list, it should have one value per sortie." % (parameterName)
+					break
+				elif (None in value):
+					warningMsg += "Warning: `%s` contains None; the Assignments dataframe can not be visualized by Cesium.\n" % (parameterName)
+			elif (value == None):
+				warningMsg += "Warning: `%s` is None; the Assignments dataframe can not be visualized by Cesium.\n" % (parameterName)
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valSortieValues(startTimeSec, numSorties, 'startTimeSec', True)
+		warningMsg += newWarningMsg
+
+	if (valFlag and earliestLandTime is not None):
+		# `earliestLandTime = -1` means there is no restriction on the earliest landing time
+		[valFlag, errorMsg, newWarningMsg] = _valSortieValues(np.where(np.equal(earliestLandTime, -1), 0, earliestLandTime), numSorties, 'earliestLandTime', True)
+		warningMsg += newWarningMsg
+
+	if (valFlag):
+		if (routeType not in routeType3DList):
+			errorMsg = "Error: Invalid `routeType` value.  Valid options include 'square', 'triangular', 'trapezoidal', and 'straight'"
+			valFlag = False
+
+	if (valFlag):
+		requiredSpeeds = [[cruiseSpeedMPS, 'cruiseSpeedMPS']]
+		if (routeType in ['square', 'trapezoidal']):
+			requiredSpeeds += [[takeoffSpeedMPS, 'takeoffSpeedMPS'], [landSpeedMPS, 'landSpeedMPS']]
+		if (routeType == 'trapezoidal'):
+			requiredSpeeds += [[climbRateMPS, 'climbRateMPS'], [descentRateMPS, 'descentRateMPS']]
+		for [value, parameterName] in requiredSpeeds:
+			if (valFlag):
+				[valFlag, errorMsg, newWarningMsg] = _valSortieValues(value, numSorties, parameterName, False)
+				warningMsg += newWarningMsg
+
+	if (valFlag and routeType == 'trapezoidal'):
+		if (np.any(np.asarray(climbRateMPS) > np.asarray(takeoffSpeedMPS))):
+			valFlag = False
+			errorMsg = "Error: Rate of climb can not be greater than takeoff speed."
+		elif (np.any(np.asarray(descentRateMPS) > np.asarray(landSpeedMPS))):
+			valFlag = False
+			errorMsg = "Error: Rate of descent can not be greater than landing speed."
+
+	if (valFlag and routeType != 'straight'):
+		[valFlag, errorMsg, newWarningMsg] = _valSortieValues(cruiseAltMetersAGL, numSorties, 'cruiseAltMetersAGL', True)
+		warningMsg += newWarningMsg
+
+		if (valFlag):
+			startAlts = np.asarray([loc[2] if len(loc) == 3 else 0 for loc in startLocs])
+			endAlts = np.asarray([loc[2] if len(loc) == 3 else 0 for loc in endLocs])
+			if (np.any(startAlts >= np.asarray(cruiseAltMetersAGL))):
+				valFlag = False
+				errorMsg = "Error: startAltMetersAGL should be lower than cruiseAltMetersAGL."
+			elif (np.any(endAlts >= np.asarray(cruiseAltMetersAGL))):
+				valFlag = False
+				errorMsg = "Error: endAltMetersAGL should be lower than cruiseAltMetersAGL."
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valLoiterPosition(loiterPosition)
+		warningMsg += newWarningMsg
+
+	if (valFlag):
+		if ((leafletColor != None) or (leafletWeight != None) or (leafletStyle != None) or (leafletOpacity != None)):
+			try:
+				leafletColor = leafletColor.lower()
+			except:
+				pass
+
+			try:
+				leafletStyle = leafletStyle.lower()
+			except:
+				pass
+
+			[valFlag, errorMsg, newWarningMsg] = _valLeafletArcInputs(leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows)
+			warningMsg += newWarningMsg
+
+	if (valFlag):
+		if ((cesiumColor != None) or (cesiumWeight != None) or (cesiumStyle != None) or (cesiumOpacity != None)):
+			[valFlag, errorMsg, newWarningMsg] = _valCesiumArcInputs(cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
+			warningMsg += newWarningMsg
+
+	return [valFlag, errorMsg, warningMsg]
+
 def valAddStaticAssignment(initAssignments, odID, objectID, modelFile, modelScale, modelMinPxSize, loc, startTimeSec, endTimeSec):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1946,6 +2235,9 @@ def valAddStaticAssignment(initAssignments, odID, objectID, modelFile, modelScal
 	return [valFlag, errorMsg, warningMsg]
 
 def valNodes(nodes):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1963,13 +2255,16 @@ def valNodes(nodes):
 					errorMsg = "Error: %s is missing from nodes dataframe.  To see all required columns, call 'initDataframe('nodes')'." % (col)
 					break
 
-	if (valFlag and nodes is not None):
-		[valFlag, errorMsg, newWarningMsg] = _valLatLonList(list(zip(nodes.lat, nodes.lon)))
+	if (valFlag and nodes is not None and _validationMode() == 'full'):
+		[valFlag, errorMsg, newWarningMsg] = _valLatLonArrays(nodes['lat'], nodes['lon'])
 		warningMsg += newWarningMsg
 
 	return [valFlag, errorMsg, warningMsg]
 
 def valAssignments(assignments):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -1987,21 +2282,23 @@ def valAssignments(assignments):
 					errorMsg = "Error: %s is missing from assignments dataframe.  To see all required columns, call 'initDataframe('assignments')'." % (col)
 					break
 
-	if (valFlag and assignments is not None):
-		[valFlag, errorMsg, newWarningMsg] = _valLatLonList(list(zip(assignments.startLat, assignments.startLon)))
+	if (valFlag and assignments is not None and _validationMode() == 'full'):
+		[valFlag, errorMsg, newWarningMsg] = _valLatLonArrays(assignments['startLat'], assignments['startLon'])
 		warningMsg += newWarningMsg
 
-	if (valFlag and assignments is not None):
-		[valFlag, errorMsg, newWarningMsg] = _valLatLonList(list(zip(assignments.endLat, assignments.endLon)))
+	if (valFlag and assignments is not None and _validationMode() == 'full'):
+		[valFlag, errorMsg, newWarningMsg] = _valLatLonArrays(assignments['endLat'], assignments['endLon'])
 		warningMsg += newWarningMsg
 
-	if (valFlag):
-		for i in assignments.index:
-			assignments.at[i, 'modelFile'] = addHeadSlash(assignments.at[i, 'modelFile'])
+	if (valFlag and assignments is not None):
+		addHeadSlashToModelFiles(assignments)
 
 	return [valFlag, errorMsg, warningMsg]
 
 def valArcs(arcs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2019,17 +2316,20 @@ def valArcs(arcs):
 					errorMsg = "Error: %s is missing from arcs dataframe.  To see all required columns, call 'initDataframe('arcs')'." % (col)
 					break
 
-	if (valFlag and arcs is not None):
-		[valFlag, errorMsg, newWarningMsg] = _valLatLonList(list(zip(arcs.startLat, arcs.startLon)))
+	if (valFlag and arcs is not None and _validationMode() == 'full'):
+		[valFlag, errorMsg, newWarningMsg] = _valLatLonArrays(arcs['startLat'], arcs['startLon'])
 		warningMsg += newWarningMsg
 
-	if (valFlag and arcs is not None):
-		[valFlag, errorMsg, newWarningMsg] = _valLatLonList(list(zip(arcs.endLat, arcs.endLon)))
+	if (valFlag and arcs is not None and _validationMode() == 'full'):
+		[valFlag, errorMsg, newWarningMsg] = _valLatLonArrays(arcs['endLat'], arcs['endLon'])
 		warningMsg += newWarningMsg
 
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetConvexHull(locs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2046,6 +2346,9 @@ def valGetConvexHull(locs):
 	return [valFlag, errorMsg, warningMsg]
 
 def valIsPointInPoly(loc, poly):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2065,6 +2368,9 @@ def valIsPointInPoly(loc, poly):
 	return [valFlag, errorMsg, warningMsg]
 
 def valIsPathInPoly(path, poly):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2084,6 +2390,9 @@ def valIsPathInPoly(path, poly):
 	return [valFlag, errorMsg, warningMsg]
 
 def valIsPathCrossPoly(path, poly):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2103,6 +2412,9 @@ def valIsPathCrossPoly(path, poly):
 	return [valFlag, errorMsg, warningMsg]
 
 def valIsPassPath(loc, path, tolerance):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2122,6 +2434,9 @@ def valIsPassPath(loc, path, tolerance):
 	return [valFlag, errorMsg, warningMsg]
 
 def valMinDistLoc2Path(loc, path):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2137,6 +2452,9 @@ def valMinDistLoc2Path(loc, path):
 	return [valFlag, errorMsg, warningMsg]
 
 def valDistance2D(loc1, loc2):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2152,6 +2470,9 @@ def valDistance2D(loc1, loc2):
 	return [valFlag, errorMsg, warningMsg]
 
 def valDistance3D(loc1, loc2):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2167,6 +2488,9 @@ def valDistance3D(loc1, loc2):
 	return [valFlag, errorMsg, warningMsg]
 
 def valDistancePath2D(path):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2178,6 +2502,9 @@ def valDistancePath2D(path):
 	return [valFlag, errorMsg, warningMsg]
 
 def valPointInDistance2D(loc, direction, distMeters):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2197,6 +2524,9 @@ def valPointInDistance2D(loc, direction, distMeters):
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetHeading(currentLoc, goalLoc):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2212,6 +2542,9 @@ def valGetHeading(currentLoc, goalLoc):
 	return [valFlag, errorMsg, warningMsg]
 
 def valGetMapBoundary(nodes, arcs, locs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2236,6 +2569,9 @@ def valGetMapBoundary(nodes, arcs, locs):
 
 
 def valFindLocsAtTime(assignments, timeSec):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2256,6 +2592,9 @@ def valFindLocsAtTime(assignments, timeSec):
 
 
 def valGeocode(location, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2271,6 +2610,9 @@ def valGeocode(location, dataProvider, dataProviderArgs):
 	return [valFlag, errorMsg, warningMsg]
 
 def valReverseGeocode(location, dataProvider, dataProviderArgs):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
 	valFlag = True
 	errorMsg = ""
 	warningMsg = ""
@@ -2284,6 +2626,74 @@ def valReverseGeocode(location, dataProvider, dataProviderArgs):
 
 	return [valFlag, errorMsg, warningMsg]
 
+def valGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, maxWorkers, requestsPerSec):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	if (locations is None):
+		valFlag = False
+		errorMsg = "Error: A list of locations (as text strings) is required for `geocodeBatch()`."
+	elif (type(locations) is str):
+		valFlag = False
+		errorMsg = "Error: `locations` should be a list of text strings.  To geocode one text string, use `geocode()`."
+	elif (not all(type(text) is str for text in locations)):
+		valFlag = False
+		errorMsg = "Error: Every location in `locations` should be a text string."
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valGeocodeBatchOptions(cacheFile, maxWorkers, requestsPerSec)
+		warningMsg += newWarningMsg
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valGeoDataProvider(dataProvider, dataProviderArgs)
+		warningMsg += newWarningMsg
+
+	return [valFlag, errorMsg, warningMsg]
+
+def valReverseGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, maxWorkers, requestsPerSec):
+	if (_validationMode() == 'off'):
+		return [True, "", ""]
+
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	[valFlag, errorMsg, newWarningMsg] = _valLatLonList(locations)
+	warningMsg += newWarningMsg
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valGeocodeBatchOptions(cacheFile, maxWorkers, requestsPerSec)
+		warningMsg += newWarningMsg
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valGeoDataProvider(dataProvider, dataProviderArgs)
+		warningMsg += newWarningMsg
+
+	return [valFlag, errorMsg, warningMsg]
+
+def _valGeocodeBatchOptions(cacheFile, maxWorkers, requestsPerSec):
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	if (cacheFile is not None and type(cacheFile) is not str):
+		valFlag = False
+		errorMsg = "Error: `cacheFile` should be None or a filename."
+
+	if (valFlag):
+		[valFlag, errorMsg, newWarningMsg] = _valGreaterThanZeroInteger(maxWorkers, 'maxWorkers')
+		warningMsg += newWarningMsg
+
+	if (valFlag and requestsPerSec is not None):
+		[valFlag, errorMsg, newWarningMsg] = _valGreaterThanZeroFloat(requestsPerSec, 'requestsPerSec')
+		warningMsg += newWarningMsg
+
+	return [valFlag, errorMsg, warningMsg]
+
 
 def _valMapBoundary(mapBoundary, zoomStart):
 	valFlag = True
@@ -2350,12 +2760,12 @@ def _valNodeDistribArgs(nodeDistrib, nodeDistribArgs):
 	if (valFlag):
 		if (nodeDistrib is None):
 			valFlag = False
-			errorMsg = "Error: `nodeDistrib` is required. Valid options are 'uniformBB', 'normalBB', and 'normal'.  Note that these options are case sensitive." # Removed 'unifRoadBasedBB' for v.0.2.0
+			errorMsg = "Error: `nodeDistrib` is required. Valid options are 'uniformBB', 'normalBB', 'normal', and 'unifRoadBasedBB'.  Note that these options are case sensitive."
 
 	if (valFlag):
 		if (nodeDistrib not in nodeDistribList):
 			valFlag = False
-			errorMsg = "Error: Invalid `nodeDistrib` value. Valid options are 'uniformBB', 'normalBB', and 'normal'.  Note that these options are case sensitive." # Removed 'unifRoadBasedBB' for v.0.2.0
+			errorMsg = "Error: Invalid `nodeDistrib` value. Valid options are 'uniformBB', 'normalBB', 'normal', and 'unifRoadBasedBB'.  Note that these options are case sensitive."
 		elif (nodeDistribArgs is None):
 			valFlag = False
 			errorMsg = "Error: `nodeDistribArgs` is required. Key values are varied for different `nodeDistrib`."
@@ -2426,10 +2836,43 @@ def _valNodeDistribArgs(nodeDistrib, nodeDistribArgs):
 					[valFlag, errorMsg, newWarningMsg] = _valGreaterThanZeroFloat(nodeDistribArgs['distToRoad'], "distance to road")
 					warningMsg += newWarningMsg
 
+				if (valFlag and 'roadSegments' in nodeDistribArgs):
+					[valFlag, errorMsg, newWarningMsg] = _valRoadSegments(nodeDistribArgs['roadSegments'])
+					warningMsg += newWarningMsg
+
 
 
 	return [valFlag, errorMsg, warningMsg]
 
+def _valRoadSegments(roadSegments):
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	if (type(roadSegments) is pd.core.frame.DataFrame):
+		[valFlag, errorMsg, newWarningMsg] = valArcs(roadSegments)
+		warningMsg += newWarningMsg
+	else:
+		try:
+			for i in range(len(roadSegments)):
+				if (not valFlag):
+					break
+				if (len(roadSegments[i]) != 2):
+					valFlag = False
+					errorMsg = "Error: Each road segment in 'roadSegments' should be in the form of [[lat1, lon1], [lat2, lon2]]."
+				else:
+					[valFlag, errorMsg, newWarningMsg] = _valLatLonList(roadSegments[i])
+					warningMsg += newWarningMsg
+		except:
+			valFlag = False
+			errorMsg = "Error: 'roadSegments' should be a list of road segments, in the form of [[[lat1, lon1], [lat2, lon2]], ...], or an Arcs dataframe."
+
+	if (valFlag and len(roadSegments) == 0):
+		valFlag = False
+		errorMsg = "Error: 'roadSegments' is empty."
+
+	return [valFlag, errorMsg, warningMsg]
+
 def _valLatLonList(locs):
 	valFlag = True
 	errorMsg = ""
@@ -2438,6 +2881,16 @@ def _valLatLonList(locs):
 	if (locs is None):
 		valFlag = False
 		errorMsg = "Error: `locs` should not be None."
+		return [valFlag, errorMsg, warningMsg]
+
+	try:
+		locsArray = np.asarray(locs, dtype=float)
+	except (TypeError, ValueError):
+		locsArray = None
+
+	if (locsArray is not None and locsArray.ndim == 2 and locsArray.shape[1] in [2, 3]):
+		# All locations have the same format, check them at once
+		[valFlag, errorMsg, warningMsg] = _valLatLonArrays(locsArray[:, 0], locsArray[:, 1], locsArray[:, 2] if (locsArray.shape[1] == 3) else None)
 	else:
 		for i in range(len(locs)):
 			if (valFlag):
@@ -2448,6 +2901,46 @@ def _valLatLonList(locs):
 
 	return [valFlag, errorMsg, warningMsg]
 
+def _valLatLonArrays(lats, lons, alts=None):
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	lats = _valNumericArray(lats)
+	lons = _valNumericArray(lons)
+
+	if (np.isnan(lats).any()):
+		valFlag = False
+		errorMsg = "Error: latitude is missing or is not a number."
+	elif (((lats < -90) | (lats > 90)).any()):
+		valFlag = False
+		errorMsg = "Error: latitude is out of range.  The valid range is [-90, +90] degrees."
+	elif (np.isnan(lons).any()):
+		valFlag = False
+		errorMsg = "Error: longitude is missing or is not a number."
+	elif (((lons < -180) | (lons > 180)).any()):
+		valFlag = False
+		errorMsg = "Error: longitude is out of range.  The valid range is [-180, +180] degrees."
+
+	if (valFlag and alts is not None):
+		alts = _valNumericArray(alts)
+		if (np.isnan(alts).any()):
+			valFlag = False
+			errorMsg = "Error: altitude should be a float number and greater than or equal to 0."
+		elif ((alts < 0).any()):
+			valFlag = False
+			errorMsg = "Error: altitude should be greater than or equal to 0."
+
+	return [valFlag, errorMsg, warningMsg]
+
+def _valNumericArray(values):
+	# Values that are not numbers (e.g., None or strings) become NaN
+	values = np.asarray(values)
+	if (values.dtype.kind not in 'biuf'):
+		values = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=float)
+
+	return values
+
 def _valLatLon(loc):
 	valFlag = True
 	errorMsg = ""
@@ -2496,23 +2989,18 @@ def _valDatabase(locs, dataProvider, dataProviderArgs):
 			else:
 				databaseName = dataProviderArgs['databaseName']
 				try:
-					conn = psycopg2.connect("dbname='%s' user='%s' host='%s' password='%s'" % (databaseName, VRV_SETTING_PGROUTING_USERNAME, VRV_SETTING_PGROUTING_HOST, VRV_SETTING_PGROUTING_PASSWORD))
-					cur = conn.cursor()
-					sqlCommand = "select min(lat), max(lat), min(lon), max(lon) from ways_vertices_pgr;"
-					cur.execute(sqlCommand)
-					row = cur.fetchone()
-					minLat = row[0]
-					maxLat = row[1]
-					minLon = row[2]
-					maxLon = row[3]
-					for i in range(len(locs)):
-						if (locs[i][0] < minLat or locs[i][0] > maxLat or locs[i][1] < minLon or locs[i][1] > maxLon):
-							warningMsg += "Warning: The database contains coordinates between latitude: %s to %s and longitude: %s to %s, the coordinates (%s, %s) you provided is not inside. \n" % (minLat, maxLat, minLon, maxLon, locs[i][0], locs[i][1])
-					conn.close()
+					[minLat, maxLat, minLon, maxLon] = pgrGetDatabaseBounds(databaseName)
 				except:
 					valFlag = False
 					errorMsg = "Error: Bad request. Database '%s' doesn't exist." % (databaseName)
 
+				if (valFlag and locs is not None and len(locs) > 0):
+					lats = np.array([loc[0] for loc in locs], dtype=float)
+					lons = np.array([loc[1] for loc in locs], dtype=float)
+					outside = np.flatnonzero((lats < minLat) | (lats > maxLat) | (lons < minLon) | (lons > maxLon))
+					if (len(outside) > 0):
+						warningMsg += "Warning: The database contains coordinates between latitude: %s to %s and longitude: %s to %s, %s of the %s coordinates you provided are not inside (e.g., (%s, %s)). \n" % (minLat, maxLat, minLon, maxLon, len(outside), len(locs), lats[outside[0]], lons[outside[0]])
+
 		if (dataProviderDictionary[dataProvider] == "mapquest"):
 			if ('APIkey' not in dataProviderArgs):
 				valFlag = False
@@ -2720,6 +3208,26 @@ def _valMatrixType(matrixType, fromNodeID, toNodeID):
 
 	return [valFlag, errorMsg, warningMsg]
 
+def _valMatrixNodeIDs(nodes, matrixType, fromNodeID, toNodeID):
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	try:
+		matrixType = matrixType.lower()
+	except:
+		pass
+
+	nodeIDs = set(nodes['id'].tolist())
+	if (matrixType == 'one2many' and fromNodeID not in nodeIDs):
+		valFlag = False
+		errorMsg = "Error: 'nodes' dataframe does not contain a node with `id = %s` (`fromNodeID`)." % (fromNodeID)
+	elif (matrixType == 'many2one' and toNodeID not in nodeIDs):
+		valFlag = False
+		errorMsg = "Error: 'nodes' dataframe does not contain a node with `id = %s` (`toNodeID`)." % (toNodeID)
+
+	return [valFlag, errorMsg, warningMsg]
+
 def _valDistanceUnits(distUnits, parameterName):
 	valFlag = True
 	errorMsg = ""
@@ -3175,6 +3683,40 @@ def _valGreaterThanZeroFloat(number, parameterName):
 
 	return [valFlag, errorMsg, warningMsg]
 
+def _valSortieValues(values, numSorties, parameterName, allowZero):
+	# `values` is either a single number or a list with one number per sortie
+	valFlag = True
+	errorMsg = ""
+	warningMsg = ""
+
+	if (values is None):
+		valFlag = False
+		errorMsg = "Error: %s should not be None." % (parameterName)
+	else:
+		try:
+			values = np.asarray(values, dtype=float)
+		except (ValueError, TypeError):
+			valFlag = False
+			errorMsg = "Error: %s should be a float number, or a list of float numbers." % (parameterName)
+
+	if (valFlag):
+		if (values.ndim > 1 or (values.ndim == 1 and len(values) != numSorties)):
+			valFlag = False
+			errorMsg = "Error: If %s is a list, it should have one value per sortie." % (parameterName)
+		elif (np.isnan(values).any()):
+			valFlag = False
+			errorMsg = "Error: %s should not contain NaN." % (parameterName)
+
+	if (valFlag):
+		if (allowZero and (values < 0).any()):
+			valFlag = False
+			errorMsg = "Error: %s should be greater than or equal to 0." % (parameterName)
+		elif (not allowZero and (values <= 0).any()):
+			valFlag = False
+			errorMsg = "Error: %s should be greater than 0." % (parameterName)
+
+	return [valFlag, errorMsg, warningMsg]
+
 def _valBetweenOrEqualToInterger(lower, upper, number, parameterName):
 	valFlag = True
 	errorMsg = ""
@@ -3293,7 +3835,7 @@ def _valBetweenFloat(lower, upper, number, parameterName):
 
 	return [valFlag, errorMsg, warningMsg]
 
-	def _valClosestNodeLoc2Path(loc, path):
+def _valClosestNodeLoc2Path(loc, path):
     valFlag = True
     errorMsg = ""
     warningMsg = ""
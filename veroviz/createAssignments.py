@@ -2,6 +2,7 @@ from veroviz._common import *
 
 from veroviz._validation import valAddAssignment2D
 from veroviz._validation import valAddAssignment3D
+from veroviz._validation import valCreateAssignmentsFromSorties3D
 from veroviz._validation import valAddStaticAssignment
 from veroviz._validation import valCreateAssignmentsFromArcs2D
 from veroviz._validation import valCreateAssignmentsFromNodeSeq2D
@@ -9,13 +10,16 @@ from veroviz._validation import valCreateAssignmentsFromLocSeq2D
 
 from veroviz._createAssignments import privAddStaticAssignment
 from veroviz._getShapepoints import privGetShapepoints2D
+from veroviz._getShapepoints import privGetShapepointsTimeDistSeq
 from veroviz._getShapepoints import privGetShapepoints3D
+from veroviz._getShapepoints import privGetShapepoints3DBatch
+from veroviz._internal import nodeIDs2Locs
 
 from veroviz.utilities import initDataframe
 from veroviz._getTimeDistFromLocs2D import getTimeDistFromLocs2D
 
 
-def addAssignment2D(initAssignments=None, odID=1, objectID=None, modelFile=None, startLoc=None, endLoc=None, startTimeSec=0.0, expDurationSec=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None):
+def addAssignment2D(initAssignments=None, odID=1, objectID=None, modelFile=None, startLoc=None, endLoc=None, startTimeSec=0.0, expDurationSec=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None, simplifyToleranceMeters=None):
 
 	"""
 	This function appends to an existing :ref:`Assignments` dataframe, or creates a new :ref:`Assignments` dataframe if `initAssignments` is None.  The new rows in this dataframe describe all of the "shapepoints" between between given starting and ending locations, including timestamps indicating the departure and arrival times for each shapepoint. Shapepoints are pairs of GPS coordinates that are connected by straight lines.  For a given origin and destination, numerous individual shapepoints can be combined to define a travel route along a road network.   
@@ -72,6 +76,8 @@ def addAssignment2D(initAssignments=None, odID=1, objectID=None, modelFile=None,
 		Specifies the data source to be used for obtaining the shapepoints. See :ref:`Data Providers` for options and requirements.
 	dataProviderArgs: dictionary, Conditional, default as None
 		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	simplifyToleranceMeters: float, Optional, default as None
+		If provided, the route's shapepoints are simplified (using the Douglas-Peucker algorithm) such that no dropped shapepoint is more than `simplifyToleranceMeters` meters from the simplified route.  The remaining shapepoints keep their original timestamps, so the total travel time is not affected.  Road-network routes often contain many nearly collinear shapepoints; a tolerance of a few meters can shrink the resulting dataframe considerably without a visible change in Leaflet or Cesium.
 
 	Returns
 	-------
@@ -291,7 +297,7 @@ def addAssignment2D(initAssignments=None, odID=1, objectID=None, modelFile=None,
 	"""
 	
 	# validatation
-	[valFlag, errorMsg, warningMsg] = valAddAssignment2D(initAssignments, odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs)
+	[valFlag, errorMsg, warningMsg] = valAddAssignment2D(initAssignments, odID, objectID, modelFile, startLoc, endLoc, startTimeSec, expDurationSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters)
 	
 	if (not valFlag):
 		print (errorMsg)
@@ -332,7 +338,8 @@ def addAssignment2D(initAssignments=None, odID=1, objectID=None, modelFile=None,
 		cesiumStyle      = cesiumStyle, 
 		cesiumOpacity    = cesiumOpacity, 
 		dataProvider     = dataProvider, 
-		dataProviderArgs = dataProviderArgs)
+		dataProviderArgs = dataProviderArgs,
+		simplifyToleranceMeters = simplifyToleranceMeters)
 
 	# Capture the end time
 	endTimeSec = max(tmpShapepoints['endTimeSec'])
@@ -730,6 +737,169 @@ def addAssignment3D(initAssignments=None, odID=1, objectID=None, modelFile=None,
 	return (assignmentsDF, endTimeSec)
 
 
+def createAssignmentsFromSorties3D(initAssignments=None, startLocs=None, endLocs=None, startTimeSec=0.0, earliestLandTime=-1, odID=1, objectID=None, modelFile=None, takeoffSpeedMPS=None, cruiseSpeedMPS=None, landSpeedMPS=None, cruiseAltMetersAGL=None, routeType='square', climbRateMPS=None, descentRateMPS=None, loiterPosition='arrivalAtAlt', leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY):
+
+	"""
+	This function generates an :ref:`Assignments` dataframe for a collection of flights ("sorties"), such as the drone deliveries of an entire day.  Each sortie is an independent flight from a start location to an end location, and produces the same rows as a call to `addAssignment3D()`.  All of the flight profiles are calculated at once, which is much faster than calling `addAssignment3D()` in a loop when there are thousands of sorties.
+
+	Note
+	----
+	All sorties in one call share the same `routeType` and `loiterPosition`.  The timing and vehicle parameters (`startTimeSec`, `earliestLandTime`, the speeds/rates and `cruiseAltMetersAGL`) may be given either as a single value that applies to every sortie, or as a list with one value per sortie.  `objectID` and `modelFile` may also be given per sortie.
+
+	Parameters
+	----------
+	initAssignments: :ref:`Assignments` dataframe, Optional, default as None
+		If provided, the function will append rows to this dataframe.
+	startLocs: list of lists, Required, default as None
+		The starting location of each sortie, in the form of [[lat1, lon1, alt1], [lat2, lon2, alt2], ...] or [[lat1, lon1], [lat2, lon2], ...].  If no altitude is provided, it will be assumed to be 0 meters above ground level.
+	endLocs: list of lists, Required, default as None
+		The ending location of each sortie, in the same format as `startLocs`.  `startLocs` and `endLocs` must have the same length.
+	startTimeSec: float or list, Optional, default as 0.0
+		The time, in seconds, at which each vehicle may leave its starting location.
+	earliestLandTime: float or list, Optional, default as -1
+		Specifies the earliest time, in seconds, that each vehicle is allowed to complete travel to its ending location.  The value of `-1` indicates that there is no restriction on the earliest landing time.  See `addAssignment3D()` for details.
+	odID: int, Optional, default as 1
+		The odID of the first sortie.  The i-th sortie (starting from 0) is assigned `odID + i`.  If `initAssignments` is provided, the odIDs start after the largest odID in that dataframe.
+	objectID: int/string or list, Optional, default as None
+		A descriptive name or index for the vehicle (e.g., 'blue drone'), or a list with one name per sortie.
+	modelFile: string or list, Optional, default as None
+		The relative path and filename of the 3D model associated with the vehicle, or a list with one model per sortie.  The path should be relative to the directory where Cesium is installed (i.e., the `modelFile` should exist within the Cesium root directory).
+	takeoffSpeedMPS: float or list, Conditional, default as None
+		The speed of the aircraft, in meters per second, during the "takeoff" phase.  See `addAssignment3D()` for details.
+	cruiseSpeedMPS: float or list, Conditional, default as None
+		The speed of the aircraft, in meters per second, during the "cruising" phase.  See `addAssignment3D()` for details.
+	landSpeedMPS: float or list, Conditional, default as None
+		The speed of the aircraft, in meters per second, during the "landing" phase.  See `addAssignment3D()` for details.
+	cruiseAltMetersAGL: float or list, Conditional, default as None
+		The altitude, in meters above ground level, at which the aircraft is in the "cruise" phase.  See `addAssignment3D()` for details.
+	routeType: string, Optional, default as 'square'
+		Specifies the basic shape of the flight profile.  Valid options include 'square', 'triangular', 'trapezoidal', and 'straight'.  See :ref:`Flight Profile and Flight Path` for a description of these flight profiles.
+	climbRateMPS: float or list, Conditional, default as None
+		This parameter is used only for the 'trapezoidal' route type, and is in units of meters per second.  See `addAssignment3D()` for details.
+	descentRateMPS: float or list, Conditional, default as None
+		This parameter is used only for the 'trapezoidal' route type, and is in units of meters per second.  See `addAssignment3D()` for details.
+	loiterPosition: string, Optional, default as 'arrivalAtAlt'
+		The position where the vehicles loiter if they would otherwise arrive before `earliestLandTime`.  Valid options are 'beforeTakeoff', 'takeoffAtAlt', 'arrivalAtAlt', 'afterLand'. See :ref:`Flight Profile and Flight Path` for details.
+	leafletColor: string, Optional, default as "orange"
+		The color of the routes when displayed in Leaflet.  See :ref:`Leaflet style` for a list of available colors.
+	leafletWeight: int, Optional, default as 3
+		The pixel width of the routes when displayed in Leaflet. 
+	leafletStyle: string, Optional, default as 'solid'
+		The line style of the routes when displayed in Leaflet.  Valid options are 'solid', 'dotted', and 'dashed'. See :ref:`Leaflet style` for more information.
+	leafletOpacity: float in [0, 1], Optional, default as 0.8
+		The opacity of the routes when displayed in Leaflet. Valid values are in the range from 0 (invisible) to 1 (no transparency). 
+	useArrows: bool, Optional, default as True
+		Indicates whether arrows should be shown on the routes when displayed in Leaflet.
+	modelScale: int, Optional, default as 100
+		The scale of the 3D model (specified by the `modelFile` argument) when displayed in Cesium, such that 100 represents 100%.
+	modelMinPxSize: int, Optional, default as 75
+		The minimum pixel size of the 3D model (specified by the `modelFile` argument) when displayed in Cesium.  When zooming out, the model will not be smaller than this size; zooming in can result in a larger model. 
+	cesiumColor: string, Optional, default as "Cesium.Color.ORANGE"
+		The color of the routes when displayed in Cesium.  See :ref:`Cesium Style` for a list of available colors.
+	cesiumWeight: int, Optional, default as 3
+		The pixel width of the routes when displayed in Cesium. 
+	cesiumStyle: string, Optional, default as 'solid'
+		The line style of the routes when displayed in Cesium.  Valid options are 'solid', 'dotted', and 'dashed'. See :ref:`Cesium Style` for more information.
+	cesiumOpacity: float in [0, 1], Optional, default as 0.8
+		The opacity of the routes when displayed in Cesium. Valid values are in the range from 0 (invisible) to 1 (no transparency). 
+
+	Return
+	------
+	:ref:`Assignments` dataframe
+		An :ref:`Assignments` dataframe containing the flights of all sorties, in the order the sorties were given.
+
+	Examples
+	--------
+	Import veroviz and check if it's the latest version:
+		>>> import veroviz as vrv
+		>>> vrv.checkVersion()
+
+	Generate 100 random customers around a depot:
+		>>> depot = [42.8871085, -78.8731949]
+		>>> myNodes = vrv.generateNodes(
+		...     numNodes        = 100,
+		...     nodeDistrib     = 'normal', 
+		...     nodeDistribArgs = {'center': depot, 'stdDev': 2000})
+
+	Each customer is served by an out-and-back drone flight from the depot.  A new flight departs every 2 minutes:
+		>>> customerLocs = myNodes[['lat', 'lon']].values.tolist()
+		>>> numSorties = len(customerLocs)
+		>>> startLocs = [depot] * numSorties + customerLocs
+		>>> endLocs = customerLocs + [depot] * numSorties
+		>>> departTimes = [120.0 * i for i in range(numSorties)]
+
+	Build the assignments for the outbound flights:
+		>>> myAssignments = vrv.createAssignmentsFromSorties3D(
+		...     startLocs          = startLocs[0:numSorties],
+		...     endLocs            = endLocs[0:numSorties],
+		...     startTimeSec       = departTimes,
+		...     objectID           = ['drone %d' % (i) for i in range(numSorties)],
+		...     modelFile          = 'veroviz/models/drone_package.gltf',
+		...     takeoffSpeedMPS    = vrv.convertSpeed(30, 'miles', 'hr', 'meters', 'sec'),
+		...     cruiseSpeedMPS     = vrv.convertSpeed(80, 'miles', 'hr', 'meters', 'sec'),
+		...     landSpeedMPS       = vrv.convertSpeed( 5, 'miles', 'hr', 'meters', 'sec'),
+		...     cruiseAltMetersAGL = vrv.convertDistance(350, 'feet', 'meters'),
+		...     routeType          = 'square')
+		>>> myAssignments
+
+	Show the flights on a map:
+		>>> vrv.createLeaflet(nodes=myNodes, arcs=myAssignments)
+	"""
+
+	# validatation
+	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromSorties3D(initAssignments, startLocs, endLocs, startTimeSec, earliestLandTime, odID, objectID, modelFile, takeoffSpeedMPS, cruiseSpeedMPS, landSpeedMPS, cruiseAltMetersAGL, routeType, climbRateMPS, descentRateMPS, loiterPosition, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
+	
+	if (not valFlag):
+		print (errorMsg)
+		return
+	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
+		print (warningMsg)
+
+	# Initialize an assignments dataframe:
+	assignmentsDF = initDataframe('assignments')
+
+	# if the user provided an initAssignments dataframe, add the new points after it
+	if (type(initAssignments) is pd.core.frame.DataFrame):
+		assignmentsDF = pd.concat([assignmentsDF, initAssignments], ignore_index=True, sort=False)
+
+		# Increase odID as necessary:
+		if (len(assignmentsDF) > 0):
+			odID = max(max(assignmentsDF['odID'])+1, odID)
+
+	tmpShapepoints = privGetShapepoints3DBatch(
+		odID               = odID, 
+		objectID           = objectID, 
+		modelFile          = modelFile, 
+		startTimeSec       = startTimeSec, 
+		startLocs          = startLocs, 
+		endLocs            = endLocs, 
+		takeoffSpeedMPS    = takeoffSpeedMPS, 
+		cruiseSpeedMPS     = cruiseSpeedMPS, 
+		landSpeedMPS       = landSpeedMPS, 
+		cruiseAltMetersAGL = cruiseAltMetersAGL, 
+		routeType          = routeType, 
+		climbRateMPS       = climbRateMPS, 
+		descentRateMPS     = descentRateMPS, 
+		earliestLandTime   = earliestLandTime, 
+		loiterPosition     = loiterPosition, 
+		leafletColor       = leafletColor, 
+		leafletWeight      = leafletWeight, 
+		leafletStyle       = leafletStyle, 
+		leafletOpacity     = leafletOpacity, 
+		useArrows          = useArrows, 
+		modelScale         = modelScale, 
+		modelMinPxSize     = modelMinPxSize, 
+		cesiumColor        = cesiumColor, 
+		cesiumWeight       = cesiumWeight, 
+		cesiumStyle        = cesiumStyle, 
+		cesiumOpacity      = cesiumOpacity)
+
+	# Update the assignments dataframe:
+	assignmentsDF = pd.concat([assignmentsDF, tmpShapepoints], ignore_index=True, sort=False)
+
+	return assignmentsDF
+
+
 def addStaticAssignment(initAssignments=None, odID=1, objectID=None, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, loc=None, startTimeSec=None, endTimeSec=None):
 
 	"""
@@ -846,7 +1016,7 @@ def addStaticAssignment(initAssignments=None, odID=1, objectID=None, modelFile=N
 
 	return assignments
 	
-def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=0.0, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None, leafletColor=None, leafletWeight=None, leafletStyle=None, leafletOpacity=None, useArrows=True, cesiumColor=None, cesiumWeight=None, cesiumStyle=None, cesiumOpacity=None, dataProvider=None, dataProviderArgs=None):
+def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=0.0, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None, leafletColor=None, leafletWeight=None, leafletStyle=None, leafletOpacity=None, useArrows=True, cesiumColor=None, cesiumWeight=None, cesiumStyle=None, cesiumOpacity=None, dataProvider=None, dataProviderArgs=None, simplifyToleranceMeters=None):
 	"""
 	This function generates an "assignments" dataframe containing all of the "shapepoints" between successive arcs, including timestamps indicating the departure and arrival times for each shapepoint. Shapepoints are pairs of GPS coordinates that are connected by straight lines.  For a particular origin and destination, numerous individual shapepoints can be combined to define a travel route along a road network.  
 
@@ -899,6 +1069,8 @@ def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=
 		Specifies the data source to be used for obtaining the shapepoints. See :ref:`Data Providers` for options and requirements.
 	dataProviderArgs: dictionary, Conditional, default as None
 		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	simplifyToleranceMeters: float, Optional, default as None
+		If provided, the route's shapepoints are simplified (using the Douglas-Peucker algorithm) such that no dropped shapepoint is more than `simplifyToleranceMeters` meters from the simplified route.  The remaining shapepoints keep their original timestamps, so the total travel time is not affected.  Road-network routes often contain many nearly collinear shapepoints; a tolerance of a few meters can shrink the resulting dataframe considerably without a visible change in Leaflet or Cesium.
 
 	Return
 	------
@@ -942,7 +1114,7 @@ def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=
 	"""
 	
 	# validatation
-	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromArcs2D(initAssignments, arcs, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs)
+	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromArcs2D(initAssignments, arcs, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters)
 	
 	if (not valFlag):
 		print (errorMsg)
@@ -1007,7 +1179,8 @@ def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=
 			cesiumStyle=cesiumStyle, 
 			cesiumOpacity=cesiumOpacity, 
 			dataProvider=dataProvider, 
-			dataProviderArgs=dataProviderArgs)
+			dataProviderArgs=dataProviderArgs, 
+			simplifyToleranceMeters=simplifyToleranceMeters)
 
 
 		# Update the assignments dataframe:
@@ -1039,7 +1212,7 @@ def createAssignmentsFromArcs2D(initAssignments=None, arcs=None, serviceTimeSec=
     			
 	return assignmentsDF
 
-def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=None, serviceTimeSec=0.0, odID=1, objectID=None, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None,   leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None):
+def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=None, serviceTimeSec=0.0, odID=1, objectID=None, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None,   leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None, simplifyToleranceMeters=None):
 	"""
 	This function generates an "assignments" dataframe containing all of the "shapepoints" between successive node locations, including timestamps indicating the departure and arrival times for each shapepoint. Shapepoints are pairs of GPS coordinates that are connected by straight lines.  For a particular origin and destination, numerous individual shapepoints can be combined to define a travel route along a road network.  
 
@@ -1047,6 +1220,7 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 	----
 	This function is for vehicles traveling on a ground plane (2-dimensional).  For vehicles requiring an altitude component (e.g., drones), a 3D version of this function is provided by `createAssignmentsFromNodeSeq3D()`.
 	This function creates an assignments dataframe from a sequence of nodes.  Similar functions are available to create an assignments dataframe from an arcs dataframe (`createShapepointsFromArcs2D()`) or from a sequence of locations (`createShapepointsFromLocSeq2D()`).
+	When the route type is served by OSRM, ORS or MapQuest, the whole sequence is sent to the data provider as one multi-waypoint route (split into chunks of at most `VRV_SETTING_OSRM_MAXWAYPOINTS`, `VRV_SETTING_ORS_MAXWAYPOINTS` or `VRV_SETTING_MAPQUEST_MAXWAYPOINTS` locations), rather than one request per leg.
 	
 	Parameters
 	----------
@@ -1068,7 +1242,7 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 		The time, in seconds, at which the vehicle may leave the starting location.
 	expDurationArgs: dictionary, Optional, default as None
 		Sometimes there are inconsistencies between the travel times specified in the turn-by-turn navigation (i.e., shapepoints) and the travel matrices (i.e., from the getTimeDist functions).  The `expDurationArgs` field may take three different values.
-		First, if `expDurationArgs` is `None` (default), the travel times will be based solely on the turn-by-turn times.  Second, if `expDurationArgs` is a dictionary with a key of `'timeSecDict'` and a corresponding value of a time dictionary (as output by `getTimeDist2D()`), then all shapepoint travel time will be adjusted/redistributed to match the values in the time dictionary.  Finally, if `expDurationArgs` is a dictionary with a key of `'getTravelTimes'` and a corresponding value of `True`, then this function will call the `getTimeDist2D()` function for each origin/destination pair.  In this case, all shapepoint travel times will be adjusted/redistributed to match the resulting values.
+		First, if `expDurationArgs` is `None` (default), the travel times will be based solely on the turn-by-turn times.  Second, if `expDurationArgs` is a dictionary with a key of `'timeSecDict'` and a corresponding value of a time dictionary (as output by `getTimeDist2D()`), then all shapepoint travel time will be adjusted/redistributed to match the values in the time dictionary.  Finally, if `expDurationArgs` is a dictionary with a key of `'getTravelTimes'` and a corresponding value of `True`, then this function will call the `getTimeDist2D()` function for each origin/destination pair.  In this case, all shapepoint travel times will be adjusted/redistributed to match the resulting values.  For OSRM, ORS and MapQuest, the legs of the multi-waypoint route already carry the data provider's travel times, so no additional requests are made.
 	routeType: string, Optional, default as 'euclidean2D'
 		This describes a characteristic of the travel mode.  Possible values are: 'euclidean2D', 'manhattan', 'fastest', 'shortest', 'pedestrian', 'cycling', and 'truck'.  The 'euclidean2D' and 'manhattan' options are calculated directly from GPS coordinates, without a road network.  Neither of these two options require a data provider.  However, the other options rely on road network information and require a data provider.  Furthermore, some of those other options are not supported by all data providers.  See :ref:`Data Providers` for details.
 	speedMPS: float, Conditional, default as None
@@ -1099,6 +1273,8 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 		Specifies the data source to be used for obtaining the shapepoints. See :ref:`Data Providers` for options and requirements.
 	dataProviderArgs: dictionary, Conditional, default as None
 		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	simplifyToleranceMeters: float, Optional, default as None
+		If provided, the route's shapepoints are simplified (using the Douglas-Peucker algorithm) such that no dropped shapepoint is more than `simplifyToleranceMeters` meters from the simplified route.  The remaining shapepoints keep their original timestamps, so the total travel time is not affected.  Road-network routes often contain many nearly collinear shapepoints; a tolerance of a few meters can shrink the resulting dataframe considerably without a visible change in Leaflet or Cesium.
 
 	Returns
 	-------
@@ -1213,7 +1389,7 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 	"""	
 	
 	# validatation
-	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs)
+	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromNodeSeq2D(initAssignments, nodeSeq, nodes, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters)
 	
 	if (not valFlag):
 		print (errorMsg)
@@ -1230,11 +1406,14 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 
 	startTime = startTimeSec
 
+	seqLocs = nodeIDs2Locs(nodes, nodeSeq)
+
+	# Fetch the shapepoints of all legs with one request for each chunk of the sequence (where the data provider allows it)
+	seqShapepoints = privGetShapepointsTimeDistSeq(seqLocs, routeType, dataProvider, dataProviderArgs)
+
 	for i in range(0, len(nodeSeq)-1):
-		startLoc = [nodes.loc[nodes['id'] == nodeSeq[i]]['lat'].values[0],
-					nodes.loc[nodes['id'] == nodeSeq[i]]['lon'].values[0]]
-		endLoc   = [nodes.loc[nodes['id'] == nodeSeq[i+1]]['lat'].values[0],
-					nodes.loc[nodes['id'] == nodeSeq[i+1]]['lon'].values[0]]
+		startLoc = seqLocs[i]
+		endLoc   = seqLocs[i+1]
 
 		if (expDurationArgs == None):
 			expDurationSec = None
@@ -1242,7 +1421,10 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 			# The user has provided a time dictionary
 			expDurationSec = expDurationArgs['timeSecDict'][nodeSeq[i], nodeSeq[i+1]]	
 		elif ('getTravelTimes' in expDurationArgs):
-			if (expDurationArgs['getTravelTimes']):
+			if (seqShapepoints[i] is not None):
+				# The shapepoints already carry the data provider's travel time for this leg
+				expDurationSec = None
+			elif (expDurationArgs['getTravelTimes']):
 				# Call the data provider to get travel time
 				[dicTime, dicDist] = getTimeDistFromLocs2D(fromLocs=[startLoc], fromRows=[0], toLocs=[endLoc], toCols=[0], outputDistUnits='meters', outputTimeUnits='seconds', routeType=routeType, speedMPS=speedMPS, dataProvider=dataProvider, dataProviderArgs=dataProviderArgs)
 
@@ -1270,7 +1452,9 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 			cesiumStyle=cesiumStyle, 
 			cesiumOpacity=cesiumOpacity, 
 			dataProvider=dataProvider, 
-			dataProviderArgs=dataProviderArgs)
+			dataProviderArgs=dataProviderArgs, 
+			simplifyToleranceMeters=simplifyToleranceMeters, 
+			shapepointsTimeDist=seqShapepoints[i])
 
 
 		# Update the assignments dataframe:
@@ -1304,7 +1488,7 @@ def createAssignmentsFromNodeSeq2D(initAssignments=None, nodeSeq=None, nodes=Non
 	
 	
 
-def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTimeSec=0.0, odID=1, objectID=None, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None):
+def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTimeSec=0.0, odID=1, objectID=None, modelFile=None, modelScale=VRV_DEFAULT_CESIUMMODELSCALE, modelMinPxSize=VRV_DEFAULT_CESIUMMODELMINPXSIZE, startTimeSec=0.0, expDurationArgs=None, routeType='euclidean2D', speedMPS=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY, dataProvider=None, dataProviderArgs=None, simplifyToleranceMeters=None):
 	"""
 	This function generates an "assignments" dataframe containing all of the "shapepoints" between successive locations, including timestamps indicating the departure and arrival times for each shapepoint. Shapepoints are pairs of GPS coordinates that are connected by straight lines.  For a particular origin and destination, numerous individual shapepoints can be combined to define a travel route along a road network.  
 
@@ -1312,6 +1496,7 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 	----
 	This function is for vehicles traveling on a ground plane (2-dimensional).  For vehicles requiring an altitude component (e.g., drones), a 3D version of this function is provided by `createAssignmentsFromLocSeq3D()`.
 	This function creates an assignments dataframe from a sequence of [lat, lon] locations.  Similar functions are available to create an assignments dataframe from an arcs dataframe (`createShapepointsFromArcs2D()`) or from a sequence of nodes (`createShapepointsFromNodeSeq2D()`).
+	When the route type is served by OSRM, ORS or MapQuest, the whole sequence is sent to the data provider as one multi-waypoint route (split into chunks of at most `VRV_SETTING_OSRM_MAXWAYPOINTS`, `VRV_SETTING_ORS_MAXWAYPOINTS` or `VRV_SETTING_MAPQUEST_MAXWAYPOINTS` locations), rather than one request per leg.
 	
 	Parameters
 	----------
@@ -1331,7 +1516,7 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 		The time, in seconds, at which the vehicle may leave the starting location.
 	expDurationArgs: dictionary, Optional, default as None
 		Sometimes there are inconsistencies between the travel times specified in the turn-by-turn navigation (i.e., shapepoints) and the travel matrices (i.e., from the getTimeDist functions).  The `expDurationArgs` field may take two different values.
-		First, if `expDurationArgs` is `None` (default), the travel times will be based solely on the turn-by-turn times.  Second, if `expDurationArgs` is a dictionary with a key of `'getTravelTimes'` and a corresponding value of `True`, then this function will call the `getTimeDist2D()` function for each origin/destination pair.  In this case, all shapepoint travel times will be adjusted/redistributed to match the resulting values.
+		First, if `expDurationArgs` is `None` (default), the travel times will be based solely on the turn-by-turn times.  Second, if `expDurationArgs` is a dictionary with a key of `'getTravelTimes'` and a corresponding value of `True`, then this function will call the `getTimeDist2D()` function for each origin/destination pair.  In this case, all shapepoint travel times will be adjusted/redistributed to match the resulting values.  For OSRM, ORS and MapQuest, the legs of the multi-waypoint route already carry the data provider's travel times, so no additional requests are made.
 	routeType: string, Optional, default as 'euclidean2D'
 		This describes a characteristic of the travel mode.  Possible values are: 'euclidean2D', 'manhattan', 'fastest', 'shortest', 'pedestrian', 'cycling', and 'truck'.  The 'euclidean2D' and 'manhattan' options are calculated directly from GPS coordinates, without a road network.  Neither of these two options require a data provider.  However, the other options rely on road network information and require a data provider.  Furthermore, some of those other options are not supported by all data providers.  See :ref:`Data Providers` for details.
 	speedMPS: float, Conditional, default as None
@@ -1362,6 +1547,8 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 		Specifies the data source to be used for obtaining the shapepoints. See :ref:`Data Providers` for options and requirements.
 	dataProviderArgs: dictionary, Conditional, default as None
 		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	simplifyToleranceMeters: float, Optional, default as None
+		If provided, the route's shapepoints are simplified (using the Douglas-Peucker algorithm) such that no dropped shapepoint is more than `simplifyToleranceMeters` meters from the simplified route.  The remaining shapepoints keep their original timestamps, so the total travel time is not affected.  Road-network routes often contain many nearly collinear shapepoints; a tolerance of a few meters can shrink the resulting dataframe considerably without a visible change in Leaflet or Cesium.
 
 	Returns
 	-------
@@ -1450,7 +1637,7 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 	"""	
 	
 	# validatation
-	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromLocSeq2D(initAssignments, locSeq, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs)
+	[valFlag, errorMsg, warningMsg] = valCreateAssignmentsFromLocSeq2D(initAssignments, locSeq, serviceTimeSec, modelScale, modelMinPxSize, expDurationArgs, odID, objectID, modelFile, startTimeSec, routeType, speedMPS, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, dataProvider, dataProviderArgs, simplifyToleranceMeters)
 	
 	if (not valFlag):
 		print (errorMsg)
@@ -1467,6 +1654,9 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 
 	startTime = startTimeSec
 
+	# Fetch the shapepoints of all legs with one request for each chunk of the sequence (where the data provider allows it)
+	seqShapepoints = privGetShapepointsTimeDistSeq(locSeq, routeType, dataProvider, dataProviderArgs)
+
 	for i in range(0, len(locSeq)-1):
 		startLoc = locSeq[i]
 		endLoc   = locSeq[i+1]
@@ -1474,7 +1664,10 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 		if (expDurationArgs == None):
 			expDurationSec = None
 		elif ('getTravelTimes' in expDurationArgs):
-			if (expDurationArgs['getTravelTimes']):
+			if (seqShapepoints[i] is not None):
+				# The shapepoints already carry the data provider's travel time for this leg
+				expDurationSec = None
+			elif (expDurationArgs['getTravelTimes']):
 				# Call the data provider to get travel time
 				[dicTime, dicDist] = getTimeDistFromLocs2D(fromLocs=[startLoc], fromRows=[0], toLocs=[endLoc], toCols=[0], outputDistUnits='meters', outputTimeUnits='seconds', routeType=routeType, speedMPS=speedMPS, dataProvider=dataProvider, dataProviderArgs=dataProviderArgs)
 
@@ -1502,7 +1695,9 @@ def createAssignmentsFromLocSeq2D(initAssignments=None, locSeq=None, serviceTime
 			cesiumStyle=cesiumStyle, 
 			cesiumOpacity=cesiumOpacity, 
 			dataProvider=dataProvider, 
-			dataProviderArgs=dataProviderArgs)
+			dataProviderArgs=dataProviderArgs, 
+			simplifyToleranceMeters=simplifyToleranceMeters, 
+			shapepointsTimeDist=seqShapepoints[i])
 
 
 		# Update the assignments dataframe:
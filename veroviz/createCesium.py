@@ -5,12 +5,14 @@ from veroviz._deconstructAssignments import deconstructAssignments
 from veroviz._internal import delTailSlash
 from veroviz._internal import delHeadSlash
 from veroviz._internal import addHeadSlash
+from veroviz._internal import addHeadSlashToModelFiles
 from veroviz._internal import replaceBackslashToSlash
+from veroviz._geometry import geoSimplifyTrajectory
 
 from veroviz.utilities import getMapBoundary
 from veroviz.utilities import exportDataframe
 
-def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:00', postBuffer=30, cesiumDir=None, problemDir=None, nodeColor=None, nodeStyle=None, pathColor=None, pathWeight=None, pathStyle=None, pathOpacity=None):
+def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:00', postBuffer=30, cesiumDir=None, problemDir=None, nodeColor=None, nodeStyle=None, pathColor=None, pathWeight=None, pathStyle=None, pathOpacity=None, incremental=False, trajectoryToleranceMeters=None):
 	"""
 	This function generates several files required to view a solution in Cesium. The function requires assignments and/or nodes dataframes as input. 
 
@@ -42,6 +44,10 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 		Overrides the `cesiumStyle` column of the input `assignments` dataframe. This will define the style of all arcs displayed in Cesium. See :ref:`Cesium Style` for available options.
 	pathOpacity: float in [0, 1], Optional, default as None
 		Overrides the `cesiumOpacity` column of the input `assignments` dataframe.  This will define the opacity of all arcs displayed in Cesium.  See :ref:`Cesium Style` for more information.
+	incremental: boolean, Optional, default as False
+		If True, the routes and paths of each object are written to their own files, named by a hash of that object's inputs, and a `manifest.json` records the hash of every file.  When `createCesium()` is called again for the same `problemDir`, only the files whose inputs changed are rewritten.  This is useful when a scenario is re-exported often (e.g., after each replan) and only a few objects change each time.
+	trajectoryToleranceMeters: float, Optional, default as None
+		If provided, the time-sampled positions of moving objects in the .czml output are compressed: a sample is dropped if interpolating linearly in time between the remaining samples puts the object within this many meters of the sample, at the same time.  The remaining samples are also written more compactly.  For road-following vehicles, which have long runs of collinear shapepoints at constant speed, this greatly reduces the size of the .czml file.  If None, every shapepoint is written.
 
 	Return
 	------
@@ -57,6 +63,8 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 	- displayPath.js
 	- routes.czml
 
+	If `incremental` is True, `routes.czml` is replaced by one `routes/[hash].czml` file per object, the paths of each object are written to `paths/[hash].js` (loaded by `displayPaths.js`), and `manifest.json` lists all of these files.
+
 	Instructions for starting Cesium are provided at https://veroviz.org/documentation.html
 
 	Example
@@ -96,7 +104,7 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 	"""
 
 	# validation
-	[valFlag, errorMsg, warningMsg] = valCreateCesium(assignments, nodes, startDate, startTime, postBuffer, cesiumDir, problemDir, nodeColor, pathColor, pathWeight, pathStyle, pathOpacity)
+	[valFlag, errorMsg, warningMsg] = valCreateCesium(assignments, nodes, startDate, startTime, postBuffer, cesiumDir, problemDir, nodeColor, pathColor, pathWeight, pathStyle, pathOpacity, incremental, trajectoryToleranceMeters)
 	if (not valFlag):
 		print (errorMsg)
 		return
@@ -107,6 +115,10 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 	if (startDate is None):
 		startDate = datetime.date.today()
 
+	# Model files are relative to the Cesium directory (also needed if validation is off)
+	if (assignments is not None):
+		addHeadSlashToModelFiles(assignments)
+
 	# Some modification about slashes:
 	# cesiumDir - no tail slash
 	# problemDir - no head slash and no tail slash
@@ -136,6 +148,10 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 		path.at[i, 'intervalEnd'] = _getCesiumTime(startDate, startTime, path.at[i, 'endTimeSec']) if (path.at[i, 'endTimeSec'] >= 0) else availEnd
 	path.drop(columns = ['startTimeSec', 'endTimeSec'])
 
+	if (incremental):
+		_writeIncremental(assignments, nodes, path, lstSubAssignments, lstNonStationarySubAssignments, startDate, startTime, availStart, availEnd, fullDir, problemDir, nodeColor, pathColor, pathWeight, pathStyle, pathOpacity, trajectoryToleranceMeters)
+		return
+
 	# Write problem selector
 	_writeSelector(fullDir, problemDir)
 
@@ -150,7 +166,159 @@ def createCesium(assignments=None, nodes=None, startDate=None, startTime='08:00:
 	# Write Assignments
 	if (len(path) > 0):
 		_writeAssignmentsJS(lstNonStationarySubAssignments, pathColor, pathWeight, pathStyle, pathOpacity, fullDir)
-		_writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir)
+		_writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir, trajectoryToleranceMeters=trajectoryToleranceMeters)
+
+	return
+
+def _getInputsHash(*inputs):
+	"""
+	Returns a hash of the given dataframes and values, used by incremental exports to find the sections whose inputs have not changed.
+	"""
+
+	inputsHash = hashlib.sha1()
+	for value in inputs:
+		if (isinstance(value, pd.DataFrame)):
+			inputsHash.update(repr(list(value.columns)).encode('utf-8'))
+			inputsHash.update(pd.util.hash_pandas_object(value, index=False).values.tobytes())
+		else:
+			inputsHash.update(repr(value).encode('utf-8'))
+
+	return inputsHash.hexdigest()[0:16]
+
+def _writeIncremental(assignments, nodes, path, lstSubAssignments, lstNonStationarySubAssignments, startDate, startTime, availStart, availEnd, fullDir, problemDir, nodeColor, pathColor, pathWeight, pathStyle, pathOpacity, trajectoryToleranceMeters):
+	"""
+	Writes the files of an incremental export, skipping the sections whose inputs are unchanged since the last export (as recorded in `manifest.json`).
+
+	The routes (.czml) and paths (.js) of each object are written to `routes/[hash].czml` and `paths/[hash].js`, where [hash] is computed from that object's assignments and the display settings.  Files of objects that no longer exist (or have changed) are removed.  `config.js` and `displayPaths.js` load the files listed in the manifest.
+	"""
+
+	manifestFilePath = '%s/manifest.json' % (fullDir)
+	try:
+		with open(manifestFilePath, 'r') as f:
+			oldSections = json.load(f)['sections']
+	except:
+		oldSections = {}
+
+	sections = {}
+	def isUnchanged(sectionName, inputsHash, fileName):
+		sections[sectionName] = {'hash': inputsHash, 'file': fileName}
+		return (oldSections.get(sectionName) == sections[sectionName] and os.path.isfile('%s/%s' % (fullDir, fileName)))
+
+	for subDir in ['routes', 'paths']:
+		if not os.path.exists('%s/%s' % (fullDir, subDir)):
+			os.makedirs('%s/%s' % (fullDir, subDir), exist_ok=True)
+
+	# Routes and paths, one file of each per object
+	czmlRouteFiles = []
+	pathFiles = []
+	pathNames = []
+	numObjects = 0
+	numUnchanged = 0
+	styleInputs = [startDate, startTime, availStart, pathColor, pathWeight, pathStyle, pathOpacity, trajectoryToleranceMeters]
+	for (objectID, objectAssignments) in assignments.groupby('objectID', sort=False):
+		# Each object is available until its own last interval ends, so that a change to the end of the whole scenario does not change every object
+		objectPath = path.loc[path['objectID'] == objectID]
+		objectAvailEnd = max(objectPath['intervalEnd'])
+		objectHash = _getInputsHash(objectAssignments, objectAvailEnd, *styleInputs)
+		czmlFileName = 'routes/%s.czml' % (objectHash)
+		czmlRouteFiles.append({
+			'file': czmlFileName,
+			'allIDs': list(dict.fromkeys(objectPath['czmlID'].tolist())),
+			'orientationIDs': list(dict.fromkeys(objectPath.loc[objectPath['action'] == "move", 'czmlID'].tolist()))})
+
+		numObjects += 1
+		changed = False
+		if (len(objectPath) > 0 and not isUnchanged('routes-%s' % (objectID), objectHash, czmlFileName)):
+			_writeAssignmentsCZML(objectPath, lstSubAssignments, availStart, objectAvailEnd, fullDir, fileName=czmlFileName, trajectoryToleranceMeters=trajectoryToleranceMeters)
+			changed = True
+
+		objectSubAssignments = [subAssignments for subAssignments in lstNonStationarySubAssignments if (subAssignments.iloc[0]['objectID'] == objectID)]
+		if (len(objectSubAssignments) > 0):
+			pathFileName = 'paths/%s.js' % (objectHash)
+			pathFiles.append(pathFileName)
+			pathNames.append(objectID)
+			if (not isUnchanged('paths-%s' % (objectID), objectHash, pathFileName)):
+				_writeAssignmentsJS(objectSubAssignments, pathColor, pathWeight, pathStyle, pathOpacity, fullDir, fileName=pathFileName, fragment=True)
+				changed = True
+
+		if (not changed):
+			numUnchanged += 1
+
+	# Remove the files of objects that changed or no longer exist
+	currentFiles = [section['file'] for section in sections.values()]
+	for subDir in ['routes', 'paths']:
+		for fileName in os.listdir('%s/%s' % (fullDir, subDir)):
+			if ('%s/%s' % (subDir, fileName) not in currentFiles):
+				os.remove('%s/%s/%s' % (fullDir, subDir, fileName))
+
+	# Selector, configs, nodes, and the loader for paths
+	if (not isUnchanged('selector', _getInputsHash(problemDir), '%s.vrv' % (addHeadSlash(problemDir).replace("/", ";")))):
+		_writeSelector(fullDir, problemDir)
+
+	mapBoundary = getMapBoundary(nodes=nodes, arcs=assignments, locs=None)
+	if (not isUnchanged('config', _getInputsHash(mapBoundary, availStart, path.drop(columns=['indexInlstShapepoints']), problemDir, czmlRouteFiles), 'config.js')):
+		_writeConfigs(mapBoundary, availStart, path, fullDir, problemDir, czmlRouteFiles=czmlRouteFiles)
+
+	if (nodes is not None):
+		if (not isUnchanged('nodes', _getInputsHash(nodes, nodeColor), 'displayNodes.js')):
+			_writeNodes(nodes, nodeColor, fullDir)
+
+	if (not isUnchanged('displayPaths', _getInputsHash(problemDir, pathNames, pathFiles), 'displayPaths.js')):
+		_writePathsLoader(pathNames, pathFiles, fullDir, problemDir)
+
+	# Write the manifest last, so that an interrupted export is redone the next time
+	with open(manifestFilePath + '.tmp', 'w') as f:
+		json.dump({'version': 1, 'routes': [routeFile['file'] for routeFile in czmlRouteFiles], 'paths': pathFiles, 'sections': sections}, f, indent=1)
+	os.replace(manifestFilePath + '.tmp', manifestFilePath)
+
+	if (VRV_SETTING_SHOWOUTPUTMESSAGE):
+		print("Message: %d of %d objects were unchanged and were not rewritten.  Manifest was written to %s ..." % (numUnchanged, numObjects, manifestFilePath))
+
+	return
+
+def _writePathsLoader(pathNames, pathFiles, fullDir, problemDir):
+
+	"""
+	This script generates the displayPaths.js file of an incremental export, which loads the paths of each object from its own .js file
+
+	Parameters
+	----------
+	pathNames: list
+		The objectIDs of the moving objects
+	pathFiles: list of strings
+		The .js files with the paths of each object, relative to `fullDir`
+	fullDir: string
+		The directory of cesium, including the name of the instance.
+	problemDir: string
+		The name of the instance
+	"""
+
+	# .js file path
+	jsFilePath = '%s/displayPaths.js' % (fullDir)
+
+	# Head description
+	jsStr  = "// This .js file is auto-generated by `createCesium` from VeRoViz\n"
+	jsStr += "// Display paths for cesium application\n\n"
+
+	jsStr += "function displayPaths() {\n"
+	jsStr += "    var pathNames = %s; \n" % (json.dumps([str(pathName) for pathName in pathNames]))
+	jsStr += "    registerPaths(pathNames); \n"
+	jsStr += "    var pathFiles = %s; \n" % (json.dumps(['/%s/%s' % (problemDir, pathFile) for pathFile in pathFiles]))
+	jsStr += "    for (var i = 0; i < pathFiles.length; i++) {\n"
+	jsStr += "        var script = document.createElement('script');\n"
+	jsStr += "        script.src = pathFiles[i];\n"
+	jsStr += "        script.async = false;\n"
+	jsStr += "        document.head.appendChild(script);\n"
+	jsStr += "    }\n"
+	jsStr += "}"
+
+	# Write contents and close file stream
+	f = open(jsFilePath, 'w')
+	f.write(jsStr)
+	f.close()
+
+	if (VRV_SETTING_SHOWOUTPUTMESSAGE):
+		print("Message: Assignments (.js) were written to %s ..." % (jsFilePath))
 
 	return
 
@@ -184,7 +352,7 @@ def _writeSelector(fullDir, problemDir):
 
 	return
 
-def _writeConfigs(mapBoundary, availStart, path, fullDir, problemDir):
+def _writeConfigs(mapBoundary, availStart, path, fullDir, problemDir, czmlRouteFiles=None):
 
 	"""
 	This script generates config.js file
@@ -205,6 +373,8 @@ def _writeConfigs(mapBoundary, availStart, path, fullDir, problemDir):
 		The directory of cesium, including the name of the instance.
 	problemDir: string
 		The name of the instance
+	czmlRouteFiles: list of dictionaries, Optional
+		For incremental exports, the .czml files to load (relative to `problemDir`), each as a dictionary with keys 'file', 'allIDs', and 'orientationIDs'.  If None, `routes.czml` is loaded.
 	"""
 	# Decode
 	allIDs = list(dict.fromkeys(path['czmlID'].tolist()))
@@ -248,8 +418,14 @@ def _writeConfigs(mapBoundary, availStart, path, fullDir, problemDir):
 	jsStr +=         "    ];\n"
 
 	# load .czml, `runRoutes()` are writen in index.html 
-	jsStr +=         "    czmlRouteFile = '%s/routes.czml';\n" % ("/" + problemDir)
-	jsStr +=         "    runRoutes(czmlRouteFile, allIDs, orientationIDs);\n"
+	if (czmlRouteFiles is None):
+		jsStr +=     "    czmlRouteFile = '%s/routes.czml';\n" % ("/" + problemDir)
+		jsStr +=     "    runRoutes(czmlRouteFile, allIDs, orientationIDs);\n"
+	else:
+		jsStr +=     "    czmlRouteFiles = %s;\n" % (json.dumps([dict(routeFile, file='/%s/%s' % (problemDir, routeFile['file'])) for routeFile in czmlRouteFiles]))
+		jsStr +=     "    for (var i = 0; i < czmlRouteFiles.length; i++) {\n"
+		jsStr +=     "        runRoutes(czmlRouteFiles[i].file, czmlRouteFiles[i].allIDs, czmlRouteFiles[i].orientationIDs);\n"
+		jsStr +=     "    }\n"
 
 	# Get all unrepeated objectID, modelID, child model
 	# The hierarchy is: objectID (one) - modelID (many), modelID (one) - child model (many)
@@ -257,22 +433,28 @@ def _writeConfigs(mapBoundary, availStart, path, fullDir, problemDir):
 	# objectID - UAV, 
 	# model - UAV-drone.gltf; UAV-drone_package.gltf, 
 	# child model - 'o-UAV-drone_package.gltf-move'; 'o-UAV-drone_package.gltf-vertical'; 'o-UAV-drone_package.gltf-stationary'
-	objectIDs = list(dict.fromkeys(path['objectID'].tolist()))
-	for i in range(len(objectIDs)):
-		models = list(dict.fromkeys(path.loc[path['objectID'] == objectIDs[i], 'modelFile'].tolist()))
-		for j in range(len(models)):
-			childModels = list(dict.fromkeys(path.loc[(path['objectID'] == objectIDs[i]) & (path['modelFile'] == models[j]), 'action'].tolist()))
-			strChildModels = ""
-			for k in range(len(childModels)):
-				strChildModels += "'o-%s-%s-%s', " % (objectIDs[i], models[j], childModels[k])
-			if (strChildModels != ""):
-				strChildModels = strChildModels[:-2]
-			jsStr += "objectInfo['%s-%s'] = {\n" % (objectIDs[i], models[j])
-			jsStr += "    label : '%s (%s)', \n" % (objectIDs[i], models[j])
-			jsStr += "    childModels : [%s],\n" % (strChildModels)
-			jsStr += "    scale : %s, \n" % (path.loc[(path['objectID'] == objectIDs[i]) & (path['modelFile'] == models[j]), 'modelScale'].tolist()[0])
-			jsStr += "    minPxSize : %s \n" %  (path.loc[(path['objectID'] == objectIDs[i]) & (path['modelFile'] == models[j]), 'modelMinPxSize'].tolist()[0])
-			jsStr += "}; \n"
+	# Objects are listed in order of first appearance, and the models of each object in order of first appearance
+	objectModels = path[['objectID', 'modelFile', 'modelScale', 'modelMinPxSize']].assign(
+		objectOrder = pd.factorize(path['objectID'])[0],
+		rowOrder = np.arange(len(path)))
+	objectModels = objectModels.groupby(['objectID', 'modelFile'], sort=False, dropna=False).first().reset_index()
+	objectModels = objectModels.sort_values(['objectOrder', 'rowOrder'], kind='stable')
+
+	# Child models (one per action) of each (objectID, modelFile)
+	childModels = {}
+	for (objectID, modelFile, action) in path[['objectID', 'modelFile', 'action']].drop_duplicates().itertuples(index=False):
+		childModels.setdefault((objectID, modelFile), []).append("'o-%s-%s-%s'" % (objectID, modelFile, action))
+
+	objectInfoStr = []
+	for (objectID, modelFile, modelScale, modelMinPxSize) in objectModels[['objectID', 'modelFile', 'modelScale', 'modelMinPxSize']].itertuples(index=False):
+		objectInfoStr.append(
+			"objectInfo['%s-%s'] = {\n" % (objectID, modelFile) +
+			"    label : '%s (%s)', \n" % (objectID, modelFile) +
+			"    childModels : [%s],\n" % (", ".join(childModels[objectID, modelFile])) +
+			"    scale : %s, \n" % (modelScale) +
+			"    minPxSize : %s \n" %  (modelMinPxSize) +
+			"}; \n")
+	jsStr += "".join(objectInfoStr)
 
 	# Register objects
 	jsStr +=         "    registerObjects(objectInfo); \n"
@@ -294,6 +476,8 @@ def _writeNodes(nodes, cesiumIconColor, fullDir):
 	"""
 	This script generates displayNodes.js file
 
+	The nodes are written as a compact, column-oriented JSON array (colors are stored once, in a palette), followed by a small static loader.  In the browser, `displayNodes()` adds all pins to a single `BillboardCollection`, with one pin image per color, and draws the node ids over the pins with a single `LabelCollection` (which renders each character once).  This keeps both the file size and the browser load time flat as the number of nodes grows.
+
 	Parameters
 	----------
 	nodes: :ref:`Nodes`
@@ -306,30 +490,68 @@ def _writeNodes(nodes, cesiumIconColor, fullDir):
 
 	# .js file path
 	jsFilePath = '%s/displayNodes.js' % (fullDir)
-	f = open(jsFilePath, 'w')
+
+	# Colors are Cesium expressions (e.g., 'Cesium.Color.ORANGE'), so they are written as a palette of JS values, and referenced by index
+	if (cesiumIconColor != None):
+		[colorIndex, palette] = [np.zeros(len(nodes), dtype=int), [cesiumIconColor]]
+	else:
+		[colorIndex, palette] = pd.factorize(nodes['cesiumColor'], sort=False)
+
+	nodeData = {
+		'id': [str(nodeID) for nodeID in nodes['id'].tolist()],
+		'name': [str(text) for text in nodes['cesiumIconText'].tolist()],
+		'lat': nodes['lat'].tolist(),
+		'lon': nodes['lon'].tolist(),
+		'color': colorIndex.tolist()
+	}
 
 	# Head description
-	jsStr  =     "// This .js file is auto-generated by `createCesium()` from VeRoViz\n"
-	jsStr +=     "// Display nodes for cesium application\n\n"
-
-	# In case some there is skipped index
-	indNodes = nodes.copy().reset_index(drop=True)
-
-	# Display the nodes
-	jsStr +=     "function displayNodes() {\n"
-	jsStr +=     "    var pin = new Array;\n"
-	for i in range(0, len(indNodes)):
-		jsStr += "    pin[%s] = viewer.entities.add({\n" % (i)
-		jsStr += "        name : '%s',\n" % (indNodes.iloc[i]['cesiumIconText'])
-		jsStr += "        position : Cesium.Cartesian3.fromDegrees(%s, %s),\n" % (indNodes.iloc[i]['lon'], indNodes.iloc[i]['lat'])
-		jsStr += "        billboard : {\n"
-		jsStr += "            image : pinBuilder.fromText('%s', %s, 40).toDataURL(),\n" % (indNodes.iloc[i]['id'], cesiumIconColor if (cesiumIconColor != None) else indNodes.iloc[i]['cesiumColor'])
-		jsStr += "            verticalOrigin : Cesium.VerticalOrigin.BOTTOM\n"
-		jsStr += "        }\n"
-		jsStr += "    });\n\n"
-	jsStr +=     "}"
+	jsStr  = "// This .js file is auto-generated by `createCesium()` from VeRoViz\n"
+	jsStr += "// Display nodes for cesium application\n\n"
+
+	# Node data
+	jsStr += "var nodeColors = [%s];\n" % (", ".join([str(color) for color in palette]))
+	jsStr += "var nodeData = %s;\n\n" % (json.dumps(nodeData, separators=(',', ':')))
+
+	# Static loader
+	jsStr += "var nodeBillboards;\n"
+	jsStr += "var nodeLabels;\n\n"
+	jsStr += "function displayNodes() {\n"
+	jsStr += "    if (nodeBillboards !== undefined) {\n"
+	jsStr += "        viewer.scene.primitives.remove(nodeBillboards);\n"
+	jsStr += "        viewer.scene.primitives.remove(nodeLabels);\n"
+	jsStr += "    }\n"
+	jsStr += "    nodeBillboards = viewer.scene.primitives.add(new Cesium.BillboardCollection());\n"
+	jsStr += "    nodeLabels = viewer.scene.primitives.add(new Cesium.LabelCollection());\n"
+	jsStr += "    var pinImages = [];\n"
+	jsStr += "    for (var i = 0; i < nodeData.id.length; i++) {\n"
+	jsStr += "        var color = nodeData.color[i];\n"
+	jsStr += "        if (pinImages[color] === undefined) {\n"
+	jsStr += "            pinImages[color] = pinBuilder.fromColor(nodeColors[color], 40).toDataURL();\n"
+	jsStr += "        }\n"
+	jsStr += "        var position = Cesium.Cartesian3.fromDegrees(nodeData.lon[i], nodeData.lat[i]);\n"
+	jsStr += "        nodeBillboards.add({\n"
+	jsStr += "            id : {name : nodeData.name[i]},\n"
+	jsStr += "            position : position,\n"
+	jsStr += "            image : pinImages[color],\n"
+	jsStr += "            verticalOrigin : Cesium.VerticalOrigin.BOTTOM\n"
+	jsStr += "        });\n"
+	jsStr += "        nodeLabels.add({\n"
+	jsStr += "            id : {name : nodeData.name[i]},\n"
+	jsStr += "            position : position,\n"
+	jsStr += "            text : nodeData.id[i],\n"
+	jsStr += "            font : 'bold 12px sans-serif',\n"
+	jsStr += "            fillColor : Cesium.Color.WHITE,\n"
+	jsStr += "            horizontalOrigin : Cesium.HorizontalOrigin.CENTER,\n"
+	jsStr += "            verticalOrigin : Cesium.VerticalOrigin.CENTER,\n"
+	jsStr += "            pixelOffset : new Cesium.Cartesian2(0, -26),\n"
+	jsStr += "            eyeOffset : new Cesium.Cartesian3(0, 0, -1)\n"
+	jsStr += "        });\n"
+	jsStr += "    }\n"
+	jsStr += "}"
 
 	# Write contents and close file stream
+	f = open(jsFilePath, 'w')
 	f.write(jsStr)
 	f.close()
 
@@ -338,7 +560,7 @@ def _writeNodes(nodes, cesiumIconColor, fullDir):
 
 	return
 
-def _writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir):
+def _writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir, fileName='routes.czml', trajectoryToleranceMeters=None):
 
 	"""
 	This script generates routes.czml file
@@ -355,10 +577,14 @@ def _writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir
 		End time of entire .czml file
 	fullDir: string
 		The directory of cesium, including the name of the instance.
+	fileName: string, Optional, default as 'routes.czml'
+		The name of the .czml file, relative to `fullDir`.
+	trajectoryToleranceMeters: float, Optional, default as None
+		If provided, drop the samples that linear interpolation reconstructs within this tolerance, and write the remaining samples compactly.
 	"""
 
 	# .czml file path
-	czmlFilePath = '%s/routes.czml' % (fullDir)
+	czmlFilePath = '%s/%s' % (fullDir, fileName)
 	f = open(czmlFilePath, 'w')
 
 	# Group the path, so that the path with the same czmlID can ends up with the same block
@@ -427,13 +653,16 @@ def _writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir
 				lats = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']]['startLat'].tolist()
 				lons = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']]['startLon'].tolist()
 				alts = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']]['startAltMeters'].tolist()
-				for k in range(0, len(lats)):
-					czmlStr += '                %.2f, %f, %f, %f, \n' % (time[k], lons[k], lats[k], alts[k])
 				lastTime = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']].iloc[-1]['endTimeSec']
 				lastLat = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']].iloc[-1]['endLat']
 				lastLon = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']].iloc[-1]['endLon']
 				lastAlt = lstSubAssignments[lstCzml[i].iloc[j]['indexInlstShapepoints']].iloc[-1]['endAltMeters']
-				czmlStr +=     '                %.2f, %f, %f, %f \n' % (lastTime, lastLon, lastLat, lastAlt)
+				if (trajectoryToleranceMeters is None):
+					for k in range(0, len(lats)):
+						czmlStr += '                %.2f, %f, %f, %f, \n' % (time[k], lons[k], lats[k], alts[k])
+					czmlStr +=     '                %.2f, %f, %f, %f \n' % (lastTime, lastLon, lastLat, lastAlt)
+				else:
+					czmlStr +=     '                %s \n' % (_getCompactSamples(time + [lastTime], lats + [lastLat], lons + [lastLon], alts + [lastAlt], trajectoryToleranceMeters))
 
 				czmlStr +=     '\n'
 				czmlStr +=     '            ] \n'
@@ -457,7 +686,38 @@ def _writeAssignmentsCZML(path, lstSubAssignments, availStart, availEnd, fullDir
 
 	return
 
-def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, fullDir):
+def _getCompactSamples(times, lats, lons, alts, toleranceMeters):
+	"""
+	Returns the `cartographicDegrees` samples of a moving object as a compact string, after dropping the samples that linear interpolation reconstructs within `toleranceMeters`.  Times (relative to the epoch) are rounded to 0.01 seconds, lat/lon to 1e-6 degrees (about 0.1 meters), and altitudes to 0.01 meters, without trailing zeros.
+
+	Parameters
+	----------
+	times: list
+		Times of the samples, in seconds since the epoch
+	lats: list
+		Latitudes of the samples
+	lons: list
+		Longitudes of the samples
+	alts: list
+		Altitudes of the samples, in meters
+	toleranceMeters: float
+		See `geoSimplifyTrajectory()`
+
+	Return
+	------
+	string
+		The samples, as comma-separated [time, lon, lat, alt] groups
+	"""
+
+	keepIndex = geoSimplifyTrajectory(times, lats, lons, alts, toleranceMeters)
+
+	def compact(value, decimals):
+		value = ('%.*f' % (decimals, value)).rstrip('0').rstrip('.')
+		return '0' if (value in ['', '-0']) else value
+
+	return ','.join(['%s,%s,%s,%s' % (compact(times[k], 2), compact(lons[k], 6), compact(lats[k], 6), compact(alts[k], 2)) for k in keepIndex])
+
+def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity, fullDir, fileName='displayPaths.js', fragment=False):
 
 	"""
 	This script generates the displayPaths.js file
@@ -476,10 +736,14 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 		The opacity of arcs when displayed in Cesium. If provided, it will overrides the opacity in assignments dataframe. See :ref: `Cesium style`
 	fullDir: string
 		The directory of cesium, including the name of the instance.
+	fileName: string, Optional, default as 'displayPaths.js'
+		The name of the .js file, relative to `fullDir`.
+	fragment: boolean, Optional, default as False
+		If True, write only the polylines (appended to `paths`), to be loaded by the `displayPaths()` of an incremental export.
 	"""
 
 	# .js file path
-	jsFilePath = '%s/displayPaths.js' % (fullDir)
+	jsFilePath = '%s/%s' % (fullDir, fileName)
 	f = open(jsFilePath, 'w')
 
 	# Head description
@@ -487,7 +751,8 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 	jsStr +=             "// Display paths for cesium application\n\n"
 
 	# Begin of the displayPaths function
-	jsStr +=             "function displayPaths() {\n"
+	if (not fragment):
+		jsStr +=         "function displayPaths() {\n"
 
 	# Collect all moving objects ID for path names
 	movingObjects = []
@@ -499,10 +764,11 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 	for i in range(len(movingObjects)):
 		strMovingObjects += "'%s', " % (movingObjects[i])
 	strMovingObjects = strMovingObjects[:-2]
-	jsStr +=             "    var pathNames = [%s]; \n" % (strMovingObjects)
 
-	# Register paths
-	jsStr +=             "    registerPaths(pathNames); \n"
+	# Register paths (for fragments, this is done by `displayPaths()`)
+	if (not fragment):
+		jsStr +=         "    var pathNames = [%s]; \n" % (strMovingObjects)
+		jsStr +=         "    registerPaths(pathNames); \n"
 
 	# For each `odID`, draw a polyline
 	for i in range(len(lstSubAssignments)):
@@ -556,7 +822,8 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 
 		if (assignmentDimension == 3):
 			# For each path, generate one polyline entity
-			jsStr +=     "    paths[%d] = viewer.entities.add({\n" % (i)
+			# Fragments are appended to the `paths` of earlier fragments
+			jsStr +=     "    paths[%s] = viewer.entities.add({\n" % ("paths.length" if (fragment) else i)
 			jsStr +=     "        parent: vehiclePolylines['%s'],\n" % (lstSubAssignments[i].iloc[0]['objectID'])
 			jsStr +=     "        name: 'Objects %s',\n" % (lstSubAssignments[i].iloc[0]['objectID'])
 			jsStr +=     "        polyline: {\n"
@@ -575,7 +842,8 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 			jsStr +=     "    });\n"
 		elif (assignmentDimension == 2):
 			# For each path, generate one polyline entity
-			jsStr +=     "    paths[%d] = viewer.entities.add({\n" % (i)
+			# Fragments are appended to the `paths` of earlier fragments
+			jsStr +=     "    paths[%s] = viewer.entities.add({\n" % ("paths.length" if (fragment) else i)
 			jsStr +=     "        parent: vehiclePolylines['%s'],\n" % (lstSubAssignments[i].iloc[0]['objectID'])
 			jsStr +=     "        name: 'Objects %s',\n" % (lstSubAssignments[i].iloc[0]['objectID'])
 			jsStr +=     "        polyline: {\n"
@@ -595,7 +863,8 @@ def _writeAssignmentsJS(lstSubAssignments, cesiumColor, cesiumWeight, cesiumStyl
 			jsStr +=     "    });\n"
 
 	# End of the displayPaths function
-	jsStr +=             "}"
+	if (not fragment):
+		jsStr +=         "}"
 
 	# Write contents and close file stream
 	f.write(jsStr)
@@ -1335,7 +1335,7 @@ def addLeafletText(mapObject=None, mapFilename=None, mapBackground=VRV_DEFAULT_L
 	except:
 		pass
 							
-	folium.map.Marker(anchorPoint, icon=DivIcon(
+	folium.map.Marker(anchorPoint, icon=folium.features.DivIcon(
 		icon_size = (iconSizeX, fontSize), 
 		icon_anchor = (iconAnchorX, fontSize), 
 		html = "<div style=\"font-size: %dpt; color: %s; text-align: %s;\">%s</div>" %  (fontSize, fontColor, horizAlign, text)
@@ -4,6 +4,8 @@ from veroviz._validation import valCreateArcsFromNodeSeq
 
 from veroviz._createEntitiesFromList import privCreateArcsFromLocSeq
 
+from veroviz._internal import nodeIDs2Locs
+
 def createArcsFromLocSeq(locSeq=None, initArcs=None, startArc=1, objectID=None, leafletColor=VRV_DEFAULT_LEAFLETARCCOLOR, leafletWeight=VRV_DEFAULT_LEAFLETARCWEIGHT, leafletStyle=VRV_DEFAULT_LEAFLETARCSTYLE, leafletOpacity=VRV_DEFAULT_LEAFLETARCOPACITY, useArrows=True, cesiumColor=VRV_DEFAULT_CESIUMPATHCOLOR, cesiumWeight=VRV_DEFAULT_CESIUMPATHWEIGHT, cesiumStyle=VRV_DEFAULT_CESIUMPATHSTYLE, cesiumOpacity=VRV_DEFAULT_CESIUMPATHOPACITY):
 
 	"""
@@ -193,12 +195,7 @@ def createArcsFromNodeSeq(nodeSeq=None, nodes=None, initArcs=None, startArc=1, o
 	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
 		print (warningMsg)
 
-	locSeq = []
-	for i in range(len(nodeSeq)):
-		locSeq.append([
-				nodes.loc[nodes['id'] == nodeSeq[i]]['lat'].values[0],
-				nodes.loc[nodes['id'] == nodeSeq[i]]['lon'].values[0],
-			])
+	locSeq = nodeIDs2Locs(nodes, nodeSeq)
 
 	arcs = privCreateArcsFromLocSeq(locSeq, initArcs, startArc, objectID, leafletColor, leafletWeight, leafletStyle, leafletOpacity, useArrows, cesiumColor, cesiumWeight, cesiumStyle, cesiumOpacity)
 
@@ -3,19 +3,20 @@ from veroviz._validation import valGenerateNodes
 from veroviz._validation import valCreateNodesFromLocs
 
 from veroviz._getSnapLoc import privGetSnapLocBatch
+from veroviz._queryPgRouting import pgrGetRoadSegments
 from veroviz._createEntitiesFromList import privCreateNodesFromLocs
-from veroviz._internal import randomPick
 from veroviz._internal import areaOfTriangle
 
 from veroviz._geometry import geoDistance2D
-from veroviz._geometry import geoIsPointInPoly
-from veroviz._geometry import geoPointInDistance2D
+from veroviz._geometry import geoDistance2DArray
+from veroviz._geometry import geoIsPointInPolyArray
+from veroviz._geometry import geoPointInDistance2DArray
 
 from veroviz.utilities import initDataframe
 from veroviz.utilities import getMapBoundary
 
 
-def generateNodes(initNodes=None, nodeType=None, nodeName=None, numNodes=None, startNode=1, incrementName=False, incrementStart=1, nodeDistrib=None, nodeDistribArgs=None, snapToRoad=False, leafletIconPrefix=VRV_DEFAULT_LEAFLETICONPREFIX, leafletIconType=VRV_DEFAULT_LEAFLETICONTYPE, leafletColor=VRV_DEFAULT_LEAFLETICONCOLOR, leafletIconText=None, cesiumIconType=VRV_DEFAULT_CESIUMICONTYPE, cesiumColor=VRV_DEFAULT_CESIUMICONCOLOR, cesiumIconText=None, dataProvider=None, dataProviderArgs=None):
+def generateNodes(initNodes=None, nodeType=None, nodeName=None, numNodes=None, startNode=1, incrementName=False, incrementStart=1, nodeDistrib=None, nodeDistribArgs=None, snapToRoad=False, leafletIconPrefix=VRV_DEFAULT_LEAFLETICONPREFIX, leafletIconType=VRV_DEFAULT_LEAFLETICONTYPE, leafletColor=VRV_DEFAULT_LEAFLETICONCOLOR, leafletIconText=None, cesiumIconType=VRV_DEFAULT_CESIUMICONTYPE, cesiumColor=VRV_DEFAULT_CESIUMICONCOLOR, cesiumIconText=None, dataProvider=None, dataProviderArgs=None, seed=None):
 
 	"""
 	This function generates a collection of nodes (locations).
@@ -60,6 +61,8 @@ def generateNodes(initNodes=None, nodeType=None, nodeName=None, numNodes=None, s
 		Specifies the data source to be used for generating nodes on a road network. See :ref:`Data Providers` for options and requirements.
 	dataProviderArgs: dictionary, Conditional, default as None
 		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	seed: int or numpy.random.Generator, Optional, default as None
+		Seeds the random node locations, so that the same nodes can be generated again.  If None, numpy's global random state is used (see `numpy.random.seed()`).
 
 	Return
 	------
@@ -99,6 +102,20 @@ def generateNodes(initNodes=None, nodeType=None, nodeName=None, numNodes=None, s
 	|                           | boundary, in the form of [[lat, lon], [lat, lon],     |
 	|                           | ... , [lat, lon]]                                     |
 	+---------------------------+-------------------------------------------------------+
+	| "unifRoadBasedBB":        | 'boundingRegion' : A list of lat/lon defines the      |
+	| Uniformly distributed     | boundary, in the form of [[lat, lon], [lat, lon],     |
+	| along the roads within a  | ... , [lat, lon]]                                     |
+	| bounding region.          +-------------------------------------------------------+
+	|                           | 'distToRoad' : The maximum distance, in meters,       |
+	|                           | between a node and the road                           |
+	|                           +-------------------------------------------------------+
+	|                           | 'roadSegments' : Optional. The road segments, in the  |
+	|                           | form of [[[lat1, lon1], [lat2, lon2]], ...], or an    |
+	|                           | :ref:`Arcs` dataframe. If omitted, the segments are   |
+	|                           | loaded from pgRouting in one query. Other data        |
+	|                           | providers snap random locations to the road instead,  |
+	|                           | which requires a query for every location.            |
+	+---------------------------+-------------------------------------------------------+
 
 	Examples
 	--------
@@ -215,42 +232,48 @@ def generateNodes(initNodes=None, nodeType=None, nodeName=None, numNodes=None, s
 	"""
 
 	# validation
-	[valFlag, errorMsg, warningMsg] = valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, incrementName, incrementStart, nodeDistrib, nodeDistribArgs, snapToRoad, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText, dataProvider, dataProviderArgs)
+	[valFlag, errorMsg, warningMsg] = valGenerateNodes(initNodes, nodeType, nodeName, numNodes, startNode, incrementName, incrementStart, nodeDistrib, nodeDistribArgs, snapToRoad, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText, dataProvider, dataProviderArgs, seed)
 	if (not valFlag):
 		print (errorMsg)
 		return
 	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
 		print (warningMsg)
 
+	# Source of random numbers
+	rng = np.random if (seed is None) else np.random.default_rng(seed)
+
 	# Generate random nodes - For 2D nodes
 	if (nodeDistrib == "uniformBB"):
 		boundingRegion = nodeDistribArgs['boundingRegion']
-		locs = _genNodesUniformBounded(numNodes, boundingRegion)		
+		locs = _genNodesUniformBounded(numNodes, boundingRegion, rng)
 	elif (nodeDistrib == "normal"):
 		if ('boundingRegion' not in nodeDistribArgs):
 			center = nodeDistribArgs['center']
 			standardDeviation = nodeDistribArgs['stdDev']
-			locs = _genNodesNormal(numNodes, center, standardDeviation)
+			locs = _genNodesNormal(numNodes, center, standardDeviation, rng)
 		else:
 			boundingRegion = nodeDistribArgs['boundingRegion']
 			center = nodeDistribArgs['center']
 			standardDeviation = nodeDistribArgs['stdDev']
-			locs = _genNodesNormalBounded(numNodes, boundingRegion, center, standardDeviation)
+			locs = _genNodesNormalBounded(numNodes, boundingRegion, center, standardDeviation, rng)
 	elif (nodeDistrib == "normalBB"):
 		boundingRegion = nodeDistribArgs['boundingRegion']
 		center = nodeDistribArgs['center']
 		standardDeviation = nodeDistribArgs['stdDev']
-		locs = _genNodesNormalBounded(numNodes, boundingRegion, center, standardDeviation)
+		locs = _genNodesNormalBounded(numNodes, boundingRegion, center, standardDeviation, rng)
 	elif (nodeDistrib == "unifRoadBasedBB"):
 		boundingRegion = nodeDistribArgs['boundingRegion']
 		distToRoad = nodeDistribArgs['distToRoad']
-		locs = _genNodesRoadBased(numNodes, boundingRegion, distToRoad, dataProvider, dataProviderArgs)
+		roadSegments = nodeDistribArgs['roadSegments'] if ('roadSegments' in nodeDistribArgs) else None
+		locs = _genNodesRoadBased(numNodes, boundingRegion, distToRoad, roadSegments, dataProvider, dataProviderArgs, rng)
+		if (locs is None):
+			return
 
 	# create nodes from given lats/lons
 	nodes = privCreateNodesFromLocs(locs, initNodes, nodeType, nodeName, startNode, incrementName, incrementStart, snapToRoad, dataProvider, dataProviderArgs, leafletIconPrefix, leafletIconType, leafletColor, leafletIconText, cesiumIconType, cesiumColor, cesiumIconText)
 	return nodes
 
-def _genNodesUniformBounded(numNodes=None, boundingRegion=None):
+def _genNodesUniformBounded(numNodes=None, boundingRegion=None, rng=np.random):
 	"""
 	Generate randomized node using Uniform distribution within a bounding area
 
@@ -264,6 +287,8 @@ def _genNodesUniformBounded(numNodes=None, boundingRegion=None):
 		Number of nodes to be generated
 	boudingArea: list, Required
 		A defined polygon, nodes are generated within this area
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
 
 	Returns
 	-------
@@ -277,16 +302,14 @@ def _genNodesUniformBounded(numNodes=None, boundingRegion=None):
 	for i in range(len(lstTriangle)):
 		lstArea.append(areaOfTriangle(lstTriangle[i][0], lstTriangle[i][1], lstTriangle[i][2]))
 	
-	# Randomly pick a triangle, the probability of picking triangle is refer to the area of each triangle, then generate one node inside, loop untill generate enough nodes
-	locs = []
-	for i in range(numNodes):
-		index = randomPick(lstArea)
-		newLoc = _genNodesUniformTriangle(1, lstTriangle[index])
-		locs.extend(newLoc)
+	# Randomly pick a triangle for every node, the probability of picking triangle is refer to the area of each triangle, then generate the nodes inside their triangles
+	triangles = np.asarray(lstTriangle, dtype=float)
+	areas = np.asarray(lstArea, dtype=float)
+	index = rng.choice(len(triangles), size=numNodes, p=areas / areas.sum())
 
-	return locs
+	return _genNodesUniformTriangle(numNodes, triangles[index], rng)
 
-def _genNodesUniformTriangle(numNodes=None, triangle=None):
+def _genNodesUniformTriangle(numNodes=None, triangle=None, rng=np.random):
 	"""
 	Generate randomized node using Uniform distribution within a triangle
 
@@ -299,7 +322,9 @@ def _genNodesUniformTriangle(numNodes=None, triangle=None):
 	numNodes: int, Required
 		Number of nodes to be generated
 	triangle: list, Required
-		A defined triangle, format is [[lat1, lon1], [lat2, lon2], [lat3, lon3]]
+		A defined triangle, format is [[lat1, lon1], [lat2, lon2], [lat3, lon3]].  Alternatively, a numNodes x 3 x 2 array with one triangle for each node.
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
 
 	Returns
 	-------
@@ -308,24 +333,18 @@ def _genNodesUniformTriangle(numNodes=None, triangle=None):
 	"""
 
 	# Give number to three vertices of triangle
-	[lat1, lon1] = triangle[0]
-	[lat2, lon2] = triangle[1]
-	[lat3, lon3] = triangle[2]
+	triangle = np.asarray(triangle, dtype=float)
+	[vertex1, vertex2, vertex3] = [triangle[..., 0, :], triangle[..., 1, :], triangle[..., 2, :]]
 
-	# initialize lists
-	locs = []
 	# Generate random nodes
 	# Reference: http://www.cs.princeton.edu/~funk/tog02.pdf
-	for i in range(numNodes):
-		rndR1 = np.random.uniform(0, 1)
-		rndR2 = np.random.uniform(0, 1)
-		rndLat = (1 - math.sqrt(rndR1)) * lat1 + math.sqrt(rndR1) * (1 - rndR2) * lat2 + math.sqrt(rndR1) * rndR2 * lat3
-		rndLon = (1 - math.sqrt(rndR1)) * lon1 + math.sqrt(rndR1) * (1 - rndR2) * lon2 + math.sqrt(rndR1) * rndR2 * lon3
-		locs.append([rndLat, rndLon])
+	sqrtR1 = np.sqrt(rng.uniform(0, 1, size=numNodes))[:, None]
+	rndR2 = rng.uniform(0, 1, size=numNodes)[:, None]
+	locs = (1 - sqrtR1) * vertex1 + sqrtR1 * (1 - rndR2) * vertex2 + sqrtR1 * rndR2 * vertex3
 
-	return locs
+	return locs.tolist()
 
-def _genNodesNormalBounded(numNodes=None, boundingRegion=None, center=None, standardDeviation=None):
+def _genNodesNormalBounded(numNodes=None, boundingRegion=None, center=None, standardDeviation=None, rng=np.random):
 
 	"""
 	Generate randomized node using Normal distribution within a bounding area
@@ -342,6 +361,8 @@ def _genNodesNormalBounded(numNodes=None, boundingRegion=None, center=None, stan
 		Longitude of the center point
 	standardDeviation: float, Required
 		StandardDeviation of normal distribution
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
 
 	Return
 	------
@@ -350,22 +371,24 @@ def _genNodesNormalBounded(numNodes=None, boundingRegion=None, center=None, stan
 	"""
 
 	# Initialize
-	locs = []
+	locs = np.zeros((0, 2))
 
-	# Randomized generate nodes in normal distribution
-	for i in range(numNodes):
-		rndUniform = np.random.uniform(0, 360)
-		rndNormal = np.random.normal(0, standardDeviation)
-		newLoc = geoPointInDistance2D(center, rndUniform, rndNormal)
-		while (not geoIsPointInPoly(newLoc, boundingRegion)):
-			rndUniform = np.random.uniform(0, 360)
-			rndNormal = np.random.normal(0, standardDeviation)
-			newLoc = geoPointInDistance2D(center, rndUniform, rndNormal)
-		locs.append(newLoc)
+	# Randomized generate nodes in normal distribution, in batches; nodes outside of the bounding region are discarded, the size of the next batch is based on the acceptance rate so far
+	numTries = 0
+	while (len(locs) < numNodes):
+		numRemain = numNodes - len(locs)
+		acceptRate = max(len(locs) / numTries, 0.01) if (numTries > 0) else 1
+		batchSize = min(int(1.1 * numRemain / acceptRate) + 1, max(numRemain, 1000000))
+		rndUniform = rng.uniform(0, 360, size=batchSize)
+		rndNormal = rng.normal(0, standardDeviation, size=batchSize)
+		newLocs = geoPointInDistance2DArray(center, rndUniform, rndNormal)
+		newLocs = newLocs[geoIsPointInPolyArray(newLocs[:, 0], newLocs[:, 1], boundingRegion)]
+		locs = np.concatenate([locs, newLocs[0:numRemain]])
+		numTries += batchSize
 		
-	return locs
+	return locs.tolist()
 
-def _genNodesNormal(numNodes=None, center=None, standardDeviation=None):
+def _genNodesNormal(numNodes=None, center=None, standardDeviation=None, rng=np.random):
 	"""
 	Generate randomized node using Normal distribution within a bounding area
 
@@ -379,6 +402,8 @@ def _genNodesNormal(numNodes=None, center=None, standardDeviation=None):
 		Longitude of the center point
 	standardDeviation: float, Required
 		StandardDeviation of normal distribution
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
 
 	Returns
 	-------
@@ -386,19 +411,14 @@ def _genNodesNormal(numNodes=None, center=None, standardDeviation=None):
 		A list of coordinates uniformly distributed
 	"""
 
-	# Initialize
-	locs = []
-
 	# Randomized generate nodes in normal distribution
-	for i in range(numNodes):
-		rndUniform = np.random.uniform(0, 360)
-		rndNormal = np.random.normal(0, standardDeviation)
-		newLoc = geoPointInDistance2D(center, rndUniform, rndNormal)
-		locs.append(newLoc)
+	rndUniform = rng.uniform(0, 360, size=numNodes)
+	rndNormal = rng.normal(0, standardDeviation, size=numNodes)
+	locs = geoPointInDistance2DArray(center, rndUniform, rndNormal)
 		
-	return locs
+	return locs.tolist()
 
-def _genNodesRoadBased(numNodes=None, boundingRegion=None, distToRoad=None, dataProvider=None, APIkey=None, databaseName=None):
+def _genNodesRoadBased(numNodes=None, boundingRegion=None, distToRoad=None, roadSegments=None, dataProvider=None, dataProviderArgs=None, rng=np.random):
 	"""
 	Generate randomized node using Uniform distribution within a bounding area and close to roads
 
@@ -414,32 +434,122 @@ def _genNodesRoadBased(numNodes=None, boundingRegion=None, distToRoad=None, data
 		A defined polygon, nodes are generated within this area
 	distToRoad: float, Required
 		The maximun distance to road for generated nodes.
+	roadSegments: list of lists or :ref:`Arcs`, Optional
+		The road segments to generate nodes along.  If None, they are loaded from pgRouting; other data providers do not provide road segments, so random locations are snapped to the road by the data provider instead.
 	dataProvider: string, Conditional, See :ref:`Dataprovider`
 		Specifies the data source to be used for generating nodes on a road network.  
-	APIkey: string, Conditional, See :ref:`Dataprovider`
-		Some data providers require an API key (which you'll need to register for).
-	databaseName: string, Conditional, See :ref:`Dataprovider`
-		If you are hosting a data provider on your local machine (e.g., pgRouting), you'll need to specify the name of the local database. 
+	dataProviderArgs: dictionary, Conditional, See :ref:`Dataprovider`
+		For some data providers, additional parameters are required (e.g., API keys or database names).
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
 	
 	Returns
 	-------
 	list of lists
-		A list of coordinates, within a given distance to its nearest street
+		A list of coordinates, within a given distance to its nearest street.  None (after printing an error) if the nodes cannot be generated from road segments.
 	"""
 
+	try:
+		dataProvider = dataProvider.lower()
+	except:
+		pass
+
+	# Load the road segments of the region once, then sample locally
+	if (roadSegments is None and dataProvider in dataProviderDictionary and dataProviderDictionary[dataProvider] == 'pgrouting'):
+		roadSegments = pgrGetRoadSegments(boundingRegion, dataProviderArgs['databaseName'])
+
+	if (roadSegments is not None):
+		return _genNodesRoadSegments(numNodes, boundingRegion, distToRoad, roadSegments, rng)
+
 	# Initialize
 	locs = []
 
 	# Generate nodes, if it is not close enough, discard and regenerate
 	while (len(locs) < numNodes):
-		newLocs = _genNodesUniformBounded(numNodes - len(locs), boundingRegion)
-		snapLocs = privGetSnapLocBatch(newLocs, dataProvider, APIkey, databaseName)
-		for i in range(len(snapLocs)):
-			if (geoDistance2D(newLocs[i], snapLocs[i]) <= distToRoad):
-				locs.append(newLocs[i])
+		newLocs = np.asarray(_genNodesUniformBounded(numNodes - len(locs), boundingRegion, rng))
+		snapLocs = np.asarray(privGetSnapLocBatch(newLocs.tolist(), dataProvider, dataProviderArgs), dtype=float)
+		distMeters = geoDistance2DArray(newLocs[:, 0], newLocs[:, 1], snapLocs[:, 0], snapLocs[:, 1])
+		locs.extend(newLocs[distMeters <= distToRoad].tolist())
 	
 	return locs
 
+def _genNodesRoadSegments(numNodes=None, boundingRegion=None, distToRoad=None, roadSegments=None, rng=np.random):
+	"""
+	Generate randomized node using Uniform distribution along the road segments within a bounding area.  A segment is picked with probability proportional to its length, a point is picked uniformly along it, and the node is placed uniformly within `distToRoad` meters of that point.
+
+	Parameters
+	----------
+	numNodes: int, Required
+		Number of nodes to be generated
+	boudingArea: list, Required
+		A defined polygon, nodes are generated within this area
+	distToRoad: float, Required
+		The maximun distance to road for generated nodes.
+	roadSegments: list of lists or :ref:`Arcs`, Required
+		The road segments, in the form of [[[lat1, lon1], [lat2, lon2]], ...], or an :ref:`Arcs` dataframe.
+	rng: numpy.random.Generator, Optional, default as numpy.random
+		Source of random numbers
+
+	Returns
+	-------
+	list of lists
+		A list of coordinates, within a given distance to its nearest street.  None (after printing an error) if there are no road segments in the bounding area, or if no nodes can be placed within the bounding area.
+	"""
+
+	segments = _roadSegmentsToArray(roadSegments)
+
+	# Index the segments that overlap the bounding box of the region, with their lengths as weights; the parts of these segments that are outside of the region are handled by rejection below
+	[minLat, minLon] = np.min(np.asarray(boundingRegion, dtype=float)[:, 0:2], axis=0)
+	[maxLat, maxLon] = np.max(np.asarray(boundingRegion, dtype=float)[:, 0:2], axis=0)
+	overlap = ((np.maximum(segments[:, 0], segments[:, 2]) >= minLat) & (np.minimum(segments[:, 0], segments[:, 2]) <= maxLat)
+		& (np.maximum(segments[:, 1], segments[:, 3]) >= minLon) & (np.minimum(segments[:, 1], segments[:, 3]) <= maxLon))
+	segments = segments[overlap]
+	lengths = geoDistance2DArray(segments[:, 0], segments[:, 1], segments[:, 2], segments[:, 3])
+	if (len(segments) == 0 or lengths.sum() <= 0):
+		print("Error: There are no road segments within the `boundingRegion`.")
+		return None
+
+	# Initialize
+	locs = np.zeros((0, 2))
+
+	# Generate nodes in batches; nodes outside of the bounding region are discarded, the size of the next batch is based on the acceptance rate so far
+	numTries = 0
+	numTriesWithoutProgress = 0
+	while (len(locs) < numNodes):
+		# Give up if the roads never come within `distToRoad` of the region (e.g., a thin region whose bounding box contains roads)
+		if (numTriesWithoutProgress > 1000 * numNodes):
+			print("Error: Cannot generate nodes within %s meters of a road inside the `boundingRegion`; only %d of %d nodes were found." % (distToRoad, len(locs), numNodes))
+			return None
+
+		numRemain = numNodes - len(locs)
+		acceptRate = max(len(locs) / numTries, 0.01) if (numTries > 0) else 1
+		batchSize = min(int(1.1 * numRemain / acceptRate) + 1, max(numRemain, 1000000))
+
+		index = rng.choice(len(segments), size=batchSize, p=lengths / lengths.sum())
+		t = rng.uniform(0, 1, size=batchSize)[:, None]
+		roadLocs = (1 - t) * segments[index, 0:2] + t * segments[index, 2:4]
+
+		# Uniformly within a circle of radius `distToRoad` around the point on the road
+		radius = distToRoad * np.sqrt(rng.uniform(0, 1, size=batchSize))
+		theta = rng.uniform(0, 2 * math.pi, size=batchSize)
+		newLats = roadLocs[:, 0] + np.degrees(radius * np.cos(theta) / VRV_CONST_RADIUS_OF_EARTH)
+		newLons = roadLocs[:, 1] + np.degrees(radius * np.sin(theta) / (VRV_CONST_RADIUS_OF_EARTH * np.cos(np.radians(roadLocs[:, 0]))))
+
+		newLocs = np.column_stack([newLats, newLons])
+		newLocs = newLocs[geoIsPointInPolyArray(newLats, newLons, boundingRegion)]
+		locs = np.concatenate([locs, newLocs[0:numRemain]])
+		numTries += batchSize
+		numTriesWithoutProgress = 0 if (len(newLocs) > 0) else numTriesWithoutProgress + batchSize
+
+	return locs.tolist()
+
+def _roadSegmentsToArray(roadSegments):
+	# [[[lat1, lon1], [lat2, lon2]], ...] or an Arcs dataframe to an n x 4 array of [lat1, lon1, lat2, lon2]
+	if (type(roadSegments) is pd.core.frame.DataFrame):
+		return roadSegments[['startLat', 'startLon', 'endLat', 'endLon']].values.astype(float)
+
+	return np.asarray([[seg[0][0], seg[0][1], seg[1][0], seg[1][1]] for seg in roadSegments], dtype=float).reshape(-1, 4)
+
 def createNodesFromLocs(locs=None, initNodes=None, nodeType=None, nodeName=None, startNode=1, incrementName=False, incrementStart=1, snapToRoad=False, dataProvider=None, dataProviderArgs=None, leafletIconPrefix=VRV_DEFAULT_LEAFLETICONPREFIX, leafletIconType=VRV_DEFAULT_LEAFLETICONTYPE, leafletColor=VRV_DEFAULT_LEAFLETICONCOLOR, leafletIconText=None, cesiumIconType=VRV_DEFAULT_CESIUMICONTYPE, cesiumColor=VRV_DEFAULT_CESIUMICONCOLOR, cesiumIconText=None):
 
 	"""
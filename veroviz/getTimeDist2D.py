@@ -3,6 +3,13 @@ from veroviz._validation import valGetTimeDist2D
 
 from veroviz._getTimeDistFromLocs2D import getTimeDistFromLocs2D
 
+from veroviz._internal import nodeIDs2Locs
+from veroviz._internal import matrixStoreFile
+from veroviz._internal import matrixStoreIndex
+from veroviz._internal import replaceBackslashToSlash
+
+from veroviz.utilities import createMatrixStore
+
 def getTimeDist2D(nodes=None, matrixType='all2all', fromNodeID=None, toNodeID=None, outputDistUnits='meters', outputTimeUnits='seconds', routeType='euclidean2D', speedMPS=None, dataProvider=None, dataProviderArgs=None):
 	
 	"""
@@ -171,14 +178,110 @@ def getTimeDist2D(nodes=None, matrixType='all2all', fromNodeID=None, toNodeID=No
 		return 
 
 	# Specify the list of coordinations, for each coordinate, it is in [lat, lon] format
-	fromLocs = []
-	toLocs = []
-	for i in range(0, len(fromRows)):
-		fromLocs.append([nodes.loc[nodes['id'] == fromRows[i], 'lat'].values[0], nodes.loc[nodes['id'] == fromRows[i], 'lon'].values[0]])
-	for i in range(0, len(toCols)):
-		toLocs.append([nodes.loc[nodes['id'] == toCols[i], 'lat'].values[0], nodes.loc[nodes['id'] == toCols[i], 'lon'].values[0]])
+	fromLocs = nodeIDs2Locs(nodes, fromRows)
+	toLocs = nodeIDs2Locs(nodes, toCols)
 
 	# get time/dist
 	[time, dist] = getTimeDistFromLocs2D(fromLocs, fromRows, toLocs, toCols, outputDistUnits, outputTimeUnits, routeType, speedMPS, dataProvider, dataProviderArgs)
 
 	return [time, dist]
+
+def getTimeDist2DToMatrixStore(nodes=None, path=None, outputDistUnits='meters', outputTimeUnits='seconds', routeType='euclidean2D', speedMPS=None, dataProvider=None, dataProviderArgs=None, chunkRows=VRV_DEFAULT_MATRIXSTORE_CHUNKROWS):
+	"""
+	Generates all-to-all travel time and distance matrices, like :meth:`~veroviz.getTimeDist2D.getTimeDist2D`, but writes them into a matrix store on disk (see :meth:`~veroviz.utilities.createMatrixStore`) instead of returning dictionaries.  The matrices are calculated `chunkRows` origin nodes at a time, and each chunk is written as soon as it arrives, so the full matrices never have to fit in memory.  If `path` is already a matrix store for the same node ids, rows that were already calculated are skipped; an interrupted run can therefore be resumed.
+
+	Parameters
+	----------
+	nodes: :ref:`Nodes`, Required, default as None
+		This :ref:`Nodes` dataframe contains the locations between which the travel time and distance will be calculated.
+	path: string, Required, default as None
+		The directory of the matrix store.  The store will have two matrices, 'time' and 'dist'.
+	outputDistUnits: string, Optional, default as 'meters'
+		Specifies the desired distance units for the function's output.  See :ref:`Units` for options and abbreviations.
+	outputTimeUnits: string, Optional, default as 'seconds'
+		Specifies the desired time units for the function's output.  See :ref:`Units` for options and abbreviations.
+	routeType: string, Optional, default as 'euclidean2D'
+		This describes a characteristic of the travel mode.  See :meth:`~veroviz.getTimeDist2D.getTimeDist2D` for options.
+	speedMPS: float, Conditional, default as None
+		Speed of the vehicle, in units of meters per second.  See :meth:`~veroviz.getTimeDist2D.getTimeDist2D` for details.
+	dataProvider: string, Conditional, default as None
+		Specifies the data source to be used for obtaining the travel data. See :ref:`Data Providers` for options and requirements.
+	dataProviderArgs: dictionary, Conditional, default as None
+		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	chunkRows: int, Optional, default as VRV_DEFAULT_MATRIXSTORE_CHUNKROWS
+		The number of origin nodes calculated (and written) at a time.
+
+	Return
+	------
+	string
+		The path of the matrix store.  Use :meth:`~veroviz.utilities.readMatrixStore` to read the matrices.
+
+	Example
+	-------
+		>>> import veroviz as vrv
+		>>> nodes = vrv.generateNodes(
+		...     nodeDistrib     = 'normal', 
+		...     nodeDistribArgs = {
+		...         'center'        : [42.30, -78.00], 
+		...         'stdDev'        : 10000
+		...     }, 
+		...     numNodes        = 5000)
+		>>> vrv.getTimeDist2DToMatrixStore(
+		...     nodes     = nodes,
+		...     path      = 'matrices',
+		...     routeType = 'euclidean2D',
+		...     speedMPS  = 15)
+		>>> timeSec = vrv.readMatrixStore('matrices', 'time', fromIDs=[1, 2])
+	"""
+
+	# validation
+	[valFlag, errorMsg, warningMsg] = valGetTimeDist2D(nodes, 'all2all', None, None, outputDistUnits, outputTimeUnits, routeType, speedMPS, dataProvider, dataProviderArgs)
+	if (valFlag and type(path) is not str):
+		[valFlag, errorMsg] = [False, "Error: `path` should be a string."]
+	if (valFlag and (type(chunkRows) is not int or chunkRows <= 0)):
+		[valFlag, errorMsg] = [False, "Error: `chunkRows` should be a positive integer."]
+	if (not valFlag):
+		print (errorMsg)
+		return
+	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
+		print (warningMsg)
+
+	# Replace backslash
+	path = replaceBackslashToSlash(path)
+
+	ids = nodes['id'].tolist()
+	locs = nodeIDs2Locs(nodes, ids)
+
+	# Reuse an existing store for the same ids, so that an interrupted run can be resumed
+	if (os.path.isfile(matrixStoreFile(path, 'time')) and os.path.isfile(matrixStoreFile(path, 'dist')) 
+		and matrixStoreIndex(path).tolist() == ids):
+		pass
+	elif (createMatrixStore(path, ids, ['time', 'dist']) is None):
+		return
+
+	numIDs = len(ids)
+	timeMatrix = np.load(matrixStoreFile(path, 'time'), mmap_mode='r+')
+	distMatrix = np.load(matrixStoreFile(path, 'dist'), mmap_mode='r+')
+	for i in range(0, numIDs, chunkRows):
+		chunkIDs = ids[i:i + chunkRows]
+		if (not np.isnan(timeMatrix[i:i + chunkRows]).any() and not np.isnan(distMatrix[i:i + chunkRows]).any()):
+			continue
+
+		timeDist = getTimeDistFromLocs2D(locs[i:i + chunkRows], chunkIDs, locs, ids, outputDistUnits, outputTimeUnits, routeType, speedMPS, dataProvider, dataProviderArgs)
+		try:
+			[time, dist] = timeDist
+			timeChunk = np.array([[time[fromID, toID] for toID in ids] for fromID in chunkIDs], dtype=np.float64)
+			distChunk = np.array([[dist[fromID, toID] for toID in ids] for fromID in chunkIDs], dtype=np.float64)
+		except (TypeError, KeyError):
+			print("Error: Cannot get travel times and distances for the rows of nodes %s through %s.  The matrix store at %s keeps the rows that were already calculated; run this function again to resume." % (chunkIDs[0], chunkIDs[-1], path))
+			return
+
+		timeMatrix[i:i + chunkRows] = timeChunk
+		distMatrix[i:i + chunkRows] = distChunk
+		timeMatrix.flush()
+		distMatrix.flush()
+
+	del timeMatrix
+	del distMatrix
+
+	return path
@@ -4,6 +4,8 @@ from veroviz._validation import *
 from veroviz._buildFlightProfile import buildNoLoiteringFlight
 from veroviz._buildFlightProfile import getTimeDistFromFlight
 
+from veroviz._internal import nodeIDs2Locs
+
 from veroviz.utilities import convertDistance
 from veroviz.utilities import convertTime
 
@@ -154,18 +156,8 @@ def getTimeDist3D(nodes=None, matrixType='all2all', fromNodeID=None, toNodeID=No
 		return 
 
 	# Specify the list of coordinations, for each coordinate, it is in [lat, lon, alt] format
-	fromLocs = []
-	toLocs = []
-	for i in range(0, len(fromIDs)):
-		fromLocs.append([
-			float(nodes.loc[nodes['id'] == fromIDs[i], 'lat']), 
-			float(nodes.loc[nodes['id'] == fromIDs[i], 'lon']), 
-			float(nodes.loc[nodes['id'] == fromIDs[i], 'altMeters'])])
-	for i in range(0, len(toIDs)):
-		toLocs.append([
-			float(nodes.loc[nodes['id'] == toIDs[i], 'lat']), 
-			float(nodes.loc[nodes['id'] == toIDs[i], 'lon']), 
-			float(nodes.loc[nodes['id'] == toIDs[i], 'altMeters'])])
+	fromLocs = nodeIDs2Locs(nodes, fromIDs, includeAlt=True)
+	toLocs = nodeIDs2Locs(nodes, toIDs, includeAlt=True)
 
 	# Do queries to find DICTIONARIES of distance and time matrices
 	totalTimeSec = {}
@@ -2,7 +2,7 @@ from veroviz._common import *
 from veroviz._validation import *
 from veroviz._geometry import *
 from veroviz._internal import *
-from veroviz._geocode import privGeocode, privReverseGeocode
+from veroviz._geocode import privGeocode, privReverseGeocode, privGeocodeBatch, privReverseGeocodeBatch
 
 def convertSpeed(speed, fromUnitsDist, fromUnitsTime, toUnitsDist, toUnitsTime):
 	"""
@@ -550,13 +550,13 @@ def convertMatricesDataframeToDictionary(dataframe):
 	"""
 
 	dictionary = {}
-	try:
-		(rowNum, columnNum) = dataframe.shape
-		for i in range(rowNum):
-			for j in range(columnNum):
-				dictionary[dataframe.index[i], dataframe.columns[j]] = dataframe.at[dataframe.index[i], dataframe.columns[j]]
-	except:
+	if (dataframe.index.has_duplicates or dataframe.columns.has_duplicates):
 		print("Error: Duplicated key values, please check the columns and rows of dataframe")
+		return dictionary
+
+	# Keys are generated row by row, in the order of the dataframe
+	keys = itertools.product(dataframe.index.tolist(), dataframe.columns.tolist())
+	dictionary = dict(zip(keys, dataframe.to_numpy().ravel().tolist()))
 
 	return dictionary
 
@@ -636,33 +636,47 @@ def convertMatricesDictionaryToDataframe(dictionary):
 		4033.9
 	"""
 
-	rows = []
-	columns = []
-	keys = dictionary.keys()
+	if (len(dictionary) == 0):
+		return pd.DataFrame()
 
-	for keys in dictionary:
-		if (len(keys) != 2):
-			print("Error: This dictionary is not a legitimate matrix, the key values should be pairs.")
-			return
+	keys = list(dictionary.keys())
+	try:
+		isPairs = (set(map(len, keys)) == {2})
+	except:
+		isPairs = False
+	if (not isPairs):
+		print("Error: This dictionary is not a legitimate matrix, the key values should be pairs.")
+		return
 
 	try:
-		for keys in dictionary:
-			if (keys[0] not in rows):
-				rows.append(keys[0])
-			if (keys[1] not in columns):
-				columns.append(keys[1])
-		rows = rows.sort()
-		columns = columns.sort()
-
-		dataframe = pd.DataFrame(columns=columns, index=rows)
-		for keys in dictionary:
-			dataframe.at[keys[0], keys[1]] = dictionary[keys]
+		# Rows and columns are the sorted unique ids; the codes are the position of each key in them
+		[rowCodes, rows] = _factorizeMatrixIDs([key[0] for key in keys])
+		[colCodes, columns] = _factorizeMatrixIDs([key[1] for key in keys])
+
+		values = np.asarray(list(dictionary.values()))
+		if (values.dtype.kind in 'biuf'):
+			matrix = np.full((len(rows), len(columns)), np.nan, dtype=np.float64)
+		else:
+			matrix = np.full((len(rows), len(columns)), np.nan, dtype=object)
+		matrix[rowCodes, colCodes] = values
+
+		dataframe = pd.DataFrame(matrix, index=rows, columns=columns)
 
 	except:
 		print("Error: Failed to convert dictionary to dataframe.")
+		return
 
 	return dataframe
 
+def _factorizeMatrixIDs(ids):
+	# Sorted unique ids (in order of appearance if they cannot be sorted), and the position of each id in them
+	try:
+		[codes, uniqueIDs] = pd.factorize(ids, sort=True)
+	except TypeError:
+		[codes, uniqueIDs] = pd.factorize(ids, sort=False)
+
+	return [codes, uniqueIDs.tolist()]
+
 def exportDataToCSV(data, filename):
 	"""
 	Export a dataframe or python time/distance matrix dictionary to a `.csv` file.
@@ -672,7 +686,7 @@ def exportDataToCSV(data, filename):
 	data: pandas.dataframe or dictionary
 		The data to be exported.  This can be a :ref:`Nodes`, :ref:`Arcs`, or :ref:`Assignments` dataframe, or it can be a time/distance python dictionary.
 	filename: string
-		The path and name of file to be exported.
+		The path and name of file to be exported.  If the name ends with '.parquet', '.pq', or '.feather', the data are written as a Parquet or Feather file instead of a .csv file.  These binary formats are much faster to write and read, and they preserve column types (e.g., booleans).  They require the `pyarrow` package.
 
 	Examples
 	--------
@@ -762,7 +776,20 @@ def exportDataToCSV(data, filename):
 				os.makedirs(path, exist_ok=True)
 
 	# Exporting
-	if (type(data) is pd.core.frame.DataFrame):
+	if (isBinaryDataFile(filename)):
+		# Matrices are stored with one row per (from, to) pair
+		try:
+			if (type(data) is pd.core.frame.DataFrame):
+				writeBinaryDataframe(data, filename)
+			elif (type(data) is dict):
+				writeBinaryDataframe(matrixDict2LongDataframe(data), filename)
+		except ImportError:
+			print("Error: Parquet and Feather files require the `pyarrow` package.")
+			return
+		except pyarrow.ArrowException as e:
+			print("Error: Cannot write %s as a Parquet or Feather file: %s" % (filename, e))
+			return
+	elif (type(data) is pd.core.frame.DataFrame):
 		dataframe = data
 		dataframe.to_csv(path_or_buf=filename, encoding='utf-8')
 	elif (type(data) is dict):
@@ -774,7 +801,7 @@ def exportDataToCSV(data, filename):
 
 	return
 
-def importDataFromCSV(dataType, filename):
+def importDataFromCSV(dataType, filename, columns=None):
 	"""
 	Import from a `.csv` file into a dataframe or python time/distance matrix dictionary.
 
@@ -783,7 +810,9 @@ def importDataFromCSV(dataType, filename):
 	dataType: string, Required
 		The type of data to be imported.  Valid options are 'nodes', 'arcs', 'assignments', or 'matrix'.
 	filename: string, Required
-		The path and the name of the file to be imported.
+		The path and the name of the file to be imported.  Files with the extension '.parquet', '.pq', or '.feather' are read as Parquet or Feather files (which requires the `pyarrow` package); otherwise, the file is read as a .csv file.
+	columns: list, Optional, default as None
+		For 'nodes', 'arcs', and 'assignments', only import these columns.  For Parquet and Feather files, the other columns are not read from the disk at all.  If provided, the imported columns are checked against the columns of `dataType`, rather than validating the whole dataframe.
 
 	Return
 	------
@@ -870,8 +899,24 @@ def importDataFromCSV(dataType, filename):
 	# validation - The validation of this script is different from others
 	try:
 		if (dataType.lower() in {'nodes', 'arcs', 'assignments'}):
-			data = pd.read_csv(filename, index_col=0)
-			if (dataType.lower() == 'nodes'):
+			if (columns is not None):
+				columnList = {'nodes': nodesColumnList, 'arcs': arcsColumnList, 'assignments': assignmentsColumnList}[dataType.lower()]
+				unknownColumns = [col for col in columns if col not in columnList]
+				if (len(unknownColumns) > 0):
+					print("Error: %s are not columns of %s dataframes.  %s was not successfully imported." % (unknownColumns, dataType.lower(), filename))
+					return
+
+			if (isBinaryDataFile(filename)):
+				data = readBinaryDataframe(filename, columns)
+			else:
+				data = pd.read_csv(filename, index_col=0)
+				if (columns is not None):
+					data = data[columns]
+
+			if (columns is not None):
+				# Only the requested columns were read; they were checked above
+				pass
+			elif (dataType.lower() == 'nodes'):
 				[valFlag, errorMsg, warningMsg] = valNodes(data)
 				if (valFlag and warningMsg == ""):
 					# print("Message: %s was successfully imported as Nodes dataframe" % filename)
@@ -899,17 +944,30 @@ def importDataFromCSV(dataType, filename):
 				return
 
 		elif (dataType.lower() == 'matrix'):
-			dataframe = pd.read_csv(filename, index_col=0)
-			dataframe.columns = dataframe.columns.astype(int)
-			data = convertMatricesDataframeToDictionary(dataframe)
+			if (isBinaryDataFile(filename)):
+				dataframe = readBinaryDataframe(filename)
+				if (list(dataframe.columns) != ['fromID', 'toID', 'value']):
+					print("Error: %s was not successfully imported.  Matrix files should have the columns 'fromID', 'toID', and 'value'." % (filename))
+					return
+				data = longDataframe2MatrixDict(dataframe)
+			else:
+				dataframe = pd.read_csv(filename, index_col=0)
+				dataframe.columns = dataframe.columns.astype(int)
+				data = convertMatricesDataframeToDictionary(dataframe)
 		else:
 			print("Error: data type not supported.  Expected 'nodes', 'arcs', 'assignments' or 'matrix' (for time matrix or distance matrix)")
 
-	except (TypeError, ValueError):
+	except (TypeError, ValueError, KeyError):
 		print("Error: Cannot import file: %s, check if `dataType` is correct for inputs." % (filename))
+		return
 
 	except IOError:
 		print("Error: Cannot import file: %s" % (filename))
+		return
+
+	except ImportError:
+		print("Error: Parquet and Feather files require the `pyarrow` package.")
+		return
 
 	return data
 
@@ -922,7 +980,7 @@ def exportDataframe(dataframe, filename):
 	dataframe: pandas.dataframe, Required
 		The dataframe to be exported.  This can be a :ref:`Nodes`, :ref:`Arcs`, or :ref:`Assignments` dataframe.
 	filename: string, Required
-		The path and the name of file to be exported.
+		The path and the name of file to be exported.  If the name ends with '.parquet', '.pq', or '.feather', the dataframe is written as a Parquet or Feather file instead of a .csv file (this requires the `pyarrow` package).
 
 	Example
 	-------
@@ -962,18 +1020,33 @@ def exportDataframe(dataframe, filename):
 			if not os.path.exists(path):
 				os.makedirs(path, exist_ok=True)
 
-	try:
-		dataframe.to_csv(path_or_buf=filename, encoding='utf-8')
-		if (VRV_SETTING_SHOWOUTPUTMESSAGE):
-			print("Message: Data written to %s." % (filename))
-	except:
-		print("Error: Cannot export dataframe, please check the inputs.")
+	if (isBinaryDataFile(filename)):
+		try:
+			writeBinaryDataframe(dataframe, filename)
+		except ImportError:
+			print("Error: Parquet and Feather files require the `pyarrow` package.")
+			return
+		except pyarrow.ArrowException as e:
+			print("Error: Cannot write %s as a Parquet or Feather file: %s" % (filename, e))
+			return
+		except:
+			print("Error: Cannot export dataframe, please check the inputs.")
+			return
+	else:
+		try:
+			dataframe.to_csv(path_or_buf=filename, encoding='utf-8')
+		except:
+			print("Error: Cannot export dataframe, please check the inputs.")
+			return
+
+	if (VRV_SETTING_SHOWOUTPUTMESSAGE):
+		print("Message: Data written to %s." % (filename))
 
 	return
 
-def importDataframe(filename, intCols=False, useIndex=True):
+def importDataframe(filename, intCols=False, useIndex=True, columns=None):
 	"""
-	Imports a VeRoViz nodes, arcs, or assignments dataframe from a .csv file.  This function returns a pandas dataframe.
+	Imports a VeRoViz nodes, arcs, or assignments dataframe from a .csv file, or from a Parquet ('.parquet', '.pq') or Feather ('.feather') file.  This function returns a pandas dataframe.
 
 	Parameters
 	----------
@@ -982,7 +1055,9 @@ def importDataframe(filename, intCols=False, useIndex=True):
 	intCols: boolean, Optional, default as False
 		If the dataframe column names are integers (rather than text), set `intCols` to be True.  See notes below for more information.
 	useIndex: boolean, Optional, default as True
-		Setting this value to True means that the first column in the .csv will be used as the row indices.
+		Setting this value to True means that the first column in the .csv will be used as the row indices.  Parquet files keep their own row indices; Feather files do not store row indices.
+	columns: list, Optional, default as None
+		If provided, only these columns are imported.
 
 	Note
 	----
@@ -1031,17 +1106,226 @@ def importDataframe(filename, intCols=False, useIndex=True):
 		return
 
 	try:
-		if (useIndex):
-			df = pd.read_csv(filename, index_col=0)
+		if (isBinaryDataFile(filename)):
+			df = readBinaryDataframe(filename, columns)
 		else:
-			df = pd.read_csv(filename, index_col=False)
+			if (useIndex):
+				df = pd.read_csv(filename, index_col=0)
+			else:
+				df = pd.read_csv(filename, index_col=False)
+			if (columns is not None):
+				df = df[columns]
 		if (intCols):
 			df.columns = df.columns.astype(int)
+	except ImportError:
+		print("Error: Parquet and Feather files require the `pyarrow` package.")
+		return
 	except:
 		print("Error: Cannot import %s, please check the inputs." % (filename))
 
 	return df
 
+def createMatrixStore(path, ids, matrixNames=['time', 'dist']):
+	"""
+	Creates an empty on-disk store for very large time/distance matrices.  A matrix store is a directory holding the location ids (`ids.npy`) and one N x N NumPy array per matrix (e.g., `time.npy` and `dist.npy`).  The arrays are written and read as memory-mapped files, so a matrix never has to fit in memory as a dictionary or a dataframe.  All values start as NaN (not yet calculated).
+
+	Parameters
+	----------
+	path: string, Required
+		The directory of the matrix store.  It will be created if it does not exist.
+	ids: list, Required
+		The ids of the locations (e.g., the `id` column of a :ref:`Nodes` dataframe).  These are the row and column labels of each matrix.  There should be no duplicated ids.
+	matrixNames: list, Optional, default as ['time', 'dist']
+		The names of the matrices in the store.
+
+	Return
+	------
+	string
+		The path of the matrix store.
+
+	Example
+	-------
+		>>> import veroviz as vrv
+		>>> vrv.createMatrixStore('matrices', ids=[1, 2, 3])
+		>>> vrv.writeMatrixStoreChunk('matrices', 'dist', {(1, 2): 1000.0, (2, 1): 1100.0})
+		>>> vrv.readMatrixStore('matrices', 'dist', fromIDs=[1])
+		array([[  nan, 1000.,   nan]])
+	"""
+
+	# Replace backslash
+	path = replaceBackslashToSlash(path)
+
+	ids = np.asarray(ids)
+	if (ids.ndim != 1 or len(ids) == 0):
+		print("Error: `ids` should be a non-empty list.")
+		return
+	if (len(np.unique(ids)) != len(ids)):
+		print("Error: `ids` should not contain duplicated values.")
+		return
+	if (type(matrixNames) is not list or len(matrixNames) == 0):
+		print("Error: `matrixNames` should be a non-empty list.")
+		return
+
+	os.makedirs(path, exist_ok=True)
+	np.save(os.path.join(path, 'ids.npy'), ids, allow_pickle=False)
+
+	numIDs = len(ids)
+	for matrixName in matrixNames:
+		matrix = np.lib.format.open_memmap(matrixStoreFile(path, matrixName), mode='w+', dtype=np.float64, shape=(numIDs, numIDs))
+		for i in range(0, numIDs, VRV_DEFAULT_MATRIXSTORE_CHUNKROWS):
+			matrix[i:i + VRV_DEFAULT_MATRIXSTORE_CHUNKROWS] = np.nan
+		matrix.flush()
+		del matrix
+
+	if (VRV_SETTING_SHOWOUTPUTMESSAGE):
+		print("Message: Matrix store created at %s." % (path))
+
+	return path
+
+def writeMatrixStoreChunk(path, matrixName, data):
+	"""
+	Writes part of a time/distance matrix into a matrix store (see :meth:`~veroviz.utilities.createMatrixStore`).  Only the affected entries are written, so results from a data provider can be stored chunk by chunk as they arrive.
+
+	Parameters
+	----------
+	path: string, Required
+		The directory of the matrix store.
+	matrixName: string, Required
+		The name of the matrix to be written (e.g., 'time' or 'dist').
+	data: dictionary, Required
+		A time or distance dictionary, with keys in the format of `(fromID, toID)`, such as one returned by :meth:`~veroviz.getTimeDist2D.getTimeDist2D`.  All ids should be in the matrix store.
+
+	Example
+	-------
+		>>> import veroviz as vrv
+		>>> vrv.createMatrixStore('matrices', ids=[1, 2, 3])
+		>>> vrv.writeMatrixStoreChunk('matrices', 'time', {(1, 2): 60.0, (1, 3): 75.0})
+	"""
+
+	# Replace backslash
+	path = replaceBackslashToSlash(path)
+
+	if (type(data) is not dict):
+		print("Error: `data` should be a dictionary.")
+		return
+	if (not os.path.isfile(matrixStoreFile(path, matrixName))):
+		print("Error: %s is not a matrix in the matrix store at %s." % (matrixName, path))
+		return
+	if (len(data) == 0):
+		return
+
+	index = matrixStoreIndex(path)
+	keys = list(data.keys())
+	rows = matrixStorePositions(index, [key[0] for key in keys])
+	cols = matrixStorePositions(index, [key[1] for key in keys])
+	if (rows is None or cols is None):
+		print("Error: `data` contains ids that are not in the matrix store at %s." % (path))
+		return
+
+	matrix = np.load(matrixStoreFile(path, matrixName), mmap_mode='r+')
+	matrix[rows, cols] = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+	matrix.flush()
+	del matrix
+
+	return
+
+def readMatrixStore(path, matrixName, fromIDs=None, toIDs=None, asDictionary=False):
+	"""
+	Reads a time/distance matrix from a matrix store (see :meth:`~veroviz.utilities.createMatrixStore`).  Without `fromIDs` and `toIDs`, the whole matrix is returned as a read-only memory-mapped array, which does not load any values until they are used.  With `fromIDs` and/or `toIDs`, only the selected rows/columns are loaded.
+
+	Parameters
+	----------
+	path: string, Required
+		The directory of the matrix store.
+	matrixName: string, Required
+		The name of the matrix to be read (e.g., 'time' or 'dist').
+	fromIDs: list, Optional, default as None
+		The ids of the rows to be read.  If None, all rows are read.
+	toIDs: list, Optional, default as None
+		The ids of the columns to be read.  If None, all columns are read.
+	asDictionary: boolean, Optional, default as False
+		If True, the selected values are returned as a dictionary with keys in the format of `(fromID, toID)`, like :meth:`~veroviz.getTimeDist2D.getTimeDist2D`.  Entries that have not been calculated (NaN) are left out.
+
+	Return
+	------
+	numpy.ndarray or dictionary
+		The rows of the array follow `fromIDs` and the columns follow `toIDs` (or the ids of the store, see :meth:`~veroviz.utilities.getMatrixStoreIDs`).
+
+	Example
+	-------
+		>>> import veroviz as vrv
+		>>> timeSec = vrv.readMatrixStore('matrices', 'time', fromIDs=[1], toIDs=[2, 3])
+		>>> timeDict = vrv.readMatrixStore('matrices', 'time', fromIDs=[1], asDictionary=True)
+	"""
+
+	# Replace backslash
+	path = replaceBackslashToSlash(path)
+
+	if (not os.path.isfile(matrixStoreFile(path, matrixName))):
+		print("Error: %s is not a matrix in the matrix store at %s." % (matrixName, path))
+		return
+
+	index = matrixStoreIndex(path)
+	matrix = np.load(matrixStoreFile(path, matrixName), mmap_mode='r')
+
+	rows = None
+	cols = None
+	if (fromIDs is not None):
+		rows = matrixStorePositions(index, fromIDs)
+		if (rows is None):
+			print("Error: `fromIDs` contains ids that are not in the matrix store at %s." % (path))
+			return
+	if (toIDs is not None):
+		cols = matrixStorePositions(index, toIDs)
+		if (cols is None):
+			print("Error: `toIDs` contains ids that are not in the matrix store at %s." % (path))
+			return
+
+	if (rows is None and cols is None):
+		values = matrix
+	elif (cols is None):
+		values = matrix[rows]
+	else:
+		# Read a block of rows at a time, so that selecting columns never loads the full matrix
+		if (rows is None):
+			rows = np.arange(len(index))
+		values = np.empty((len(rows), len(cols)), dtype=matrix.dtype)
+		for i in range(0, len(rows), VRV_DEFAULT_MATRIXSTORE_CHUNKROWS):
+			values[i:i + VRV_DEFAULT_MATRIXSTORE_CHUNKROWS] = matrix[rows[i:i + VRV_DEFAULT_MATRIXSTORE_CHUNKROWS]][:, cols]
+
+	if (not asDictionary):
+		return values
+
+	rowIDs = index.values if (fromIDs is None) else np.asarray(fromIDs)
+	colIDs = index.values if (toIDs is None) else np.asarray(toIDs)
+	(i, j) = np.nonzero(~np.isnan(values))
+
+	return dict(zip(zip(rowIDs[i].tolist(), colIDs[j].tolist()), np.asarray(values[i, j]).tolist()))
+
+def getMatrixStoreIDs(path):
+	"""
+	Returns the location ids of a matrix store (see :meth:`~veroviz.utilities.createMatrixStore`), in the order of the rows and columns of its matrices.
+
+	Parameters
+	----------
+	path: string, Required
+		The directory of the matrix store.
+
+	Return
+	------
+	list
+		The ids of the matrix store.
+	"""
+
+	# Replace backslash
+	path = replaceBackslashToSlash(path)
+
+	if (not os.path.isfile(os.path.join(path, 'ids.npy'))):
+		print("Error: %s is not a matrix store." % (path))
+		return
+
+	return matrixStoreIndex(path).tolist()
+
 def getConvexHull(locs):
 	"""
 	Find the convex hull of a set of points.
@@ -2176,6 +2460,142 @@ def reverseGeocode(location=None, dataProvider=None, dataProviderArgs=None):
 
 	return (loc, address)
 
+def geocodeBatch(locations=None, dataProvider=None, dataProviderArgs=None, cacheFile=None, maxWorkers=VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS, requestsPerSec=None):
+	"""
+	Convert a list of street addresses, cities, states, or zip codes to GPS coordinates.  This is the batch version of `geocode()`, for geocoding many locations (e.g., a file of customer addresses).
+
+	Parameters
+	----------
+	locations: list of strings, Required
+		Text strings indicating street addresses, states, or zip codes.
+	dataProvider: string, Conditional, default as None
+		Specifies the data source to be used for geocoding. See :ref:`Data Providers` for options and requirements.
+	dataProviderArgs: dictionary, Conditional, default as None
+		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	cacheFile: string, Optional, default as None
+		The name of a file in which geocoded locations are kept between calls.  Locations already in the file are not sent to the data provider again, and new results are added to the file as they arrive.  The same file may be shared by `geocodeBatch()` and `reverseGeocodeBatch()`, and by different data providers.
+	maxWorkers: int, Optional, default as `VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS`
+		The number of requests sent to the data provider at the same time.
+	requestsPerSec: float, Optional, default as None
+		The most requests started per second.  If None, the limit depends on the data provider (`VRV_DEFAULT_MAPQUEST_GEOCODE_REQUESTSPERSEC`, `VRV_DEFAULT_ORS_GEOCODE_REQUESTSPERSEC`, or `VRV_DEFAULT_NOMINATIM_REQUESTSPERSEC` if `dataProvider` is None).
+
+	Return
+	------
+	pandas.dataframe
+		One row for each input location, in the same order, with columns `location` (the input text string), `lat`, and `lon`.  `lat` and `lon` are NaN if the location could not be geocoded.
+
+	Note
+	----
+	Repeated locations (ignoring case and extra spaces) are geocoded only once.  MapQuest geocodes up to `VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE` locations per request with its batch geocoding service; the other data providers geocode one location per request.
+
+	Examples
+	--------
+	Import veroviz and check if the version is up-to-date:
+		>>> import veroviz as vrv
+		>>> vrv.checkVersion()
+
+	Geocode a list of addresses with MapQuest, keeping the results in a cache file:
+		>>> import os
+		>>> MQ_API_KEY = os.environ['MAPQUESTKEY']
+		>>> myLocs = vrv.geocodeBatch(locations        = ['seattle, wa', 'space needle', 'Seattle, WA'],
+		...                           dataProvider     = 'mapquest',
+		...                           dataProviderArgs = {'APIkey': MQ_API_KEY},
+		...                           cacheFile        = 'geocodeCache.jsonl')
+		>>> myLocs
+		       location        lat         lon
+		0   seattle, wa  47.603229 -122.330280
+		1  space needle  47.620506 -122.349277
+		2   Seattle, WA  47.603229 -122.330280
+	"""
+
+	# validation
+	[valFlag, errorMsg, warningMsg] = valGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, maxWorkers, requestsPerSec)
+	if (not valFlag):
+		print (errorMsg)
+		return
+	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
+		print (warningMsg)
+
+	locations = list(locations)
+	locs = privGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, int(maxWorkers), requestsPerSec)
+
+	numFailed = sum(1 for loc in locs if loc is None)
+	if (numFailed > 0):
+		print("Message: %d of %d locations could not be geocoded." % (numFailed, len(locs)))
+
+	return pd.DataFrame({
+		'location': locations,
+		'lat': [loc[0] if (loc is not None) else np.nan for loc in locs],
+		'lon': [loc[1] if (loc is not None) else np.nan for loc in locs]
+		}, columns=['location', 'lat', 'lon'])
+
+
+def reverseGeocodeBatch(locations=None, dataProvider=None, dataProviderArgs=None, cacheFile=None, maxWorkers=VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS, requestsPerSec=None):
+	"""
+	Convert a list of GPS coordinates (of the form [lat, lon] or [lat, lon, alt]) to addresses.  This is the batch version of `reverseGeocode()`.  If altitude is provided it will be ignored.
+
+	Parameters
+	----------
+	locations: list of lists, Required
+		GPS coordinates of the form [[lat, lon], [lat, lon], ...] or [[lat, lon, alt], ...].
+	dataProvider: string, Conditional, default as None
+		Specifies the data source to be used for reverse geocoding. See :ref:`Data Providers` for options and requirements.
+	dataProviderArgs: dictionary, Conditional, default as None
+		For some data providers, additional parameters are required (e.g., API keys or database names). See :ref:`Data Providers` for the additional arguments required for each supported data provider.
+	cacheFile: string, Optional, default as None
+		The name of a file in which addresses are kept between calls.  Locations already in the file are not sent to the data provider again, and new results are added to the file as they arrive.  The same file may be shared by `geocodeBatch()` and `reverseGeocodeBatch()`, and by different data providers.
+	maxWorkers: int, Optional, default as `VRV_DEFAULT_GEOCODEBATCH_MAXWORKERS`
+		The number of requests sent to the data provider at the same time.
+	requestsPerSec: float, Optional, default as None
+		The most requests started per second.  If None, the limit depends on the data provider (`VRV_DEFAULT_MAPQUEST_GEOCODE_REQUESTSPERSEC`, `VRV_DEFAULT_ORS_GEOCODE_REQUESTSPERSEC`, or `VRV_DEFAULT_NOMINATIM_REQUESTSPERSEC` if `dataProvider` is None).
+
+	Return
+	------
+	pandas.dataframe
+		One row for each input location, in the same order, with columns `location` (the input GPS coordinate), `lat` and `lon` (the location of the returned address, which might not match the input coordinates), and `address` (a dataProvider-specific dictionary containing address details, as returned by `reverseGeocode()`).  `lat` and `lon` are NaN, and `address` is None, if the location could not be reverse geocoded.
+
+	Note
+	----
+	Locations that are the same to 6 decimal places are reverse geocoded only once.  MapQuest reverse geocodes up to `VRV_DEFAULT_MAPQUEST_GEOCODEBATCHSIZE` locations per request with its batch geocoding service, whose address details do not include the nearest intersection or road metadata; the other data providers reverse geocode one location per request.
+
+	Examples
+	--------
+	Import veroviz and check if the version is up-to-date:
+		>>> import veroviz as vrv
+		>>> vrv.checkVersion()
+
+	Reverse geocode two locations with ORS:
+		>>> import os
+		>>> ORS_API_KEY = os.environ['ORSKEY']
+		>>> myAddresses = vrv.reverseGeocodeBatch(locations        = [[47.603229, -122.33028], [47.620506, -122.349277]],
+		...                                       dataProvider     = 'ORS-online',
+		...                                       dataProviderArgs = {'APIkey': ORS_API_KEY})
+		>>> myAddresses['address'][0]['label']
+		'4th Ave & James St, Seattle, WA, USA'
+	"""
+
+	# validation
+	[valFlag, errorMsg, warningMsg] = valReverseGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, maxWorkers, requestsPerSec)
+	if (not valFlag):
+		print (errorMsg)
+		return
+	elif (VRV_SETTING_SHOWWARNINGMESSAGE and warningMsg != ""):
+		print (warningMsg)
+
+	locations = [list(loc) for loc in locations]
+	locsAddresses = privReverseGeocodeBatch(locations, dataProvider, dataProviderArgs, cacheFile, int(maxWorkers), requestsPerSec)
+
+	numFailed = sum(1 for locAddress in locsAddresses if locAddress is None)
+	if (numFailed > 0):
+		print("Message: %d of %d locations could not be reverse geocoded." % (numFailed, len(locsAddresses)))
+
+	return pd.DataFrame({
+		'location': locations,
+		'lat': [locAddress[0][0] if (locAddress is not None) else np.nan for locAddress in locsAddresses],
+		'lon': [locAddress[0][1] if (locAddress is not None) else np.nan for locAddress in locsAddresses],
+		'address': [locAddress[1] if (locAddress is not None) else None for locAddress in locsAddresses]
+		}, columns=['location', 'lat', 'lon', 'address'])
+
 def closestNodeLoc2Path(loc, path):
     """
     Gives the closest node on a path given a given GPS location
@@ -2218,7 +2638,7 @@ def closestNodeLoc2Path(loc, path):
     return minLoc
 
 def closestPointLoc2Path(loc, line):
-     """
+    """
     Given a line of a path find the closest point on a path given a given GPS location
 
     Parameters
@@ -2293,7 +2713,7 @@ def closestPointLoc2Path(loc, line):
     return minLoc
 
 def minDistLoc2Path(loc, path):
-  """
+    """
     Given a path, it find the closest point on a path given a given GPS location
 
     Parameters